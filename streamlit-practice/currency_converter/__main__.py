@@ -0,0 +1,17 @@
+"""
+Command-line entry point: python -m currency_converter.
+Runs the streaming batch converter in cli.py; Streamlit is never imported.
+"""
+
+import sys
+import os
+
+# Add this directory to path for imports
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
+
+from cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,336 @@
+"""
+Headless JSON API for machine clients of the currency converter.
+Serves conversions and rate lookups over keep-alive HTTP, sharing the in-process rate cache.
+"""
+
+import argparse
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+import sys
+import os
+
+# Add parent directory to path for imports
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
+
+from config.settings import (
+    API_SERVER_HOST,
+    API_SERVER_PORT,
+    API_MAX_BATCH_AMOUNTS,
+    API_MAX_BODY_BYTES,
+    LOG_LEVEL,
+    METRICS_ENABLED,
+    METRICS_EXPORT_PATH,
+)
+from services.exchange_rate_service import ExchangeRateService
+from services.metrics import (
+    API_REQUEST_SECONDS,
+    API_REQUESTS,
+    CONTENT_TYPE,
+    ERRORS,
+    REGISTRY,
+    MetricsFileExporter,
+    set_source,
+)
+from services.rate_matrix import RateMatrix
+from utils.validators import validate_amount
+
+logger = logging.getLogger(__name__)
+
+# (status code, JSON body, or pre-rendered text such as /metrics)
+Response = Tuple[int, Union[Dict, str]]
+
+
+class APIError(Exception):
+    """Request error reported to the client with an HTTP status."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _rate_matrix() -> RateMatrix:
+    """Get the shared rate matrix or fail with 503."""
+    rate_matrix = ExchangeRateService.get_rate_matrix()
+    if rate_matrix is None:
+        raise APIError(503, "Exchange rates are unavailable")
+    return rate_matrix
+
+
+def _currency(rate_matrix: RateMatrix, value: Optional[str], field: str) -> str:
+    """Normalise a currency code parameter and check it is known."""
+    code = (value or "").strip().upper()
+    if not code:
+        raise APIError(400, f"'{field}' is required")
+    if code not in rate_matrix:
+        raise APIError(404, f"Currency '{code}' is not supported")
+    return code
+
+
+def _amount(value) -> float:
+    """Validate an amount given as a string or number."""
+    is_valid, amount, error_message = validate_amount(str(value))
+    if not is_valid:
+        raise APIError(400, f"Invalid amount {value!r}: {error_message}")
+    return amount
+
+
+def _freshness(rate_matrix: RateMatrix) -> Dict:
+    return {"timestamp": rate_matrix.timestamp, "stale": rate_matrix.stale}
+
+
+def handle_health(params: Dict, body: Optional[Dict]) -> Response:
+    """GET /health"""
+    return 200, {"status": "ok"}
+
+
+def handle_metrics(params: Dict, body: Optional[Dict]) -> Response:
+    """GET /metrics (Prometheus text format)"""
+    if not REGISTRY.enabled:
+        raise APIError(404, "Metrics are disabled (METRICS_ENABLED=false)")
+    return 200, REGISTRY.render()
+
+
+def handle_currencies(params: Dict, body: Optional[Dict]) -> Response:
+    """GET /currencies[?q=rupee&limit=10] (type-ahead lookup by code or name)"""
+    rate_matrix = _rate_matrix()
+    catalog = ExchangeRateService.get_currency_catalog()
+    query = params.get("q", "")
+    if query:
+        limit = params.get("limit", "10")
+        if not limit.isdigit() or not int(limit):
+            raise APIError(400, f"Invalid limit {limit!r}: must be a positive integer")
+        codes = catalog.search(query, int(limit))
+    else:
+        codes = catalog.codes
+    return 200, {
+        "currencies": [{"code": code, "name": catalog.names[code]} for code in codes],
+        **_freshness(rate_matrix),
+    }
+
+
+def handle_rates(params: Dict, body: Optional[Dict]) -> Response:
+    """GET /rates?base=USD[&symbols=PKR,EUR]"""
+    rate_matrix = _rate_matrix()
+    base = _currency(rate_matrix, params.get("base", "USD"), "base")
+    rates = rate_matrix.rates_from(base)
+
+    symbols = params.get("symbols")
+    if symbols:
+        wanted = [code.strip().upper() for code in symbols.split(",") if code.strip()]
+        rates = {code: rates[code] for code in wanted if code in rates}
+
+    return 200, {"base": base, "rates": rates, **_freshness(rate_matrix)}
+
+
+def handle_convert(params: Dict, body: Optional[Dict]) -> Response:
+    """GET /convert?from=PKR&to=USD&amount=100"""
+    rate_matrix = _rate_matrix()
+    from_currency = _currency(rate_matrix, params.get("from"), "from")
+    to_currency = _currency(rate_matrix, params.get("to"), "to")
+    amount = _amount(params.get("amount", ""))
+
+    result = ExchangeRateService.convert_currency(amount, from_currency, to_currency, rate_matrix)
+    if result is None:
+        raise APIError(422, f"Cannot convert {from_currency} to {to_currency}")
+
+    return 200, {
+        "from": from_currency,
+        "to": to_currency,
+        "amount": amount,
+        "rate": rate_matrix.rate(from_currency, to_currency),
+        "result": result,
+        **_freshness(rate_matrix),
+    }
+
+
+def handle_convert_batch(params: Dict, body: Optional[Dict]) -> Response:
+    """POST /convert/batch with {"from": "PKR", "to": ["USD", "EUR"], "amounts": [100, 250]}"""
+    if not isinstance(body, dict):
+        raise APIError(400, "Request body must be a JSON object")
+
+    rate_matrix = _rate_matrix()
+    from_currency = _currency(rate_matrix, body.get("from"), "from")
+
+    targets = body.get("to")
+    if isinstance(targets, str):
+        targets = [targets]
+    if not isinstance(targets, list) or not targets:
+        raise APIError(400, "'to' must be a currency code or a non-empty list of codes")
+    targets = [_currency(rate_matrix, target, "to") for target in targets]
+
+    amounts = body.get("amounts")
+    if not isinstance(amounts, list) or not amounts:
+        raise APIError(400, "'amounts' must be a non-empty list")
+    if len(amounts) > API_MAX_BATCH_AMOUNTS:
+        raise APIError(413, f"At most {API_MAX_BATCH_AMOUNTS} amounts per request")
+    amounts = [_amount(amount) for amount in amounts]
+
+    grid = ExchangeRateService.convert_batch(amounts, from_currency, targets, rate_matrix)
+    if grid is None:
+        raise APIError(422, f"Cannot convert {from_currency}")
+
+    return 200, {
+        "from": from_currency,
+        "to": list(grid.columns),
+        "amounts": amounts,
+        "results": grid.to_numpy().tolist(),
+        **_freshness(rate_matrix),
+    }
+
+
+ROUTES: Dict[Tuple[str, str], Callable[[Dict, Optional[Dict]], Response]] = {
+    ("GET", "/health"): handle_health,
+    ("GET", "/metrics"): handle_metrics,
+    ("GET", "/currencies"): handle_currencies,
+    ("GET", "/rates"): handle_rates,
+    ("GET", "/convert"): handle_convert,
+    ("POST", "/convert/batch"): handle_convert_batch,
+}
+
+
+class APIRequestHandler(BaseHTTPRequestHandler):
+    """Dispatches JSON requests to ROUTES over persistent HTTP/1.1 connections."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate small writes; without TCP_NODELAY,
+    # Nagle plus delayed ACKs stall every keep-alive response by ~40 ms
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str) -> None:
+        start = time.perf_counter()
+        url = urlsplit(self.path)
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        path = url.path.rstrip("/") or "/"
+        handler = ROUTES.get((method, path))
+        # Unknown paths share one label so scanners cannot create unbounded series
+        route = f"{method} {path}" if handler else "unmatched"
+        set_source("api")
+
+        try:
+            body = self._read_body()
+            if handler is None:
+                raise APIError(404, f"No route for {method} {url.path}")
+            status, payload = handler(params, body)
+        except APIError as e:
+            status, payload = e.status, {"error": str(e)}
+        except Exception as e:
+            logger.exception("Unhandled error serving %s %s", method, self.path)
+            ERRORS.inc("api", type(e).__name__)
+            status, payload = 500, {"error": "Internal server error"}
+
+        self._send(status, payload)
+        API_REQUESTS.inc(route, str(status))
+        API_REQUEST_SECONDS.observe(time.perf_counter() - start, route)
+
+    def _read_body(self) -> Optional[Dict]:
+        """Read and decode a JSON request body, if any."""
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            # rfile.read(-1) would block until the client closes, and the body cannot be skipped
+            self.close_connection = True
+            raise APIError(400, "Content-Length must be a non-negative integer")
+        if not length:
+            return None
+        if length > API_MAX_BODY_BYTES:
+            # The unread body would corrupt the next request on this connection
+            self.close_connection = True
+            raise APIError(413, f"Request body exceeds {API_MAX_BODY_BYTES} bytes")
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            raise APIError(400, "Request body is not valid JSON")
+
+    def _send(self, status: int, payload: Union[Dict, str]) -> None:
+        if isinstance(payload, str):
+            data, content_type = payload.encode("utf-8"), CONTENT_TYPE
+        else:
+            data, content_type = json.dumps(payload).encode("utf-8"), "application/json"
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+class ConversionAPIServer:
+    """Threaded HTTP server for the JSON API; one thread per client connection."""
+
+    def __init__(self, host: str = API_SERVER_HOST, port: int = API_SERVER_PORT):
+        """
+        Create an API server (call start() or serve_forever() to serve).
+
+        Args:
+            host (str): Interface to bind
+            port (int): Port to bind, 0 picks a free port
+        """
+        self._server = ThreadingHTTPServer((host, port), APIRequestHandler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "ConversionAPIServer":
+        """Serve requests in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="conversion-api", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests in the current thread until stopped."""
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "ConversionAPIServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the headless currency conversion JSON API.")
+    parser.add_argument("--host", default=API_SERVER_HOST)
+    parser.add_argument("--port", type=int, default=API_SERVER_PORT)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=LOG_LEVEL, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    # Prefetch rates so the first request does not wait on the network
+    ExchangeRateService.get_rate_matrix()
+    server = ConversionAPIServer(args.host, args.port)
+    exporter = MetricsFileExporter(METRICS_EXPORT_PATH).start() if METRICS_ENABLED and METRICS_EXPORT_PATH else None
+    logger.info("Conversion API listening on %s", server.url)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+        if exporter:
+            exporter.stop()
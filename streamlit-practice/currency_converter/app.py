@@ -4,6 +4,8 @@ Follows Streamlit best practices with multi-page configuration.
 """
 
 import streamlit as st
+import importlib
+import logging
 import sys
 import os
 
@@ -21,14 +23,84 @@ st.set_page_config(
 )
 
 # Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
 
-from config.settings import APP_TITLE, APP_ICON
-from pages import converter, bulk_converter, history, about
+from config.settings import (
+    APP_TITLE,
+    APP_ICON,
+    CACHE_WARMUP_ENABLED,
+    API_SERVER_EMBEDDED,
+    LOG_LEVEL,
+    METRICS_ENABLED,
+    METRICS_EXPORT_PATH,
+    ADMIN_PAGE_ENABLED,
+    PROFILING_DIR,
+)
+from services.profiler import annotate_rerun, profile_rerun, span, traced
 
+logging.basicConfig(level=LOG_LEVEL, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
 
-def main():
-    """Main application entry point."""
+# Page label -> (module, render function). Page modules are imported when their
+# page is first shown, so a cold start only loads what the visible page needs.
+PAGES = {
+    "Converter": ("pages.converter", "render_converter_page"),
+    "Bulk Converter": ("pages.bulk_converter", "render_bulk_converter_page"),
+    "History": ("pages.history", "render_history_page"),
+    "Trends": ("pages.trends", "render_trends_page"),
+    "About": ("pages.about", "render_about_page"),
+}
+if ADMIN_PAGE_ENABLED:
+    PAGES["Admin"] = ("pages.admin", "render_admin_page")
+
+
+def render_page(page: str) -> None:
+    """
+    Import a page module on first use and render it.
+
+    Args:
+        page (str): Key of PAGES
+    """
+    module_name, render_name = PAGES[page]
+    with span("import", module=module_name):
+        render = getattr(importlib.import_module(module_name), render_name)
+    with span(render_name):
+        render()
+
+
+@st.cache_resource
+def start_cache_warmup():
+    """Start the background rate cache warm-up once per server process."""
+    from services.cache_warmer import start_background_warmup
+    return start_background_warmup()
+
+
+@st.cache_resource
+def start_api_server():
+    """Serve the JSON API from this process, sharing the UI's rate cache."""
+    from api_server import ConversionAPIServer
+    return ConversionAPIServer().start()
+
+
+@st.cache_resource
+def start_metrics_exporter():
+    """Write metrics to METRICS_EXPORT_PATH periodically, once per server process."""
+    from services.metrics import MetricsFileExporter
+    return MetricsFileExporter(METRICS_EXPORT_PATH).start()
+
+
+@traced("navigation")
+def render_sidebar(profiling: bool = False) -> str:
+    """
+    Render the sidebar navigation.
+
+    Args:
+        profiling (bool): Whether this rerun is being profiled
+
+    Returns:
+        str: Selected page, a key of PAGES
+    """
     
     # Sidebar navigation
     st.sidebar.title(f"{APP_ICON} {APP_TITLE}")
@@ -39,7 +111,7 @@ def main():
     # Remove it for maximum compatibility; emoji can be included inside labels if needed.
     page = st.sidebar.radio(
         "Select Page",
-        options=["Converter", "Bulk Converter", "History", "About"],
+        options=list(PAGES),
         help="Choose a page to navigate"
     )
     
@@ -56,19 +128,39 @@ def main():
         - Real-time exchange rates
         - Multiple currency support
         - Conversion history tracking
+        - Historical rate trends
         - Bulk conversion
         """
     )
     
+    if profiling:
+        st.sidebar.caption(f"⏱️ Profiling this session; traces are written to {PROFILING_DIR}")
+    
+    return page
+
+
+def render_app(profiling: bool = False):
+    """
+    Render the sidebar, the selected page and the footer.
+
+    Args:
+        profiling (bool): Whether this rerun is being profiled
+    """
+    
+    if CACHE_WARMUP_ENABLED:
+        start_cache_warmup()
+    
+    if API_SERVER_EMBEDDED:
+        start_api_server()
+    
+    if METRICS_ENABLED and METRICS_EXPORT_PATH:
+        start_metrics_exporter()
+    
+    page = render_sidebar(profiling)
+    annotate_rerun(page=page)
+    
     # Page routing
-    if page == "Converter":
-        converter.render_converter_page()
-    elif page == "Bulk Converter":
-        bulk_converter.render_bulk_converter_page()
-    elif page == "History":
-        history.render_history_page()
-    elif page == "About":
-        about.render_about_page()
+    render_page(page)
     
     # Footer
     st.markdown("---")
@@ -81,5 +173,11 @@ def main():
         st.caption("2025")
 
 
+def main():
+    """Main application entry point; profiles the rerun when profiling is on for this session."""
+    with profile_rerun("app") as rerun:
+        render_app(profiling=rerun is not None)
+
+
 if __name__ == "__main__":
     main()
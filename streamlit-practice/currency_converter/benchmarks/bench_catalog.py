@@ -0,0 +1,31 @@
+"""
+Benchmarks for the currency catalog built from the fetched rates.
+"""
+
+from harness import benchmark
+from services.currency_catalog import CurrencyCatalog
+from services.exchange_rate_service import ExchangeRateService
+
+
+@benchmark("catalog.build")
+def bench_catalog_build():
+    codes = ExchangeRateService.get_currency_catalog().codes
+    return lambda: CurrencyCatalog(codes)
+
+
+@benchmark("catalog.get_currency_catalog.cached")
+def bench_get_currency_catalog():
+    return ExchangeRateService.get_currency_catalog
+
+
+@benchmark("catalog.search.name_prefix")
+def bench_search_name_prefix():
+    catalog = ExchangeRateService.get_currency_catalog()
+    return lambda: catalog.search("rup")
+
+
+@benchmark("catalog.search.substring")
+def bench_search_substring():
+    # No word starts with "ollar", so every label is scanned
+    catalog = ExchangeRateService.get_currency_catalog()
+    return lambda: catalog.search("ollar")
@@ -0,0 +1,96 @@
+"""
+Benchmarks for the conversion hot paths.
+"""
+
+import numpy as np
+
+from harness import benchmark
+from config.settings import ANCHOR_CURRENCY, SUPPORTED_CURRENCIES
+from services.exchange_rate_service import ExchangeRateService
+from services.fixed_point import multiply_scaled
+from services.rate_table import RateTable
+
+
+def _rate_matrix():
+    rate_matrix = ExchangeRateService.get_rate_matrix()
+    assert rate_matrix is not None, "Offline rate fixture could not be loaded"
+    return rate_matrix
+
+
+@benchmark("conversion.convert_currency.matrix")
+def bench_convert_currency_matrix():
+    rate_matrix = _rate_matrix()
+    return lambda: ExchangeRateService.convert_currency(1234.56, "PKR", "USD", rate_matrix)
+
+
+@benchmark("conversion.convert_currency.fixed")
+def bench_convert_currency_fixed():
+    rate_matrix = _rate_matrix()
+    return lambda: ExchangeRateService.convert_currency(1234.56, "PKR", "USD", rate_matrix, engine="fixed")
+
+
+@benchmark("conversion.convert_currency.table")
+def bench_convert_currency_table():
+    table = ExchangeRateService.get_rate_table(ANCHOR_CURRENCY)
+    return lambda: ExchangeRateService.convert_currency(1234.56, "PKR", "EUR", table)
+
+
+@benchmark("conversion.rate_table.from_payload")
+def bench_rate_table_from_payload():
+    payload = ExchangeRateService.get_exchange_rates(ANCHOR_CURRENCY)
+    return lambda: RateTable.from_payload(payload, SUPPORTED_CURRENCIES)
+
+
+@benchmark("conversion.get_rate_matrix.cached")
+def bench_get_rate_matrix():
+    _rate_matrix()
+    return ExchangeRateService.get_rate_matrix
+
+
+@benchmark("conversion.bulk.all_currencies.loop")
+def bench_bulk_loop():
+    rate_matrix = _rate_matrix()
+    targets = list(SUPPORTED_CURRENCIES)
+
+    def run():
+        return [ExchangeRateService.convert_currency(1000.0, "PKR", target, rate_matrix) for target in targets]
+    return run
+
+
+@benchmark("conversion.bulk.all_currencies.batch")
+def bench_bulk_batch():
+    rate_matrix = _rate_matrix()
+    targets = list(SUPPORTED_CURRENCIES)
+    return lambda: ExchangeRateService.convert_batch([1000.0], "PKR", targets, rate_matrix)
+
+
+@benchmark("conversion.bulk.10k_amounts.batch", repeat=3)
+def bench_bulk_batch_many():
+    rate_matrix = _rate_matrix()
+    targets = list(SUPPORTED_CURRENCIES)
+    amounts = np.random.default_rng(0).uniform(1, 1e6, 10_000)
+    return lambda: ExchangeRateService.convert_batch(amounts, "PKR", targets, rate_matrix)
+
+
+@benchmark("conversion.bulk.10k_amounts.batch.fixed", repeat=3)
+def bench_bulk_batch_many_fixed():
+    rate_matrix = _rate_matrix()
+    targets = list(SUPPORTED_CURRENCIES)
+    amounts = np.random.default_rng(0).uniform(1, 1e6, 10_000)
+    return lambda: ExchangeRateService.convert_batch(amounts, "PKR", targets, rate_matrix, engine="fixed")
+
+
+@benchmark("conversion.fixed_point.multiply.1m", repeat=3)
+def bench_fixed_point_multiply():
+    rng = np.random.default_rng(0)
+    amounts = rng.integers(1, 10**11, 1_000_000)
+    rates = rng.integers(1, 10**12, 1_000_000)
+    return lambda: multiply_scaled(amounts, rates)
+
+
+@benchmark("conversion.float.multiply_round.1m", repeat=3)
+def bench_float_multiply():
+    rng = np.random.default_rng(0)
+    amounts = rng.uniform(1, 1e9, 1_000_000)
+    rates = rng.uniform(0.001, 1000, 1_000_000)
+    return lambda: np.round(amounts * rates, 2)
@@ -0,0 +1,43 @@
+"""
+Benchmarks for display formatting helpers.
+"""
+
+import numpy as np
+import pandas as pd
+
+from harness import benchmark
+from utils.formatters import format_currencies, format_currency, format_exchange_rate, format_numbers
+
+
+@benchmark("formatters.format_currency")
+def bench_format_currency():
+    return lambda: format_currency(1234567.891, "PKR")
+
+
+@benchmark("formatters.format_exchange_rate")
+def bench_format_exchange_rate():
+    return lambda: format_exchange_rate(0.0035912, "PKR", "USD")
+
+
+def _amounts(size: int, seed: int = 0) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    return pd.Series(rng.uniform(1, 10_000_000, size))
+
+
+@benchmark("formatters.series_map.100000", number=1, repeat=5)
+def bench_series_map():
+    # Per-value formatting, for comparison with format_numbers
+    amounts = _amounts(100_000)
+    return lambda: amounts.map("{:,.2f}".format)
+
+
+@benchmark("formatters.format_numbers.100000", number=1, repeat=5)
+def bench_format_numbers():
+    amounts = _amounts(100_000)
+    return lambda: format_numbers(amounts, grouping="western")
+
+
+@benchmark("formatters.format_numbers.lakh.100000", number=1, repeat=5)
+def bench_format_numbers_lakh():
+    amounts = _amounts(100_000)
+    return lambda: format_currencies(amounts, "PKR", grouping="lakh", symbol=True)
@@ -0,0 +1,93 @@
+"""
+Benchmarks for building the history page table, querying durable history and exporting it.
+"""
+
+import os
+import random
+import tempfile
+from datetime import datetime, timedelta
+
+from harness import benchmark
+from config.settings import SUPPORTED_CURRENCIES
+from pages.history import build_history_dataframe
+from services.history_db import HistoryDatabase, HistoryFilter
+from services.history_export import HistoryExportService
+from services.history_store import HistoryStore
+
+
+def make_history(size: int, seed: int = 0) -> HistoryStore:
+    """Generate a history store filled with synthetic conversion records."""
+    rng = random.Random(seed)
+    codes = list(SUPPORTED_CURRENCIES)
+    start = datetime(2025, 1, 1)
+    history = HistoryStore(size)
+    for i in range(size):
+        amount = rng.uniform(1, 100_000)
+        rate = rng.uniform(0.001, 300)
+        history.add(rng.choice(codes), rng.choice(codes), amount, amount * rate, rate, start + timedelta(seconds=i))
+    return history
+
+
+def _register(size: int, quick: bool, repeat: int):
+    @benchmark(f"history.dataframe.{size}", number=1, repeat=repeat, quick=quick)
+    def bench_history_dataframe():
+        history = make_history(size)
+        return lambda: build_history_dataframe(history)
+
+
+_register(1_000, quick=True, repeat=5)
+_register(100_000, quick=True, repeat=3)
+_register(1_000_000, quick=False, repeat=1)
+
+
+@benchmark("history.add", quick=True)
+def bench_history_add():
+    history = make_history(1_000)
+    return lambda: history.add("PKR", "USD", 1000.0, 3.59, 0.00359)
+
+
+def make_history_database(size: int, seed: int = 0) -> HistoryDatabase:
+    """Generate a temporary history database filled with synthetic conversion records of ten owners."""
+    path = os.path.join(tempfile.mkdtemp(prefix="bench-history-"), "history.db")
+    database = HistoryDatabase(path, batch_size=size)
+    rng = random.Random(seed)
+    codes = list(SUPPORTED_CURRENCIES)
+    start = datetime(2024, 1, 1)
+    for i in range(size):
+        amount = rng.uniform(1, 100_000)
+        rate = rng.uniform(0.001, 300)
+        database.append(
+            rng.choice(codes), rng.choice(codes), amount, amount * rate, rate, start + timedelta(minutes=i),
+            owner=f"owner-{i % 10}",
+        )
+    database.flush()
+    return database
+
+
+@benchmark("history_db.page.100000", repeat=3)
+def bench_history_db_page():
+    database = make_history_database(100_000)
+    history_filter = HistoryFilter("PKR", "USD", owner="owner-0")
+    first_page = database.query_page(history_filter, 50)
+    cursor = (first_page["ts"].iloc[-1], int(first_page["id"].iloc[-1]))
+    return lambda: database.query_page(history_filter, 50, before=cursor)
+
+
+@benchmark("history_db.summarize.100000", repeat=3)
+def bench_history_db_summarize():
+    database = make_history_database(100_000)
+    history_filter = HistoryFilter(
+        start_date=datetime(2024, 2, 1).date(), end_date=datetime(2024, 2, 29).date(), owner="owner-0"
+    )
+    return lambda: database.summarize(history_filter)
+
+
+def _register_export(export_format: str, slug: str):
+    @benchmark(f"history.export.{slug}.100000", number=1, repeat=3, quick=False)
+    def bench_history_export():
+        history = make_history(100_000)
+        return lambda: HistoryExportService.export(history.iter_chunks(50_000), export_format).close()
+
+
+_register_export("Gzip CSV", "csv_gz")
+_register_export("Parquet", "parquet")
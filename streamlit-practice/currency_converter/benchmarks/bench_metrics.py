@@ -0,0 +1,39 @@
+"""
+Benchmarks for the metrics hooks.
+Compares an instrumented conversion with the undecorated function to show the per-call overhead.
+"""
+
+from harness import benchmark
+from services.exchange_rate_service import ExchangeRateService
+from services.metrics import ERRORS, FETCH_SECONDS, MetricsRegistry
+
+
+@benchmark("metrics.counter.inc")
+def bench_counter_inc():
+    return lambda: ERRORS.inc("benchmark", "ValueError")
+
+
+@benchmark("metrics.histogram.observe")
+def bench_histogram_observe():
+    return lambda: FETCH_SECONDS.observe(0.0042, "BENCH")
+
+
+@benchmark("metrics.render")
+def bench_render():
+    # A fixed registry, so the result does not depend on what earlier benchmarks recorded
+    registry = MetricsRegistry(enabled=True)
+    errors = registry.counter("bench_errors_total", "Errors", ("source", "type"))
+    latency = registry.histogram("bench_seconds", "Latency", ("page",))
+    for page in ("converter", "bulk_converter", "history", "trends"):
+        errors.inc(page, "ValueError")
+        for value in (0.0002, 0.003, 0.04, 0.5):
+            latency.observe(value, page)
+    return registry.render
+
+
+@benchmark("metrics.convert_currency.uninstrumented")
+def bench_convert_currency_uninstrumented():
+    # convert_currency is the undecorated function itself when metrics are disabled
+    rate_matrix = ExchangeRateService.get_rate_matrix()
+    convert = getattr(ExchangeRateService.convert_currency, "__wrapped__", ExchangeRateService.convert_currency)
+    return lambda: convert(1234.56, "PKR", "USD", rate_matrix)
@@ -0,0 +1,79 @@
+"""
+Macro-benchmarks: full Streamlit reruns via AppTest against the offline rate fixture.
+"""
+
+import os
+
+from streamlit.testing.v1 import AppTest
+
+from harness import APP_DIR, benchmark
+from bench_history import make_history
+
+APP_PATH = os.path.join(APP_DIR, "app.py")
+
+
+def _app(page: str = "Converter") -> AppTest:
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    at.run()
+    if page != "Converter":
+        at.sidebar.radio[0].set_value(page).run()
+    assert not at.exception, at.exception
+    return at
+
+
+@benchmark("page.converter.rerun", number=1, repeat=10)
+def bench_converter_rerun():
+    at = _app()
+    return at.run
+
+
+@benchmark("page.converter.amount_change", number=1, repeat=10)
+def bench_converter_amount_change():
+    at = _app()
+    amounts = iter(range(1, 10_000))
+    return lambda: at.number_input(key="amount_input").set_value(float(next(amounts))).run()
+
+
+def _panel_script(module_name: str, panel_name: str) -> None:
+    # Runs only the fragment: what Streamlit reruns when a widget inside it changes
+    import importlib
+    getattr(importlib.import_module(module_name), panel_name)()
+
+
+def _panel(module_name: str, panel_name: str) -> AppTest:
+    at = AppTest.from_function(_panel_script, args=(module_name, panel_name), default_timeout=60)
+    at.run()
+    assert not at.exception, at.exception
+    return at
+
+
+@benchmark("page.converter.fragment.amount_change", number=1, repeat=10)
+def bench_converter_fragment_amount_change():
+    at = _panel("pages.converter", "render_conversion_panel")
+    amounts = iter(range(1, 10_000))
+    return lambda: at.number_input(key="amount_input").set_value(float(next(amounts))).run()
+
+
+@benchmark("page.converter.fragment.auto_refresh", number=1, repeat=10)
+def bench_converter_fragment_auto_refresh():
+    at = _panel("pages.converter", "render_conversion_panel")
+    return at.run
+
+
+@benchmark("page.bulk_converter.convert", number=1, repeat=10)
+def bench_bulk_convert():
+    at = _app("Bulk Converter")
+    return lambda: at.button[0].click().run()
+
+
+@benchmark("page.history.rerun.1000", number=1, repeat=5)
+def bench_history_rerun():
+    at = _app("History")
+    at.session_state["conversion_history"] = make_history(1_000)
+    return at.run
+
+
+@benchmark("page.bulk_converter.fragment.convert", number=1, repeat=10)
+def bench_bulk_fragment_convert():
+    at = _panel("pages.bulk_converter", "render_bulk_conversion_panel")
+    return lambda: at.button[0].click().run()
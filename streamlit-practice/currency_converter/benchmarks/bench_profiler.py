@@ -0,0 +1,30 @@
+"""
+Benchmarks for the rerun profiler's spans.
+Spans stay in the code permanently, so their cost outside a profiled rerun matters most.
+"""
+
+from harness import benchmark
+from services.profiler import RerunTrace, _active, span
+
+
+def _span():
+    with span("benchmark", size=1):
+        pass
+
+
+@benchmark("profiler.span.inactive")
+def bench_span_inactive():
+    return _span
+
+
+@benchmark("profiler.span.active")
+def bench_span_active():
+    # Only the span is measured: the trace is never entered, so nothing is sampled or written
+    trace = RerunTrace("benchmark")
+
+    def run():
+        token = _active.set(trace)
+        _span()
+        _active.reset(token)
+        trace.spans.clear()
+    return run
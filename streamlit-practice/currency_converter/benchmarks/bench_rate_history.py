@@ -0,0 +1,59 @@
+"""
+Benchmarks for historical rate range queries.
+"""
+
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from harness import benchmark
+from config.settings import SUPPORTED_CURRENCIES
+from services.rate_history import RateHistoryStore
+
+_store_directory = None
+
+
+def make_rate_history(years: int = 3, seed: int = 0) -> str:
+    """Write hourly synthetic USD snapshots to a temporary store, once per run."""
+    global _store_directory
+
+    if _store_directory is None:
+        _store_directory = tempfile.mkdtemp(prefix="bench-rate-history-")
+        index = pd.date_range(end="2025-12-31", periods=years * 365 * 24, freq="h", name="timestamp")
+        codes = [code for code in SUPPORTED_CURRENCIES if code != "USD"]
+        rng = np.random.default_rng(seed)
+        walk = np.exp(np.cumsum(rng.normal(0, 0.001, (len(index), len(codes))), axis=0))
+        RateHistoryStore(_store_directory).append_frame(
+            "USD", pd.DataFrame(rng.uniform(0.5, 300, len(codes)) * walk, index=index, columns=codes)
+        )
+    return _store_directory
+
+
+@benchmark("rate_history.pair.3y.daily", repeat=3)
+def bench_pair_daily():
+    store = RateHistoryStore(make_rate_history())
+    store.pair_series("USD", "EUR", "PKR", freq="D")
+    return lambda: store.pair_series("USD", "EUR", "PKR", freq="D")
+
+
+@benchmark("rate_history.pair.90d.raw", repeat=3)
+def bench_pair_range():
+    store = RateHistoryStore(make_rate_history())
+    store.pair_series("USD", "EUR", "PKR")
+    return lambda: store.pair_series("USD", "EUR", "PKR", "2025-10-01", "2025-12-31")
+
+
+@benchmark("rate_history.pair.3y.daily.cold", number=1, repeat=3, quick=False)
+def bench_pair_daily_cold():
+    directory = make_rate_history()
+    return lambda: RateHistoryStore(directory).pair_series("USD", "EUR", "PKR", freq="D")
+
+
+@benchmark("rate_history.append", number=50, repeat=3)
+def bench_append():
+    store = RateHistoryStore(tempfile.mkdtemp(prefix="bench-rate-append-"))
+    rates = {code: 1.0 for code in SUPPORTED_CURRENCIES}
+    start = pd.Timestamp("2025-01-01")
+    counter = iter(range(10**9))
+    return lambda: store.append("USD", {"rates": rates, "timestamp": (start + pd.Timedelta(hours=next(counter))).isoformat()})
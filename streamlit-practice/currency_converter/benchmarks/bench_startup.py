@@ -0,0 +1,79 @@
+"""
+Startup benchmarks: cold import of each page in a fresh interpreter.
+Each call spawns a new Python process, so timings include interpreter start-up and Streamlit's own import.
+"""
+
+import os
+import subprocess
+import sys
+from typing import Iterable, Set
+
+from harness import APP_DIR, benchmark
+
+# Imports and first conversion of the Converter page; user-018 keeps these off its cold start
+CONVERTER_FIRST_RENDER = (
+    "import streamlit; import pages.converter; "
+    "from services.history_recorder import add_to_history; "
+    "add_to_history('USD', 'PKR', 1.0, 278.0, 278.0)"
+)
+CONVERTER_EXCLUDED_MODULES = ("pandas", "pyarrow")
+
+
+def loaded_modules(statement: str) -> Set[str]:
+    """
+    Run a statement in a fresh interpreter and list the modules it loaded.
+
+    Args:
+        statement (str): Python code, run from the app directory
+
+    Returns:
+        Set[str]: Names in sys.modules afterwards
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", f"{statement}; import sys; print('\\n'.join(sys.modules))"],
+        cwd=APP_DIR,
+        env=os.environ.copy(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+def check_not_loaded(statement: str, excluded: Iterable[str]) -> None:
+    """
+    Fail if a statement loads any of the excluded top-level packages.
+
+    Raises:
+        RuntimeError: Naming the packages that were loaded
+    """
+    loaded = sorted({name.split(".")[0] for name in loaded_modules(statement)}.intersection(excluded))
+    if loaded:
+        raise RuntimeError(f"Cold start loads {', '.join(loaded)}: {statement}")
+
+
+def _cold_import(statement: str):
+    command = [sys.executable, "-c", statement]
+    env = os.environ.copy()
+    return lambda: subprocess.run(command, cwd=APP_DIR, env=env, check=True)
+
+
+@benchmark("startup.cold_import.streamlit", number=1, repeat=5, quick=False)
+def bench_import_streamlit():
+    return _cold_import("import streamlit")
+
+
+@benchmark("startup.cold_import.converter_page", number=1, repeat=5)
+def bench_import_converter_page():
+    check_not_loaded(CONVERTER_FIRST_RENDER, CONVERTER_EXCLUDED_MODULES)
+    return _cold_import("import streamlit; import pages.converter")
+
+
+@benchmark("startup.cold_import.bulk_converter_page", number=1, repeat=5, quick=False)
+def bench_import_bulk_converter_page():
+    return _cold_import("import streamlit; import pages.bulk_converter")
+
+
+@benchmark("startup.cold_import.cli", number=1, repeat=5, quick=False)
+def bench_import_cli():
+    return _cold_import("import cli")
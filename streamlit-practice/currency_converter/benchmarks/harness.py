@@ -0,0 +1,104 @@
+"""
+Minimal benchmark harness.
+Registers benchmark functions and times them with timeit.
+"""
+
+import os
+import statistics
+import sys
+import timeit
+from typing import Callable, Dict, List, Optional
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# Run the app fully offline against recorded rates
+os.environ.setdefault("RATE_PROVIDER", "replay")
+os.environ.setdefault("RATE_CAPTURE_DIR", os.path.join(FIXTURES_DIR, "captures"))
+os.environ.setdefault("SNAPSHOT_STORE_ENABLED", "false")
+os.environ.setdefault("CACHE_WARMUP_ENABLED", "false")
+os.environ.setdefault("HISTORY_DB_ENABLED", "false")
+os.environ.setdefault("RATE_HISTORY_ENABLED", "false")
+
+# Add app directory to path for imports
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+
+class Benchmark:
+    """A registered benchmark: a setup function returning the callable to time."""
+
+    def __init__(self, name: str, setup: Callable[[], Callable[[], object]], number: Optional[int], repeat: int, quick: bool):
+        self.name = name
+        self.setup = setup
+        self.number = number
+        self.repeat = repeat
+        self.quick = quick
+
+    def run(self) -> Dict[str, float]:
+        """
+        Time the benchmark.
+
+        Returns:
+            Dict[str, float]: Median/min seconds per call, calls per second and loop counts
+        """
+        func = self.setup()
+        timer = timeit.Timer(func)
+        number = self.number or timer.autorange()[0]
+        timings = [t / number for t in timer.repeat(repeat=self.repeat, number=number)]
+        median = statistics.median(timings)
+        return {
+            "median_s": median,
+            "min_s": min(timings),
+            "ops_per_sec": 1.0 / median if median else float("inf"),
+            "number": number,
+            "repeat": self.repeat,
+        }
+
+
+BENCHMARKS: List[Benchmark] = []
+
+
+def benchmark(name: str, number: Optional[int] = None, repeat: int = 5, quick: bool = True):
+    """
+    Register a benchmark.
+
+    The decorated function does any setup and returns a zero-argument callable;
+    only that callable is timed.
+
+    Args:
+        name (str): Unique benchmark name, dotted by area
+        number (Optional[int]): Calls per timing loop, auto-ranged when None
+        repeat (int): Number of timing loops
+        quick (bool): Include in --quick runs
+    """
+    def decorator(setup):
+        BENCHMARKS.append(Benchmark(name, setup, number, repeat, quick))
+        return setup
+    return decorator
+
+
+def _calibration_workload() -> None:
+    """Fixed mix of interpreter and NumPy work, independent of the app code."""
+    import numpy as np
+
+    total = 0
+    for i in range(20_000):
+        total += i * i % 7
+    values = np.arange(50_000, dtype=np.float64)
+    np.sort(np.sqrt(values)[::-1])
+
+
+def calibrate(repeat: int = 7) -> float:
+    """
+    Time the calibration workload, a measure of this machine's speed.
+
+    Benchmarks are compared to a baseline relative to this, so a baseline
+    recorded on a faster or slower host still gives meaningful ratios.
+
+    Returns:
+        float: Median seconds per workload call
+    """
+    timer = timeit.Timer(_calibration_workload)
+    number = timer.autorange()[0]
+    return statistics.median(t / number for t in timer.repeat(repeat=repeat, number=number))
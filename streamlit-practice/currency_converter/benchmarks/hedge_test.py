@@ -0,0 +1,152 @@
+"""
+Failover and hedging test against local stub providers.
+Compares fetch latency from a primary with injected tail latency alone and behind FailoverProvider, then checks the cool-down during a primary outage.
+
+Usage:
+    python benchmarks/hedge_test.py [--requests 300] [--tail-rate 0.02] [--tail-latency 1.0]
+"""
+
+import argparse
+import json
+import os
+import time
+from typing import Dict, List
+
+import harness  # noqa: F401  (offline environment and import path)
+import requests
+
+from services.providers.base import RateProvider
+from services.providers.failover import FailoverProvider
+from services.providers.http_provider import HttpRateProvider
+from services.providers.stub_server import StubRateServer
+
+
+def _provider(server: StubRateServer, name: str) -> HttpRateProvider:
+    provider = HttpRateProvider(server.url, session=requests.Session())
+    provider.name = name
+    return provider
+
+
+def measure(provider: RateProvider, count: int) -> Dict:
+    """
+    Fetch rates sequentially and summarise the latency.
+
+    Args:
+        provider (RateProvider): Provider to fetch from
+        count (int): Number of fetches
+
+    Returns:
+        Dict: Request and error counts plus p50, p95, p99 and max latency in milliseconds
+    """
+    latencies: List[float] = []
+    errors = 0
+    for _ in range(count):
+        start = time.perf_counter()
+        try:
+            provider.fetch("USD")
+        except (requests.exceptions.RequestException, ValueError):
+            errors += 1
+        latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+
+    def percentile(fraction: float) -> float:
+        return latencies[min(int(len(latencies) * fraction), len(latencies) - 1)] * 1000
+
+    return {
+        "requests": count,
+        "errors": errors,
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "max_ms": latencies[-1] * 1000,
+    }
+
+
+def _print_row(label: str, result: Dict) -> None:
+    print(
+        f"{label:<22} p50 {result['p50_ms']:7.1f} ms  p95 {result['p95_ms']:7.1f} ms  "
+        f"p99 {result['p99_ms']:7.1f} ms  max {result['max_ms']:7.1f} ms  errors {result['errors']}"
+    )
+
+
+def run_tail_scenario(args: argparse.Namespace) -> Dict:
+    """Primary with occasional slow responses, secondary slightly slower but steady."""
+    primary = StubRateServer(
+        latency=args.latency, jitter=args.latency / 2, seed=1,
+        tail_rate=args.tail_rate, tail_latency=args.tail_latency,
+    ).start()
+    secondary = StubRateServer(latency=args.latency * 1.5, jitter=args.latency / 2, seed=2).start()
+    try:
+        alone = measure(_provider(primary, "primary"), args.requests)
+        _print_row("primary alone", alone)
+
+        failover = FailoverProvider([_provider(primary, "primary"), _provider(secondary, "secondary")])
+        primary_before, secondary_before = primary.request_count, secondary.request_count
+        hedged = measure(failover, args.requests)
+        hedged["hedge_delay_ms"] = failover.hedge_delay(failover.providers[0]) * 1000
+        hedged["secondary_requests"] = secondary.request_count - secondary_before
+        hedged["primary_requests"] = primary.request_count - primary_before
+        failover.close()
+        _print_row("primary + hedging", hedged)
+        print(
+            f"{'':<22} hedged after {hedged['hedge_delay_ms']:.0f} ms; "
+            f"{hedged['secondary_requests']} of {args.requests} fetches also asked the secondary"
+        )
+    finally:
+        primary.stop()
+        secondary.stop()
+    return {"primary_alone": alone, "failover": hedged}
+
+
+def run_outage_scenario(args: argparse.Namespace) -> Dict:
+    """Primary failing every request: it should be skipped after the failure threshold."""
+    primary = StubRateServer(latency=args.latency, error_rate=1.0, seed=1).start()
+    secondary = StubRateServer(latency=args.latency, seed=2).start()
+    try:
+        failover = FailoverProvider(
+            [_provider(primary, "primary"), _provider(secondary, "secondary")], cooldown=args.cooldown
+        )
+        outage = measure(failover, args.requests)
+        outage["primary_requests"] = primary.request_count
+        health = failover.health()[0]
+        failover.close()
+        _print_row("primary down", outage)
+        print(
+            f"{'':<22} primary asked {primary.request_count} times, then cooling down "
+            f"({health['cooldown_remaining']:.0f}s left)"
+        )
+    finally:
+        primary.stop()
+        secondary.stop()
+    return outage
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure failover and hedged requests against stub providers.")
+    parser.add_argument("--requests", type=int, default=300, help="Fetches per run")
+    parser.add_argument("--latency", type=float, default=0.02, help="Base stub latency in seconds")
+    parser.add_argument("--tail-rate", type=float, default=0.02, help="Probability of a slow primary response")
+    parser.add_argument("--tail-latency", type=float, default=1.0, help="Extra delay of slow primary responses in seconds")
+    parser.add_argument("--cooldown", type=float, default=60.0, help="Cool-down in seconds for the outage scenario")
+    parser.add_argument("--output", default=None, help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = {"tail": run_tail_scenario(args), "outage": run_outage_scenario(args)}
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    tail = results["tail"]
+    failed = (
+        tail["failover"]["errors"]
+        or tail["failover"]["p99_ms"] >= tail["primary_alone"]["p99_ms"]
+        or results["outage"]["errors"]
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,139 @@
+"""
+Cold-start import profile for the app's entry points.
+Runs each module import in a fresh interpreter under `python -X importtime` and reports where the time goes.
+
+Usage:
+    python benchmarks/import_profile.py [--module pages.converter] [--top 15] [--output results/imports.json]
+
+Streamlit itself is imported first and reported separately, so each module's
+figure is the extra time its page adds to time-to-first-render.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+from harness import APP_DIR
+
+DEFAULT_MODULES = (
+    "pages.converter",
+    "pages.bulk_converter",
+    "pages.history",
+    "pages.trends",
+    "pages.about",
+    "cli",
+)
+
+# Dependencies worth flagging when a page pulls them in
+HEAVY_PACKAGES = ("pandas", "pyarrow", "numpy", "requests", "dotenv", "sqlite3")
+
+PRELUDE = "streamlit"
+
+
+def run_importtime(module: str) -> List[Tuple[int, int, str]]:
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Args:
+        module (str): Dotted module name, relative to the app directory
+
+    Returns:
+        List[Tuple[int, int, str]]: (self µs, cumulative µs, indented name) per
+        import, in the order the interpreter reported them
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {PRELUDE}; import {module}"],
+        cwd=APP_DIR,
+        env=os.environ.copy(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(self_us), int(cumulative_us), name[1:]))
+    return rows
+
+
+def profile_module(module: str, top: int) -> Dict:
+    """
+    Profile one module's cold import on top of an already imported Streamlit.
+
+    Args:
+        module (str): Dotted module name
+        top (int): Number of slowest packages to report
+
+    Returns:
+        Dict: Streamlit and module import milliseconds, heavy packages loaded and
+        the slowest packages
+    """
+    rows = run_importtime(module)
+
+    # importtime reports children before their parent; top-level imports are unindented
+    prelude_us = 0
+    module_rows: List[Tuple[int, int, str]] = []
+    seen_prelude = False
+    for self_us, cumulative_us, name in rows:
+        if not seen_prelude:
+            if name == PRELUDE:
+                prelude_us = cumulative_us
+                seen_prelude = True
+            continue
+        module_rows.append((self_us, cumulative_us, name))
+
+    top_level = [cumulative_us for _, cumulative_us, name in module_rows if not name.startswith(" ")]
+
+    # A package's outermost import includes everything it pulled in
+    by_package: Dict[str, int] = {}
+    for _, cumulative_us, name in module_rows:
+        package = name.strip().split(".")[0]
+        by_package[package] = max(by_package.get(package, 0), cumulative_us)
+
+    return {
+        "module": module,
+        "streamlit_ms": prelude_us / 1000,
+        "import_ms": sum(top_level) / 1000,
+        "modules_loaded": len(module_rows),
+        "heavy_packages": [package for package in HEAVY_PACKAGES if package in by_package],
+        "slowest": [
+            {"package": package, "cumulative_ms": cumulative_us / 1000}
+            for package, cumulative_us in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]
+        ],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Profile cold-start imports of the app's pages.")
+    parser.add_argument("--module", action="append", help="Module(s) to profile (default: every page and the CLI)")
+    parser.add_argument("--top", type=int, default=8, help="Slowest packages to list per module")
+    parser.add_argument("--output", default=None, help="Write the report as JSON to this file")
+    args = parser.parse_args()
+
+    reports = []
+    for module in args.module or DEFAULT_MODULES:
+        report = profile_module(module, args.top)
+        reports.append(report)
+        heavy = ", ".join(report["heavy_packages"]) or "none"
+        print(f"{module:<22} {report['import_ms']:8.1f} ms  ({report['modules_loaded']} modules; heavy: {heavy})")
+        for entry in report["slowest"]:
+            print(f"    {entry['cumulative_ms']:8.1f} ms  {entry['package']}")
+
+    if reports:
+        print(f"\nstreamlit itself: {reports[0]['streamlit_ms']:.1f} ms (not included above)")
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "reports": reports}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
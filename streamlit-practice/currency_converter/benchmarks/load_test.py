@@ -0,0 +1,143 @@
+"""
+Load test for the headless JSON API.
+Drives concurrent keep-alive clients against the API and reports requests per second and latency.
+
+Usage:
+    python benchmarks/load_test.py [--concurrency 16] [--duration 10] [--url http://host:port]
+
+Without --url, an API server is started in-process against the offline rate fixtures.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import harness  # noqa: F401  (offline environment and import path)
+from api_server import ConversionAPIServer
+
+SCENARIOS = {
+    "convert": ("GET", "/convert?from=PKR&to=USD&amount=1234.56", None),
+    "rates": ("GET", "/rates?base=PKR", None),
+    "batch": (
+        "POST",
+        "/convert/batch",
+        json.dumps({"from": "PKR", "to": ["USD", "EUR", "GBP", "AED"], "amounts": list(range(1, 101))}),
+    ),
+}
+
+
+def _client(url: str, scenario: str, deadline: float, latencies: List[float], errors: List[int]) -> None:
+    """Send requests over one persistent connection until the deadline."""
+    method, path, body = SCENARIOS[scenario]
+    headers = {"Content-Type": "application/json"} if body else {}
+    parts = urlsplit(url)
+    connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=10)
+
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            ok = response.status == 200
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=10)
+            ok = False
+        latencies.append(time.perf_counter() - start)
+        if not ok:
+            errors.append(1)
+
+    connection.close()
+
+
+def run_load_test(url: str, scenario: str, concurrency: int, duration: float) -> Dict:
+    """
+    Run one load test scenario.
+
+    Args:
+        url (str): API base URL
+        scenario (str): Key of SCENARIOS
+        concurrency (int): Concurrent keep-alive clients
+        duration (float): Seconds to run
+
+    Returns:
+        Dict: Request count, errors, requests per second and latency percentiles
+    """
+    per_client: List[List[float]] = [[] for _ in range(concurrency)]
+    errors: List[int] = []
+    deadline = time.perf_counter() + duration
+    start = time.perf_counter()
+
+    threads = [
+        threading.Thread(target=_client, args=(url, scenario, deadline, per_client[i], errors))
+        for i in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for client in per_client for latency in client)
+    if not latencies:
+        return {"scenario": scenario, "requests": 0, "errors": len(errors)}
+
+    def percentile(fraction: float) -> float:
+        return latencies[min(int(len(latencies) * fraction), len(latencies) - 1)] * 1000
+
+    return {
+        "scenario": scenario,
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": len(errors),
+        "requests_per_s": len(latencies) / elapsed,
+        "p50_ms": percentile(0.50),
+        "p99_ms": percentile(0.99),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load test the headless conversion API.")
+    parser.add_argument("--url", default=None, help="API base URL (default: start one in-process)")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), action="append", help="Scenario(s) to run")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent keep-alive clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per scenario")
+    parser.add_argument("--output", default=None, help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    server: Optional[ConversionAPIServer] = None
+    url = args.url
+    if url is None:
+        server = ConversionAPIServer(port=0).start()
+        url = server.url
+
+    results = []
+    try:
+        for scenario in args.scenario or sorted(SCENARIOS):
+            result = run_load_test(url, scenario, args.concurrency, args.duration)
+            results.append(result)
+            print(
+                f"{scenario:<10} {result['requests']:>8,} req  {result.get('requests_per_s', 0):>10,.1f} req/s  "
+                f"p50 {result.get('p50_ms', 0):6.2f} ms  p99 {result.get('p99_ms', 0):7.2f} ms  "
+                f"errors {result['errors']}"
+            )
+    finally:
+        if server:
+            server.stop()
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"url": url, "results": results}, f, indent=2)
+
+    return 1 if any(result["errors"] for result in results) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
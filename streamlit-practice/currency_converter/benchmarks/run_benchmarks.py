@@ -0,0 +1,162 @@
+"""
+Benchmark runner.
+Runs the registered benchmarks, writes results as JSON and flags regressions against a baseline.
+
+Timings are compared relative to a calibration workload timed in the same run, so
+a baseline from another host still gives meaningful ratios. A baseline recorded on
+this host (results/baseline.json, not committed) is preferred when it exists.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--quick] [--filter NAME] [--update-baseline]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+from datetime import datetime
+from typing import Dict
+
+from harness import BENCHMARKS, calibrate
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(BENCHMARKS_DIR, "results")
+# Committed reference baseline; only refreshed deliberately, never as part of a feature change
+REFERENCE_BASELINE_PATH = os.path.join(BENCHMARKS_DIR, "baseline.json")
+# Per-host baseline written by --update-baseline
+LOCAL_BASELINE_PATH = os.path.join(RESULTS_DIR, "baseline.json")
+BENCHMARK_MODULES = ("bench_conversion", "bench_formatters", "bench_history", "bench_rate_history", "bench_pages", "bench_startup", "bench_metrics", "bench_profiler", "bench_catalog")
+
+
+def load_benchmarks() -> None:
+    """Import every benchmark module so its benchmarks register."""
+    for module_name in BENCHMARK_MODULES:
+        __import__(module_name)
+
+
+def compare(
+    results: Dict[str, Dict],
+    baseline: Dict[str, Dict],
+    threshold: float,
+    host_speed: float = 1.0
+) -> Dict[str, float]:
+    """
+    Find benchmarks slower than the baseline.
+
+    Args:
+        results (Dict[str, Dict]): Current results by benchmark name
+        baseline (Dict[str, Dict]): Baseline results by benchmark name
+        threshold (float): Allowed slowdown ratio, e.g. 0.25 for 25%
+        host_speed (float): Calibration time of this run over the baseline's,
+            e.g. 2.0 when this host is twice as slow
+
+    Returns:
+        Dict[str, float]: Slowdown ratio for each regressed benchmark, relative to the host speed
+    """
+    regressions = {}
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base or not base.get("median_s"):
+            continue
+        ratio = result["median_s"] / base["median_s"] / host_speed
+        if ratio > 1 + threshold:
+            regressions[name] = ratio
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run currency converter benchmarks.")
+    parser.add_argument("--quick", action="store_true", help="Skip the slowest benchmarks")
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--output", default=None, help="Results file (default: results/<timestamp>.json)")
+    parser.add_argument(
+        "--baseline",
+        default=None,
+        help="Baseline file to compare against or update (default: results/baseline.json if it exists, "
+             "else the committed baseline.json; --update-baseline writes results/baseline.json)",
+    )
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown before flagging (0.25 = 25%%)")
+    parser.add_argument("--update-baseline", action="store_true", help="Write these results as the new baseline")
+    args = parser.parse_args()
+
+    load_benchmarks()
+    selected = [
+        b for b in BENCHMARKS
+        if args.filter in b.name and (b.quick or not args.quick)
+    ]
+
+    calibration = calibrate()
+    print(f"{'calibration':<45} {calibration * 1e6:>14,.2f} µs/call")
+
+    results = {}
+    for bench in selected:
+        result = bench.run()
+        results[bench.name] = result
+        print(f"{bench.name:<45} {result['median_s'] * 1e6:>14,.2f} µs/call {result['ops_per_sec']:>14,.1f} ops/s")
+
+    report = {
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "calibration_s": calibration,
+        "results": results,
+    }
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    print(f"\nResults written to {output}")
+
+    if args.update_baseline:
+        baseline_path = args.baseline or LOCAL_BASELINE_PATH
+        baseline = {}
+        if os.path.exists(baseline_path):
+            with open(baseline_path, encoding="utf-8") as f:
+                stored = json.load(f)
+            # Keep other benchmarks only if they were timed at the same host speed
+            if stored.get("calibration_s") and stored.get("platform") == report["platform"]:
+                scale = calibration / stored["calibration_s"]
+                baseline = {
+                    name: dict(result, median_s=result["median_s"] * scale)
+                    for name, result in stored.get("results", {}).items()
+                }
+        baseline.update(results)
+        os.makedirs(os.path.dirname(os.path.abspath(baseline_path)), exist_ok=True)
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(dict(report, results=baseline), f, indent=2, sort_keys=True)
+        print(f"Baseline updated: {baseline_path}")
+        return 0
+
+    baseline_path = args.baseline or (
+        LOCAL_BASELINE_PATH if os.path.exists(LOCAL_BASELINE_PATH) else REFERENCE_BASELINE_PATH
+    )
+    if not os.path.exists(baseline_path):
+        print("No baseline found; run with --update-baseline to create one.")
+        return 0
+
+    with open(baseline_path, encoding="utf-8") as f:
+        stored = json.load(f)
+    baseline = stored.get("results", {})
+
+    host_speed = calibration / stored["calibration_s"] if stored.get("calibration_s") else 1.0
+    if stored.get("platform") != report["platform"] or stored.get("python") != report["python"]:
+        print(
+            f"\nBaseline is from another host ({stored.get('platform')}, Python {stored.get('python')}); "
+            f"timings are compared relative to calibration ({host_speed:.2f}× its time)."
+        )
+
+    regressions = compare(results, baseline, args.threshold, host_speed)
+    if regressions:
+        print(f"\n⚠️ {len(regressions)} regression(s) over {args.threshold:.0%}:")
+        for name, ratio in sorted(regressions.items()):
+            print(f"  {name}: {ratio:.2f}× baseline")
+        return 1
+
+    print(f"\n✅ No regressions over {args.threshold:.0%} against {baseline_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,291 @@
+"""
+Command-line batch converter (python -m currency_converter).
+Streams amounts or CSV records from stdin or files to stdout with constant memory, without Streamlit.
+"""
+
+import argparse
+import csv
+import json
+import logging
+import sys
+import os
+from typing import Iterator, List, Optional, TextIO
+
+# One-shot runs have nothing to scrape; skip instrumentation unless asked for
+os.environ.setdefault("METRICS_ENABLED", "false")
+
+# Add parent directory to path for imports
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
+
+from config.settings import ANCHOR_CURRENCY, CONVERSION_ENGINE, DECIMAL_PLACES, SUPPORTED_CURRENCIES
+from services.exchange_rate_service import ExchangeRateService
+from services.fixed_point import minor_units
+from services.rate_matrix import RateMatrix
+from services.rate_table import RateTable
+from utils.formatters import format_currency
+from utils.validators import validate_signed_amount
+
+logger = logging.getLogger("currency_converter")
+
+EXIT_OK = 0
+EXIT_NO_RATES = 1
+EXIT_USAGE = 2
+EXIT_FAILED_ROWS = 3
+
+
+def load_pinned_rates(path: str) -> Optional[RateMatrix]:
+    """
+    Build a rate matrix from a pinned rate snapshot file.
+
+    Args:
+        path (str): JSON file with "base" and "rates", as written by --save-rates
+            or captured by the record provider
+
+    Returns:
+        Optional[RateMatrix]: Rate matrix or None if the file is unusable
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.error("Cannot read rate snapshot %s: %s", path, e)
+        return None
+
+    if not isinstance(payload, dict):
+        logger.error("Rate snapshot %s has no rates", path)
+        return None
+
+    try:
+        # Any currency the snapshot quotes can be converted, not just the UI's list
+        table = RateTable.from_payload(
+            payload,
+            SUPPORTED_CURRENCIES,
+            timestamp=payload.get("timestamp") or payload.get("date") or os.path.basename(path),
+        )
+    except ValueError as e:
+        logger.error("Rate snapshot %s has no usable rates: %s", path, e)
+        return None
+
+    return RateMatrix(table)
+
+
+def save_rates(path: str) -> bool:
+    """
+    Write the current anchor rates to a file for later --rates runs.
+
+    Args:
+        path (str): Destination JSON file
+
+    Returns:
+        bool: True if the snapshot was written
+    """
+    exchange_data = ExchangeRateService.get_exchange_rates(ANCHOR_CURRENCY)
+    if not exchange_data:
+        return False
+
+    payload = {key: exchange_data[key] for key in ("base", "rates", "timestamp")}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+    return True
+
+
+def iter_lines(paths: List[str]) -> Iterator[str]:
+    """Yield lines from each input path in turn; "-" is stdin."""
+    for path in paths:
+        if path == "-":
+            yield from sys.stdin
+        else:
+            with open(path, newline="", encoding="utf-8") as f:
+                yield from f
+
+
+class Converter:
+    """Converts amounts with one rate matrix and counts rows that fail."""
+
+    def __init__(self, rate_matrix: RateMatrix, engine: str, decimals: Optional[int]):
+        self.rate_matrix = rate_matrix
+        self.engine = engine
+        self.decimals = decimals
+        self.failed_rows = 0
+
+    def convert(self, amount_text: str, from_currency: str, targets: List[str]) -> List[Optional[float]]:
+        """
+        Convert one amount given as text to every target currency.
+
+        Results are None where the amount or a currency is invalid; such rows
+        are counted in failed_rows.
+        """
+        is_valid, amount, _ = validate_signed_amount(amount_text)
+        if not is_valid or from_currency not in self.rate_matrix:
+            self.failed_rows += 1
+            return [None] * len(targets)
+
+        results = [
+            ExchangeRateService.convert_currency(amount, from_currency, target, self.rate_matrix, engine=self.engine)
+            for target in targets
+        ]
+        if None in results:
+            self.failed_rows += 1
+        return results
+
+    def format_value(self, value: Optional[float], currency_code: str) -> str:
+        """Format a converted amount for CSV output."""
+        if value is None:
+            return ""
+        if self.decimals is not None:
+            decimals = self.decimals
+        elif self.engine == "fixed":
+            decimals = minor_units(currency_code)
+        else:
+            decimals = DECIMAL_PLACES
+        return f"{value:.{decimals}f}"
+
+
+def convert_amount_lines(
+    lines: Iterator[str],
+    out: TextIO,
+    converter: Converter,
+    from_currency: str,
+    targets: List[str],
+    output_format: str
+) -> None:
+    """Convert one amount per input line."""
+    writer = csv.writer(out) if output_format == "csv" else None
+    if writer:
+        writer.writerow([from_currency, *targets])
+
+    for line in lines:
+        amount_text = line.strip()
+        if not amount_text:
+            continue
+
+        results = converter.convert(amount_text, from_currency, targets)
+
+        if writer:
+            writer.writerow([amount_text, *(converter.format_value(r, t) for r, t in zip(results, targets))])
+            continue
+
+        is_valid, amount, error_message = validate_signed_amount(amount_text)
+        if not is_valid:
+            out.write(f"{amount_text}: {error_message}\n")
+            continue
+        converted = " | ".join(format_currency(r, t) for r, t in zip(results, targets))
+        out.write(f"{format_currency(amount, from_currency)} = {converted}\n")
+
+
+def convert_csv_records(
+    lines: Iterator[str],
+    out: TextIO,
+    converter: Converter,
+    from_currency: Optional[str],
+    targets: List[str],
+    amount_column: str,
+    currency_column: Optional[str]
+) -> bool:
+    """
+    Convert CSV records, appending one column per target currency.
+
+    Returns:
+        bool: False if the required columns are missing
+    """
+    reader = csv.DictReader(lines)
+    fieldnames = reader.fieldnames or []
+    missing = [column for column in (amount_column, currency_column) if column and column not in fieldnames]
+    if missing:
+        logger.error("Input has no column(s) %s; found %s", ", ".join(missing), ", ".join(fieldnames))
+        return False
+
+    output_columns = [target if target not in fieldnames else f"{target} (converted)" for target in targets]
+    writer = csv.writer(out)
+    writer.writerow([*fieldnames, *output_columns])
+
+    for record in reader:
+        source = (record.get(currency_column) or "").strip().upper() if currency_column else from_currency
+        results = converter.convert(record.get(amount_column) or "", source, targets)
+        writer.writerow([
+            *(record.get(column, "") for column in fieldnames),
+            *(converter.format_value(r, t) for r, t in zip(results, targets)),
+        ])
+    return True
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m currency_converter",
+        description="Convert amounts or CSV records from files or stdin and stream the results to stdout.",
+    )
+    parser.add_argument("files", nargs="*", default=["-"], help="Input files (default: stdin; '-' is stdin)")
+    parser.add_argument("--from", dest="from_currency", help="Source currency of the amounts")
+    parser.add_argument("--to", dest="to_currencies", action="append", default=[],
+                        help="Target currency; repeat or comma-separate for several")
+    parser.add_argument("--csv", action="store_true", help="Input is CSV with a header row")
+    parser.add_argument("--amount-column", default="amount", help="CSV column holding amounts (default: amount)")
+    parser.add_argument("--currency-column", help="CSV column holding each row's source currency")
+    parser.add_argument("--format", choices=("csv", "text"), default="csv",
+                        help="Output for plain amounts: CSV or human-readable text")
+    parser.add_argument("--rates", help="Pinned rate snapshot JSON to use instead of the network")
+    parser.add_argument("--save-rates", help="Write the current rates to this file and exit")
+    parser.add_argument("--engine", choices=("float", "fixed"), default=CONVERSION_ENGINE,
+                        help="Conversion engine (default: CONVERSION_ENGINE)")
+    parser.add_argument("--decimals", type=int, help="Decimal places in output (default: per engine)")
+    parser.add_argument("--strict", action="store_true", help="Exit with status 3 if any row could not be converted")
+    parser.add_argument("--verbose", action="store_true", help="Log rate fetching details to stderr")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(levelname)s %(name)s: %(message)s",
+        stream=sys.stderr,
+    )
+
+    if args.save_rates:
+        return EXIT_OK if save_rates(args.save_rates) else EXIT_NO_RATES
+
+    targets = [code.strip().upper() for value in args.to_currencies for code in value.split(",") if code.strip()]
+    from_currency = args.from_currency.strip().upper() if args.from_currency else None
+    if not targets:
+        parser.error("at least one --to currency is required")
+    if not from_currency and not (args.csv and args.currency_column):
+        parser.error("--from is required unless --csv is used with --currency-column")
+
+    rate_matrix = load_pinned_rates(args.rates) if args.rates else ExchangeRateService.get_rate_matrix()
+    if rate_matrix is None:
+        logger.error("Exchange rates are unavailable")
+        return EXIT_NO_RATES
+
+    unknown = [code for code in [from_currency, *targets] if code and code not in rate_matrix]
+    if unknown:
+        logger.error("Unsupported currency: %s", ", ".join(unknown))
+        return EXIT_USAGE
+
+    converter = Converter(rate_matrix, args.engine, args.decimals)
+    lines = iter_lines(args.files)
+    out = sys.stdout
+
+    try:
+        if args.csv:
+            if not convert_csv_records(lines, out, converter, from_currency, targets,
+                                       args.amount_column, args.currency_column):
+                return EXIT_USAGE
+        else:
+            convert_amount_lines(lines, out, converter, from_currency, targets, args.format)
+        out.flush()
+    except BrokenPipeError:
+        # Downstream closed early (e.g. `| head`); stop quietly
+        sys.stderr.close()
+        return EXIT_OK
+    except OSError as e:
+        logger.error("%s", e)
+        return EXIT_USAGE
+
+    if converter.failed_rows:
+        logger.warning("%d row(s) could not be converted", converter.failed_rows)
+        if args.strict:
+            return EXIT_FAILED_ROWS
+    return EXIT_OK
@@ -4,17 +4,71 @@ Follows best practices for environment management and constants.
 """
 
 import os
-from dotenv import load_dotenv
+import tempfile
 
-# Load environment variables from .env file
-load_dotenv()
+
+def _find_dotenv(filename: str = ".env") -> str:
+    """Find the nearest .env file at or above this directory, as load_dotenv() would."""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        path = os.path.join(directory, filename)
+        if os.path.isfile(path):
+            return path
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return ""
+        directory = parent
+
+
+# Load environment variables from .env file; python-dotenv is only imported when there is one
+_DOTENV_PATH = _find_dotenv()
+if _DOTENV_PATH:
+    from dotenv import load_dotenv
+    load_dotenv(_DOTENV_PATH)
 
 # API Configuration
 API_KEY = os.getenv("EXCHANGERATE_API_KEY", "free")  # Using free tier endpoint
-API_BASE_URL = "https://api.exchangerate-api.com/v4/latest"
+API_BASE_URL = os.getenv("API_BASE_URL", "https://api.exchangerate-api.com/v4/latest")
 API_TIMEOUT = 10
+API_CONNECT_TIMEOUT = float(os.getenv("API_CONNECT_TIMEOUT", "3.05"))
+API_READ_TIMEOUT = float(os.getenv("API_READ_TIMEOUT", str(API_TIMEOUT)))
+
+# Rate Provider Configuration
+# "exchangerate-api" (live), "open-er-api" (live, open.er-api.com), "stub" (local stub server),
+# "record" (live + save responses), "replay" (serve saved responses offline), or an http(s) URL of
+# any ExchangeRate-API compatible endpoint. A comma-separated list fails over in order, e.g.
+# "exchangerate-api,open-er-api"
+RATE_PROVIDER = os.getenv("RATE_PROVIDER", "exchangerate-api")
+OPEN_ER_API_URL = "https://open.er-api.com/v6/latest"
+RATE_CAPTURE_DIR = os.getenv(
+    "RATE_CAPTURE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "captures"),
+)
+REPLAY_LATENCY = os.getenv("REPLAY_LATENCY", "false").lower() == "true"  # Sleep for recorded latency
+STUB_LATENCY = float(os.getenv("STUB_LATENCY", "0.05"))  # Seconds
+STUB_JITTER = float(os.getenv("STUB_JITTER", "0.02"))  # Max extra random seconds
+STUB_ERROR_RATE = float(os.getenv("STUB_ERROR_RATE", "0.0"))  # Probability of HTTP 503
+
+# Failover Configuration (when RATE_PROVIDER lists several providers)
+RATE_HEDGE_PERCENTILE = float(os.getenv("RATE_HEDGE_PERCENTILE", "95"))  # Hedge once a request is slower than this percentile of its provider's recent latency
+RATE_HEDGE_MIN_DELAY = float(os.getenv("RATE_HEDGE_MIN_DELAY", "0.05"))  # Seconds; never hedge sooner
+RATE_HEDGE_MAX_DELAY = float(os.getenv("RATE_HEDGE_MAX_DELAY", "1.0"))  # Seconds; also used until enough latencies are known
+RATE_HEDGE_MIN_SAMPLES = 20  # Latencies recorded before the percentile is trusted
+RATE_HEDGE_WINDOW = 200  # Recent latencies kept per provider
+PROVIDER_FAILURE_THRESHOLD = int(os.getenv("PROVIDER_FAILURE_THRESHOLD", "3"))  # Consecutive failures before a cool-down
+PROVIDER_COOLDOWN = float(os.getenv("PROVIDER_COOLDOWN", "60"))  # Seconds an unhealthy provider is tried only as a last resort
+
+# HTTP Transport Configuration (shared pooled session)
+HTTP_POOL_CONNECTIONS = 4  # Number of distinct hosts to keep pools for
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "16"))  # Keep-alive connections per host
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+HTTP_BACKOFF_FACTOR = 0.3  # Sleeps 0.3s, 0.6s, 1.2s, ... between retries
+HTTP_BACKOFF_JITTER = 0.2  # Random extra delay (seconds) added to each backoff
+HTTP_BACKOFF_MAX = 5.0
 
 # Supported Currencies with Pakistani Rupee focus
+# Every currency the provider quotes can be converted (names in config/currencies.py);
+# these are featured: listed first, the bulk page's defaults and the cache warm-up bases
 PRIMARY_CURRENCY = "PKR"
 SUPPORTED_CURRENCIES = {
     "PKR": "Pakistani Rupee",
@@ -31,6 +85,22 @@ SUPPORTED_CURRENCIES = {
     "BDT": "Bangladeshi Taka",
 }
 
+# Base currency fetched upstream; all other cross rates are derived from it
+ANCHOR_CURRENCY = "USD"
+
+# Conversion Engine Configuration
+# "float" (float64 math rounded to 2 places) or "fixed" (exact int64 minor units, banker's rounding)
+CONVERSION_ENGINE = os.getenv("CONVERSION_ENGINE", "float")
+FIXED_POINT_RATE_DIGITS = 9  # Rates are stored as integers scaled by 10**digits
+DEFAULT_MINOR_UNITS = 2
+# ISO 4217 decimal places for currencies that do not use DEFAULT_MINOR_UNITS
+CURRENCY_MINOR_UNITS = {
+    "BIF": 0, "CLP": 0, "DJF": 0, "GNF": 0, "ISK": 0, "JPY": 0, "KMF": 0, "KRW": 0,
+    "PYG": 0, "RWF": 0, "UGX": 0, "UYI": 0, "VND": 0, "VUV": 0, "XAF": 0, "XOF": 0, "XPF": 0,
+    "BHD": 3, "IQD": 3, "JOD": 3, "KWD": 3, "LYD": 3, "OMR": 3, "TND": 3,
+    "CLF": 4, "UYW": 4,
+}
+
 # UI Configuration
 APP_TITLE = "Pakistani Currency Converter"
 APP_ICON = "💱"
@@ -40,10 +110,91 @@ INITIAL_SIDEBAR_STATE = "expanded"
 
 # Cache Configuration
 CACHE_DURATION = 3600  # 1 hour in seconds
+RATE_REFRESH_MODE = os.getenv("RATE_REFRESH_MODE", "stale-while-revalidate")  # or "blocking"
+RATE_REFRESH_AHEAD = 300  # Start a background refresh this many seconds before expiry
+RATE_RETRY_INTERVAL = 30  # Minimum seconds between refresh attempts while the API is failing
+
+# Result panels rerun on their own (not the whole app) on this interval to show refreshed
+# rates from the cache; 0 disables auto-refresh
+RATE_AUTO_REFRESH_SECONDS = int(os.getenv("RATE_AUTO_REFRESH_SECONDS", "60"))
+
+# Cache Warm-up Configuration (prefetch the ANCHOR_CURRENCY rates when the app starts)
+CACHE_WARMUP_ENABLED = os.getenv("CACHE_WARMUP_ENABLED", "true").lower() == "true"
+CACHE_WARMUP_MAX_WORKERS = 4  # Concurrent upstream fetches when warming several bases
+
+# Snapshot Store Configuration (persists last fetched rates across restarts)
+SNAPSHOT_STORE_ENABLED = os.getenv("SNAPSHOT_STORE_ENABLED", "true").lower() == "true"
+SNAPSHOT_STORE_PATH = os.getenv(
+    "SNAPSHOT_STORE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "rate_snapshots.db"),
+)
+SNAPSHOT_MAX_AGE = 24 * 3600  # Snapshots younger than this warm the cache after a restart
+
+# Rate History Configuration (time series of every fetched snapshot, for trend charts)
+RATE_HISTORY_ENABLED = os.getenv("RATE_HISTORY_ENABLED", "true").lower() == "true"
+RATE_HISTORY_DIR = os.getenv(
+    "RATE_HISTORY_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "rate_history"),
+)
+RATE_HISTORY_COMPRESSION = "zstd"  # Parquet codec for the monthly partitions
+
+# File Conversion Configuration
+FILE_CHUNK_SIZE = 100_000  # Rows per chunk when converting uploaded files
+FILE_MAX_WORKERS = min(4, os.cpu_count() or 1)  # Process pool size for parallel conversion
+FILE_UPLOAD_TYPES = ["csv", "xlsx"]
+FILE_OUTPUT_DIR = os.getenv(
+    "FILE_OUTPUT_DIR",
+    os.path.join(tempfile.gettempdir(), "currency_converter_outputs"),
+)
+FILE_OUTPUT_MAX_AGE = 3600  # Converted files left behind (e.g. by a crash) are deleted after this many seconds
+# Downloads are sent from memory, so conversions stop once the output passes this size
+FILE_OUTPUT_MAX_BYTES = int(os.getenv("FILE_OUTPUT_MAX_MB", "200")) * 1024 * 1024
+
+# History Configuration
+HISTORY_MAX_ENTRIES = int(os.getenv("HISTORY_MAX_ENTRIES", "10000"))  # Oldest records are dropped beyond this
+HISTORY_DB_ENABLED = os.getenv("HISTORY_DB_ENABLED", "true").lower() == "true"  # Durable history, scoped per signed-in user or session
+HISTORY_DB_PATH = os.getenv(
+    "HISTORY_DB_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "history.db"),
+)
+HISTORY_BATCH_SIZE = 50  # Buffered records written per transaction
+HISTORY_FLUSH_INTERVAL = 2.0  # Seconds before a partial batch is written
+# History of visitors who are not signed in is deleted once their session has been idle this long
+HISTORY_SESSION_RETENTION = float(os.getenv("HISTORY_SESSION_RETENTION_HOURS", "24")) * 3600
+HISTORY_PURGE_INTERVAL = 3600  # Seconds between sweeps for expired session history
+HISTORY_PAGE_SIZE = 50  # Records per page on the History page
+HISTORY_EXPORT_CHUNK_SIZE = 50_000  # Records per chunk when exporting history
+
+# Headless JSON API Configuration (python api_server.py, or embedded in the Streamlit server)
+API_SERVER_HOST = os.getenv("API_SERVER_HOST", "127.0.0.1")
+API_SERVER_PORT = int(os.getenv("API_SERVER_PORT", "8502"))
+API_SERVER_EMBEDDED = os.getenv("API_SERVER_EMBEDDED", "false").lower() == "true"  # Also serve from the Streamlit process
+API_MAX_BATCH_AMOUNTS = 10_000  # Amounts accepted per batch request
+API_MAX_BODY_BYTES = 1_000_000
+
+# Metrics Configuration (Prometheus text from the API's /metrics, a text file, or the Admin page)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"  # Off: hooks cost nothing
+METRICS_EXPORT_PATH = os.getenv("METRICS_EXPORT_PATH", "")  # e.g. a node_exporter textfile .prom file
+METRICS_EXPORT_INTERVAL = float(os.getenv("METRICS_EXPORT_INTERVAL", "15"))  # Seconds between file writes
+ADMIN_PAGE_ENABLED = os.getenv("ADMIN_PAGE_ENABLED", "false").lower() == "true"  # Show the Admin metrics page
+
+# Profiling Configuration (per-rerun traces written for offline analysis)
+# "off", "query" (profile sessions opened with ?profile=1) or "always" (profile every rerun)
+PROFILING_MODE = os.getenv("PROFILING_MODE", "off").lower()
+PROFILING_QUERY_PARAM = "profile"
+PROFILING_DIR = os.getenv(
+    "PROFILING_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "profiles"),
+)
+PROFILING_SLOW_RERUN_MS = float(os.getenv("PROFILING_SLOW_RERUN_MS", "250"))  # Slower reruns also keep cProfile stats and stack samples
+PROFILING_SAMPLE_INTERVAL_MS = 5  # Stack sampling interval during a profiled rerun
+PROFILING_MAX_FILES = 500  # Oldest profile files are deleted beyond this
 
 # Display Configuration
 DECIMAL_PLACES = 2
 THOUSAND_SEPARATOR = True
+# "western" groups digits in thousands (1,234,567); "lakh" uses South-Asian lakh/crore grouping (12,34,567)
+DIGIT_GROUPING = os.getenv("DIGIT_GROUPING", "western")
 
 # Logging
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
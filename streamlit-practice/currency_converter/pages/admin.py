@@ -0,0 +1,165 @@
+"""
+Admin page with live service metrics.
+Shows fetch latency, cache effectiveness, errors, conversions and page render times for this process.
+"""
+
+import streamlit as st
+import pandas as pd
+import sys
+import os
+
+# Add parent directory to path for imports
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
+
+from services.exchange_rate_service import ExchangeRateService
+from services.metrics import (
+    CONTENT_TYPE,
+    CONVERSION_SECONDS,
+    ERRORS,
+    FETCH_SECONDS,
+    PAGE_RENDER_SECONDS,
+    PROVIDER_HEDGES,
+    PROVIDER_REQUEST_SECONDS,
+    REGISTRY,
+    Histogram,
+)
+
+
+def histogram_table(histogram: Histogram, labels) -> pd.DataFrame:
+    """
+    Summarise every series of a histogram.
+
+    Args:
+        histogram (Histogram): Histogram to read
+        labels (List[str]): Column names for the histogram's label values
+
+    Returns:
+        pd.DataFrame: Label columns plus count, mean, p50 and p95 in milliseconds
+    """
+    rows = []
+    for label_values, (_, total, count) in sorted(histogram.values().items()):
+        rows.append({
+            **dict(zip(labels, label_values)),
+            "Count": count,
+            "Mean (ms)": total / count * 1000,
+            "p50 (ms)": histogram.quantile(0.5, *label_values) * 1000,
+            "p95 (ms)": histogram.quantile(0.95, *label_values) * 1000,
+        })
+    return pd.DataFrame(rows, columns=[*labels, "Count", "Mean (ms)", "p50 (ms)", "p95 (ms)"])
+
+
+def render_histogram(title: str, histogram: Histogram, labels, empty_message: str) -> None:
+    """Render a histogram summary table, or a note when it has no data."""
+    st.subheader(title)
+    table = histogram_table(histogram, labels)
+    if table.empty:
+        st.caption(empty_message)
+        return
+    st.dataframe(
+        table,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            column: st.column_config.NumberColumn(column, format="%.2f")
+            for column in ("Mean (ms)", "p50 (ms)", "p95 (ms)")
+        },
+    )
+
+
+def render_provider_health() -> None:
+    """Render failover provider health and hedging, when several providers are configured."""
+    health = ExchangeRateService.get_provider_health()
+    if health is None:
+        return
+
+    st.subheader("Rate Providers")
+    hedges = PROVIDER_HEDGES.values()
+    st.dataframe(
+        pd.DataFrame(
+            [
+                {
+                    "Provider": row["name"],
+                    "Status": "✅ Healthy" if row["healthy"] else f"⏸️ Cooling down ({row['cooldown_remaining']:.0f}s)",
+                    "Failures in a Row": row["consecutive_failures"],
+                    "Hedge After (ms)": row["hedge_delay"] * 1000,
+                    "Latency Samples": row["samples"],
+                    "Hedged To": int(hedges.get((row["name"],), 0)),
+                }
+                for row in health
+            ]
+        ),
+        use_container_width=True,
+        hide_index=True,
+        column_config={"Hedge After (ms)": st.column_config.NumberColumn("Hedge After (ms)", format="%.0f")},
+    )
+    render_histogram("Provider Latency", PROVIDER_REQUEST_SECONDS, ["Provider"], "No provider requests yet.")
+
+
+def render_admin_page():
+    """Render the admin metrics page."""
+
+    st.header("🛠️ Admin")
+    st.markdown("Live metrics for this server process")
+    st.markdown("---")
+
+    if not REGISTRY.enabled:
+        st.info("📴 Metrics are disabled. Set METRICS_ENABLED=true to collect them.")
+        return
+
+    st.button("🔄 Refresh")
+
+    # Rate cache effectiveness
+    st.subheader("Rate Cache")
+    stats = ExchangeRateService.get_cache_stats()
+    lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Hit Rate", f"{(stats['hits'] + stats['stale_hits']) / lookups:.1%}" if lookups else "N/A")
+
+    with col2:
+        st.metric("Stale Hits", f"{stats['stale_hits']:,}")
+
+    with col3:
+        st.metric("Misses", f"{stats['misses']:,}")
+
+    with col4:
+        st.metric("Fetch Errors", f"{stats['fetch_errors']:,}")
+
+    render_histogram("Upstream Fetch Latency", FETCH_SECONDS, ["Base"], "No upstream fetches yet.")
+    render_provider_health()
+    render_histogram("Conversions", CONVERSION_SECONDS, ["Source", "Kind"], "No conversions yet.")
+    render_histogram("Page Renders", PAGE_RENDER_SECONDS, ["Page"], "No page renders recorded yet.")
+
+    # Errors by type
+    st.subheader("Errors")
+    errors = ERRORS.values()
+    if errors:
+        st.dataframe(
+            pd.DataFrame(
+                [(source, error_type, int(count)) for (source, error_type), count in sorted(errors.items())],
+                columns=["Source", "Type", "Count"],
+            ),
+            use_container_width=True,
+            hide_index=True,
+        )
+    else:
+        st.caption("✅ No errors recorded.")
+
+    # Raw exposition text, as scraped from the API's /metrics
+    exposition = REGISTRY.render()
+    with st.expander("Prometheus text"):
+        st.code(exposition, language="text")
+    st.download_button(
+        label="⬇️ Download metrics",
+        data=exposition,
+        file_name="currency_converter.prom",
+        mime=CONTENT_TYPE,
+        use_container_width=True,
+    )
+
+
+if __name__ == "__main__":
+    render_admin_page()
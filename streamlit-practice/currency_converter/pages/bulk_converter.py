@@ -3,104 +3,195 @@ Bulk currency converter page.
 Allows conversion from one currency to multiple currencies at once.
 """
 
+import numpy as np
 import streamlit as st
 import pandas as pd
 import sys
 import os
 
 # Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
 
-from config.settings import SUPPORTED_CURRENCIES
+from config.settings import FILE_CHUNK_SIZE, FILE_MAX_WORKERS, FILE_OUTPUT_MAX_BYTES, FILE_UPLOAD_TYPES
+from services.currency_catalog import currency_name
 from services.exchange_rate_service import ExchangeRateService
-from utils.formatters import format_currency
+from services.file_conversion_service import ConvertedFile, FileConversionService
+from services.history_recorder import add_many_to_history
+from services.metrics import instrument_page
+from services.profiler import profiled, span
+from utils.formatters import get_currency_symbol
+from utils.table_columns import number_column
+from utils.validators import validate_amounts
 
 
+TARGETS_KEY = "bulk_target_currencies"
+GROUP_KEY = "bulk_currency_group"
+CLEAR_GROUP = "Clear"
+
+
+def select_currency_group(groups, from_currency):
+    """
+    Replace the target currencies with the group just picked in the pills.
+
+    Args:
+        groups (Dict[str, Tuple[str, ...]]): Currency groups by name
+        from_currency (str): Source currency, left out of the selection
+    """
+    group = st.session_state[GROUP_KEY]
+    if group is None:
+        return
+    codes = groups.get(group, ())
+    st.session_state[TARGETS_KEY] = [code for code in codes if code != from_currency]
+    # Pills act as buttons here: clear the highlight once applied
+    st.session_state[GROUP_KEY] = None
+
+
+@instrument_page("bulk_converter")
 def render_bulk_converter_page():
     """Render the bulk currency converter page."""
     
     st.header("📊 Bulk Converter")
-    st.markdown("Convert one amount to multiple currencies at once")
+    st.markdown("Convert one or more amounts to multiple currencies at once")
     st.markdown("---")
     
+    render_bulk_conversion_panel()
+    
+    st.markdown("---")
+    render_file_converter_section()
+
+
+@st.fragment
+@profiled("bulk_converter.panel")
+@instrument_page("bulk_converter")
+def render_bulk_conversion_panel():
+    """
+    Render the bulk conversion inputs and results grid.
+    
+    Runs as a fragment: editing amounts, toggling currencies or converting
+    reruns only this panel, not the file converter below or the rest of the app.
+    """
+    
     # Input section
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        amount = st.number_input(
-            "Enter amount to convert",
-            min_value=0.0,
-            value=1000.0,
-            step=1.0,
+        amounts_text = st.text_area(
+            "Enter amounts to convert",
+            value="1000",
+            height=80,
+            help="One amount per line, or separate them with semicolons; 1,000 is read as one thousand",
         )
     
+    # Every currency the current rates cover
+    catalog = ExchangeRateService.get_currency_catalog()
+    
     with col2:
         from_currency = st.selectbox(
             "From currency",
-            options=list(SUPPORTED_CURRENCIES.keys()),
-            format_func=lambda x: f"{x} - {SUPPORTED_CURRENCIES[x]}",
+            options=catalog.codes,
+            format_func=catalog.label,
         )
     
-    # Select target currencies
+    # Select target currencies: one multiselect (searchable by code or name) plus group shortcuts
     st.subheader("Select target currencies")
-    currencies_col1, currencies_col2 = st.columns(2)
-    
-    selected_currencies = []
-    
-    with currencies_col1:
-        for i, currency in enumerate(list(SUPPORTED_CURRENCIES.keys())):
-            if i % 2 == 0:
-                if st.checkbox(
-                    f"{currency} - {SUPPORTED_CURRENCIES[currency]}",
-                    value=(currency != from_currency),
-                    key=f"currency_{currency}"
-                ):
-                    selected_currencies.append(currency)
-    
-    with currencies_col2:
-        for i, currency in enumerate(list(SUPPORTED_CURRENCIES.keys())):
-            if i % 2 == 1:
-                if st.checkbox(
-                    f"{currency} - {SUPPORTED_CURRENCIES[currency]}",
-                    value=(currency != from_currency),
-                    key=f"currency_{currency}"
-                ):
-                    selected_currencies.append(currency)
+    groups = catalog.groups()
+    if TARGETS_KEY not in st.session_state:
+        st.session_state[TARGETS_KEY] = [code for code in catalog.featured if code != from_currency]
+    else:
+        # Drop currencies the latest rates no longer cover
+        st.session_state[TARGETS_KEY] = [code for code in st.session_state[TARGETS_KEY] if code in catalog]
+    
+    st.pills(
+        "Quick select",
+        options=[*groups, CLEAR_GROUP],
+        key=GROUP_KEY,
+        on_change=select_currency_group,
+        args=(groups, from_currency),
+    )
+    selected_currencies = st.multiselect(
+        f"Target currencies ({len(catalog)} available)",
+        options=catalog.codes,
+        format_func=catalog.label,
+        key=TARGETS_KEY,
+        placeholder="Type a code or name, e.g. rupee",
+    )
+    
+    # Validate amounts
+    amounts = []
+    if amounts_text.strip():
+        is_valid, amounts, error_message = validate_amounts(amounts_text)
+        if not is_valid:
+            st.error(f"❌ {error_message}")
     
     # Convert and display results
-    if amount > 0 and selected_currencies:
+    if amounts and selected_currencies:
         if st.button("🔄 Convert to Selected Currencies", use_container_width=True):
             with st.spinner("Fetching exchange rates and converting..."):
-                exchange_data = ExchangeRateService.get_exchange_rates(from_currency)
+                rate_matrix = ExchangeRateService.get_rate_matrix()
             
-            if exchange_data:
-                # Prepare data for table
-                conversion_results = []
+            if rate_matrix:
+                # Convert every amount to every selected currency at once
+                results = ExchangeRateService.convert_batch(
+                    amounts,
+                    from_currency,
+                    selected_currencies,
+                    rate_matrix
+                )
                 
-                for target_currency in selected_currencies:
-                    converted_amount = ExchangeRateService.convert_currency(
-                        amount,
-                        from_currency,
-                        target_currency,
-                        exchange_data
-                    )
+                if results is not None:
+                    # Display results grid: numeric columns, formatted per currency by column_config
+                    with span("build_results_table", rows=len(results)):
+                        results_df = results.reset_index()
+                        column_config = {}
+                        for column in results_df.columns:
+                            results_df[column], column_config[column] = number_column(
+                                results_df[column],
+                                f"{column} ({currency_name(column)})",
+                                prefix=f"{get_currency_symbol(column)} ",
+                            )
                     
-                    if converted_amount is not None:
-                        exchange_rate = exchange_data["rates"].get(target_currency)
-                        conversion_results.append({
-                            "Currency": f"{target_currency} ({SUPPORTED_CURRENCIES[target_currency]})",
-                            "Amount": f"{converted_amount:,.2f}",
-                            "Exchange Rate": f"1 {from_currency} = {exchange_rate:.4f}",
-                        })
-                
-                if conversion_results:
-                    # Display results table
                     st.subheader("Conversion Results")
-                    df = pd.DataFrame(conversion_results)
-                    st.dataframe(df, use_container_width=True, hide_index=True)
+                    st.dataframe(
+                        results_df,
+                        use_container_width=True,
+                        hide_index=True,
+                        column_config=column_config,
+                    )
+                    
+                    # Exchange rates used
+                    targets, rates = rate_matrix.cross_rates(from_currency, results.columns)
+                    rates_df = pd.DataFrame({
+                        "Currency": [f"{code} ({currency_name(code)})" for code in targets],
+                        "Exchange Rate": rates,
+                    })
+                    rates_df["Exchange Rate"], rate_config = number_column(
+                        rates_df["Exchange Rate"], f"Rate (1 {from_currency})", decimals=4
+                    )
+                    with st.expander("Exchange rates used", expanded=len(amounts) == 1):
+                        st.dataframe(
+                            rates_df,
+                            use_container_width=True,
+                            hide_index=True,
+                            column_config={"Exchange Rate": rate_config},
+                        )
+                    
+                    # One history record per target currency, totalled over the amounts, so
+                    # a large batch neither floods the history nor evicts earlier records
+                    add_many_to_history(
+                        from_currency,
+                        targets,
+                        np.full(len(targets), sum(amounts)),
+                        results.to_numpy().sum(axis=0),
+                        rates,
+                    )
                     
                     # Summary
-                    st.success(f"✅ Successfully converted {amount} {from_currency} to {len(conversion_results)} currencies")
+                    st.success(
+                        f"✅ Successfully converted {len(amounts)} amount(s) from {from_currency} "
+                        f"to {len(results.columns)} currencies"
+                    )
                 else:
                     st.error("❌ Unable to convert to selected currencies.")
             else:
@@ -109,5 +200,111 @@ def render_bulk_converter_page():
         st.info("👆 Enter an amount and click 'Convert' to see results")
 
 
+def render_file_converter_section():
+    """Render the upload-and-convert section for large transaction files."""
+    
+    st.subheader("📁 Convert a File")
+    st.markdown("Upload a CSV or Excel file with an amount and a currency column")
+    
+    uploaded_file = st.file_uploader(
+        "Transaction file",
+        type=FILE_UPLOAD_TYPES,
+        help=(
+            f"Files are processed in chunks of {FILE_CHUNK_SIZE:,} rows; converted files larger than "
+            f"{FILE_OUTPUT_MAX_BYTES // (1024 * 1024):,} MB cannot be downloaded"
+        ),
+    )
+    
+    if uploaded_file is None:
+        return
+    
+    try:
+        columns = FileConversionService.read_columns(uploaded_file, uploaded_file.name)
+    except ImportError:
+        st.error("❌ Excel support requires the 'openpyxl' package.")
+        return
+    except (ValueError, pd.errors.ParserError) as e:
+        st.error(f"❌ Unable to read file: {str(e)}")
+        return
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        amount_column = st.selectbox("Amount column", options=columns, key="file_amount_column")
+    
+    with col2:
+        currency_column = st.selectbox(
+            "Currency column",
+            options=columns,
+            index=min(1, len(columns) - 1),
+            key="file_currency_column",
+        )
+    
+    with col3:
+        catalog = ExchangeRateService.get_currency_catalog()
+        to_currency = st.selectbox(
+            "Convert to",
+            options=catalog.codes,
+            format_func=catalog.label,
+            key="file_to_currency",
+        )
+    
+    use_workers = st.checkbox(
+        f"Use {FILE_MAX_WORKERS} worker processes",
+        value=False,
+        help="Spread chunks over a process pool for very large files",
+    )
+    
+    if st.button("🔄 Convert File", use_container_width=True):
+        with st.spinner("Fetching exchange rates..."):
+            rate_matrix = ExchangeRateService.get_rate_matrix()
+        
+        if not rate_matrix or to_currency not in rate_matrix:
+            st.error("❌ Failed to fetch exchange rates.")
+            return
+        
+        progress_bar = st.progress(0.0, text="Converting...")
+        
+        def update_progress(rows_processed, fraction):
+            progress_bar.progress(fraction, text=f"Converted {rows_processed:,} rows")
+        
+        # Replace the previous result, if any
+        previous_output = st.session_state.pop("file_conversion_output", None)
+        if previous_output:
+            previous_output.delete()
+        
+        # Chunks are written to disk as they are produced, never held in memory together;
+        # the file is deleted with the session, or swept after FILE_OUTPUT_MAX_AGE
+        output = ConvertedFile(f"{os.path.splitext(uploaded_file.name)[0]}_{to_currency}.csv")
+        try:
+            output.write(FileConversionService.stream_converted_csv(
+                uploaded_file,
+                uploaded_file.name,
+                amount_column,
+                currency_column,
+                to_currency,
+                rate_matrix,
+                max_workers=FILE_MAX_WORKERS if use_workers else 0,
+                progress_callback=update_progress,
+            ))
+        except (KeyError, ValueError, pd.errors.ParserError) as e:
+            output.delete()
+            progress_bar.empty()
+            st.error(f"❌ Unable to convert file: {str(e)}")
+            return
+        
+        progress_bar.progress(1.0, text="Conversion complete")
+        st.session_state.file_conversion_output = output
+    
+    output = st.session_state.get("file_conversion_output")
+    if output and output.exists():
+        st.download_button(
+            label="⬇️ Download Converted File",
+            data=output.read_bytes,
+            file_name=output.file_name,
+            mime="text/csv",
+            use_container_width=True,
+        )
+
 if __name__ == "__main__":
     render_bulk_converter_page()
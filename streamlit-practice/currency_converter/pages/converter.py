@@ -8,20 +8,44 @@ import sys
 import os
 
 # Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
 
-from config.settings import SUPPORTED_CURRENCIES
+from config.settings import RATE_AUTO_REFRESH_SECONDS
 from services.exchange_rate_service import ExchangeRateService
+from services.history_recorder import add_to_history
+from services.metrics import instrument_page
+from services.profiler import profiled
 from utils.formatters import format_currency, format_exchange_rate, format_timestamp
 from utils.validators import validate_amount, validate_currency_code
 
 
+@instrument_page("converter")
 def render_converter_page():
     """Render the main currency converter page."""
     
     st.header("💱 Currency Converter")
     st.markdown("---")
     
+    render_conversion_panel()
+
+
+@st.fragment(run_every=RATE_AUTO_REFRESH_SECONDS or None)
+@profiled("converter.panel")
+@instrument_page("converter")
+def render_conversion_panel():
+    """
+    Render the conversion inputs and result.
+    
+    Runs as a fragment: changing an input reruns only this panel, not the
+    sidebar and the rest of the app, and the panel reruns every
+    RATE_AUTO_REFRESH_SECONDS to pick up refreshed rates from the cache.
+    """
+    
+    # Every currency the current rates cover; the selectboxes filter by code or name as you type
+    catalog = ExchangeRateService.get_currency_catalog()
+    
     # Create two columns for input layout
     col1, col2 = st.columns(2)
     
@@ -29,8 +53,8 @@ def render_converter_page():
         st.subheader("From")
         from_currency = st.selectbox(
             "Select source currency",
-            options=list(SUPPORTED_CURRENCIES.keys()),
-            format_func=lambda x: f"{x} - {SUPPORTED_CURRENCIES[x]}",
+            options=catalog.codes,
+            format_func=catalog.label,
             key="from_currency"
         )
         amount = st.number_input(
@@ -45,9 +69,9 @@ def render_converter_page():
         st.subheader("To")
         to_currency = st.selectbox(
             "Select target currency",
-            options=list(SUPPORTED_CURRENCIES.keys()),
+            options=catalog.codes,
             index=1,  # Default to USD
-            format_func=lambda x: f"{x} - {SUPPORTED_CURRENCIES[x]}",
+            format_func=catalog.label,
             key="to_currency"
         )
         st.text_input(
@@ -60,15 +84,15 @@ def render_converter_page():
     # Perform conversion
     if amount > 0:
         with st.spinner("Fetching exchange rates..."):
-            exchange_data = ExchangeRateService.get_exchange_rates(from_currency)
+            rate_matrix = ExchangeRateService.get_rate_matrix()
         
-        if exchange_data:
+        if rate_matrix:
             # Perform conversion
             converted_amount = ExchangeRateService.convert_currency(
                 amount,
                 from_currency,
                 to_currency,
-                exchange_data
+                rate_matrix
             )
             
             if converted_amount is not None:
@@ -95,15 +119,22 @@ def render_converter_page():
                     )
                 
                 # Display exchange rate
-                exchange_rate = exchange_data["rates"].get(to_currency)
+                exchange_rate = rate_matrix.rate(from_currency, to_currency)
                 if exchange_rate:
                     st.info(
                         f"📊 Exchange Rate: {format_exchange_rate(exchange_rate, from_currency, to_currency)}"
                     )
                 
-                # Display last update time
+                # Record each conversion once, not on every rerun of the panel
+                conversion = (from_currency, to_currency, amount)
+                if exchange_rate and st.session_state.get("last_recorded_conversion") != conversion:
+                    st.session_state.last_recorded_conversion = conversion
+                    add_to_history(from_currency, to_currency, amount, converted_amount, exchange_rate)
+                
+                # Display last update time and freshness
+                freshness = "🟡 stale, refreshing in background" if rate_matrix.stale else "🟢 fresh"
                 st.caption(
-                    f"Last updated: {format_timestamp(exchange_data['timestamp'])}"
+                    f"Last updated: {format_timestamp(rate_matrix.timestamp)} ({freshness})"
                 )
             else:
                 st.error("❌ Unable to convert. Please try again.")
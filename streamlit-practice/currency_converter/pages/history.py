@@ -10,29 +10,62 @@ import sys
 import os
 
 # Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
 
-from config.settings import SUPPORTED_CURRENCIES
+from config.settings import (
+    HISTORY_DB_ENABLED,
+    HISTORY_PAGE_SIZE,
+    HISTORY_EXPORT_CHUNK_SIZE,
+)
+from services.history_db import HistoryFilter, get_history_database
+from services.history_export import EXPORT_FORMATS, HistoryExportService
+from services.history_recorder import history_owner, initialize_history
+from services.metrics import instrument_page
+from services.profiler import traced
+from utils.formatters import format_number
+from utils.table_columns import number_column
 
 
-def initialize_history():
-    """Initialize history in session state if not exists."""
-    if "conversion_history" not in st.session_state:
-        st.session_state.conversion_history = []
+def build_history_dataframe(history):
+    """Build the display table and column config for a history store."""
+    return format_history_records(history.to_dataframe())
 
 
-def add_to_history(from_currency, to_currency, amount, converted_amount, rate):
-    """Add conversion to history."""
-    st.session_state.conversion_history.append({
-        "Timestamp": datetime.now(),
-        "From": from_currency,
-        "To": to_currency,
-        "Amount": amount,
-        "Converted": converted_amount,
-        "Rate": rate,
+@traced("format_history_records")
+def format_history_records(records):
+    """
+    Prepare Timestamp/From/To/Amount/Converted/Rate records for display.
+    
+    Columns stay datetime and numeric where column_config can format them in
+    the browser, so no per-row strings are built for large tables.
+    
+    Returns:
+        Tuple[pd.DataFrame, dict]: Display table and its column config
+    """
+    amounts, amount_config = number_column(records["Amount"], "Amount")
+    converted, converted_config = number_column(records["Converted"], "Converted")
+    rates, rate_config = number_column(records["Rate"], "Rate", decimals=4)
+    
+    history_df = pd.DataFrame({
+        "Time": records["Timestamp"],
+        "From": records["From"],
+        "To": records["To"],
+        "Amount": amounts,
+        "Converted": converted,
+        "Rate": rates,
     })
+    column_config = {
+        "Time": st.column_config.DatetimeColumn("Time", format="YYYY-MM-DD HH:mm:ss"),
+        "Amount": amount_config,
+        "Converted": converted_config,
+        "Rate": rate_config,
+    }
+    return history_df, column_config
 
 
+@instrument_page("history")
 def render_history_page():
     """Render the conversion history page."""
     
@@ -42,7 +75,13 @@ def render_history_page():
     st.markdown("Track and analyze your conversion history")
     st.markdown("---")
     
-    if not st.session_state.conversion_history:
+    if HISTORY_DB_ENABLED:
+        render_durable_history()
+        return
+    
+    history = st.session_state.conversion_history
+    
+    if not len(history):
         st.info("📝 No conversions yet. Start converting currencies to build your history!")
         return
     
@@ -50,55 +89,184 @@ def render_history_page():
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Conversions", len(st.session_state.conversion_history))
+        st.metric("Total Conversions", history.total_count)
     
     with col2:
-        unique_from = len(set(h["From"] for h in st.session_state.conversion_history))
-        st.metric("Unique From Currencies", unique_from)
+        st.metric("Unique From Currencies", history.unique_from_count)
     
     with col3:
-        unique_to = len(set(h["To"] for h in st.session_state.conversion_history))
-        st.metric("Unique To Currencies", unique_to)
+        st.metric("Unique To Currencies", history.unique_to_count)
     
     with col4:
-        total_conversions = sum(h["Amount"] for h in st.session_state.conversion_history)
-        st.metric("Total Amount Converted", f"{total_conversions:,.2f}")
+        st.metric("Total Amount Converted", format_number(history.total_amount))
     
     st.markdown("---")
     
     # Display history table
     st.subheader("Conversion Records")
     
-    history_df = pd.DataFrame([
-        {
-            "Time": h["Timestamp"].strftime("%Y-%m-%d %H:%M:%S"),
-            "From": h["From"],
-            "To": h["To"],
-            "Amount": f"{h['Amount']:,.2f}",
-            "Converted": f"{h['Converted']:,.2f}",
-            "Rate": f"{h['Rate']:.4f}",
-        }
-        for h in st.session_state.conversion_history
-    ])
+    history_df, column_config = build_history_dataframe(history)
+    
+    st.dataframe(history_df, use_container_width=True, hide_index=True, column_config=column_config)
+    
+    # Action buttons
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if st.button("🗑️ Clear History", use_container_width=True):
+            history.clear()
+            st.rerun()
+    
+    with col2:
+        render_export_button(lambda: history.iter_chunks(HISTORY_EXPORT_CHUNK_SIZE), key="history_export")
+
+
+def render_export_button(iter_chunks, key):
+    """
+    Render an export format picker and a download button.
+
+    The export is only generated when the button is clicked, chunk by chunk
+    into a temporary file, so reruns never pay for it.
+
+    Args:
+        iter_chunks (Callable[[], Iterator[pd.DataFrame]]): Produces record chunks to export
+        key (str): Widget key prefix
+    """
+    export_format = st.selectbox(
+        "Export format",
+        options=list(EXPORT_FORMATS),
+        key=f"{key}_format",
+        label_visibility="collapsed"
+    )
+    extension, mime = EXPORT_FORMATS[export_format]
+    
+    st.download_button(
+        label=f"⬇️ Download as {export_format}",
+        data=lambda: HistoryExportService.export_bytes(iter_chunks(), export_format),
+        file_name=f"conversion_history_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}",
+        mime=mime,
+        use_container_width=True
+    )
+
+
+def _set_history_cursor(cursor):
+    """Button callback: move to another page of durable history."""
+    st.session_state.history_cursor = cursor
+
+
+def render_durable_history():
+    """Render the paginated, filterable view of the durable history database."""
+    
+    database = get_history_database()
+    owner = history_owner()
+    # Only currencies that occur in the history, however many the rates cover
+    currency_options = ["All", *database.currencies(owner)]
+    
+    # Filters
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        from_filter = st.selectbox("From currency", options=currency_options, key="history_from_filter")
+    
+    with col2:
+        to_filter = st.selectbox("To currency", options=currency_options, key="history_to_filter")
+    
+    with col3:
+        date_range = st.date_input("Date range", value=[], key="history_date_range")
     
-    st.dataframe(history_df, use_container_width=True, hide_index=True)
+    history_filter = HistoryFilter(
+        from_currency=None if from_filter == "All" else from_filter,
+        to_currency=None if to_filter == "All" else to_filter,
+        start_date=date_range[0] if len(date_range) > 0 else None,
+        end_date=date_range[1] if len(date_range) > 1 else None,
+        owner=owner,
+    )
+    
+    # Start from the newest page whenever the filters change
+    filter_key = (from_filter, to_filter, tuple(date_range))
+    if st.session_state.get("history_filter_key") != filter_key:
+        st.session_state.history_filter_key = filter_key
+        st.session_state.history_cursor = None
+    
+    summary = database.summarize(history_filter)
+    
+    if not summary["total_count"]:
+        st.info("📝 No conversions yet. Start converting currencies to build your history!")
+        return
+    
+    # Display history statistics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Total Conversions", f"{summary['total_count']:,}")
+    
+    with col2:
+        st.metric("Unique From Currencies", summary["unique_from"])
+    
+    with col3:
+        st.metric("Unique To Currencies", summary["unique_to"])
+    
+    with col4:
+        st.metric("Total Amount Converted", format_number(summary["total_amount"]))
+    
+    st.markdown("---")
+    
+    # Display one page of records
+    st.subheader("Conversion Records")
+    
+    cursor = st.session_state.get("history_cursor")
+    direction, position = cursor if cursor else (None, None)
+    page = database.query_page(
+        history_filter,
+        HISTORY_PAGE_SIZE,
+        before=position if direction == "before" else None,
+        after=position if direction == "after" else None,
+    )
+    
+    # Ran past either end: fall back to the newest page
+    if cursor and (page.empty or (direction == "after" and len(page) < HISTORY_PAGE_SIZE)):
+        st.session_state.history_cursor = None
+        page = database.query_page(history_filter, HISTORY_PAGE_SIZE)
+    
+    history_df, column_config = format_history_records(page)
+    st.dataframe(history_df, use_container_width=True, hide_index=True, column_config=column_config)
+    
+    newest = (page["ts"].iloc[0], int(page["id"].iloc[0])) if not page.empty else None
+    oldest = (page["ts"].iloc[-1], int(page["id"].iloc[-1])) if not page.empty else None
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.button(
+            "⬅️ Newer",
+            use_container_width=True,
+            disabled=st.session_state.get("history_cursor") is None,
+            on_click=_set_history_cursor,
+            args=(("after", newest),),
+        )
+    
+    with col2:
+        st.button(
+            "Older ➡️",
+            use_container_width=True,
+            disabled=len(page) < HISTORY_PAGE_SIZE,
+            on_click=_set_history_cursor,
+            args=(("before", oldest),),
+        )
     
     # Action buttons
     col1, col2 = st.columns(2)
     
     with col1:
         if st.button("🗑️ Clear History", use_container_width=True):
-            st.session_state.conversion_history = []
+            database.clear(owner)
+            st.session_state.history_cursor = None
             st.rerun()
     
     with col2:
-        csv = history_df.to_csv(index=False)
-        st.download_button(
-            label="⬇️ Download as CSV",
-            data=csv,
-            file_name=f"conversion_history_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-            mime="text/csv",
-            use_container_width=True
+        render_export_button(
+            lambda: database.iter_chunks(history_filter, HISTORY_EXPORT_CHUNK_SIZE),
+            key="history_db_export"
         )
 
 
@@ -0,0 +1,121 @@
+"""
+Exchange rate trends page.
+Charts recorded historical rates for any currency pair.
+"""
+
+import streamlit as st
+from datetime import date, datetime, timedelta
+import sys
+import os
+
+# Add parent directory to path for imports
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
+
+from config.settings import PRIMARY_CURRENCY
+from services.exchange_rate_service import ExchangeRateService
+from services.metrics import instrument_page
+
+RESOLUTIONS = {
+    "Every fetch": None,
+    "Daily": "D",
+    "Weekly": "W",
+}
+
+
+@instrument_page("trends")
+def render_trends_page():
+    """Render the exchange rate trends page."""
+
+    st.header("📈 Rate Trends")
+    st.markdown("Historical exchange rates recorded from every fetch")
+    st.markdown("---")
+
+    catalog = ExchangeRateService.get_currency_catalog()
+    currency_options = list(catalog.codes)
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        from_currency = st.selectbox(
+            "From currency",
+            options=currency_options,
+            index=currency_options.index("USD") if "USD" in currency_options else 0,
+            format_func=catalog.label,
+            key="trends_from_currency"
+        )
+
+    with col2:
+        to_currency = st.selectbox(
+            "To currency",
+            options=currency_options,
+            index=(
+                currency_options.index(PRIMARY_CURRENCY)
+                if PRIMARY_CURRENCY in currency_options
+                else min(1, len(currency_options) - 1)
+            ),
+            format_func=catalog.label,
+            key="trends_to_currency"
+        )
+
+    with col3:
+        resolution = st.selectbox("Resolution", options=list(RESOLUTIONS), index=1, key="trends_resolution")
+
+    today = date.today()
+    date_range = st.date_input(
+        "Date range",
+        value=(today - timedelta(days=90), today),
+        max_value=today,
+        key="trends_date_range"
+    )
+    if len(date_range) < 2:
+        st.info("📅 Select an end date to show the trend.")
+        return
+
+    start = datetime.combine(date_range[0], datetime.min.time())
+    end = datetime.combine(date_range[1], datetime.max.time())
+
+    series = ExchangeRateService.get_rate_history(
+        from_currency, to_currency, start, end, RESOLUTIONS[resolution]
+    )
+
+    if series is None:
+        st.info("ℹ️ Rate history is disabled. Set RATE_HISTORY_ENABLED=true to record fetched rates.")
+        return
+
+    if series.empty:
+        st.info("📝 No rates recorded for this range yet. Rates are recorded every time they are fetched.")
+        return
+
+    # Summary statistics
+    first_rate = series.iloc[0]
+    latest_rate = series.iloc[-1]
+    change = (latest_rate - first_rate) / first_rate * 100
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Latest", f"{latest_rate:,.4f}", f"{change:+.2f}%")
+
+    with col2:
+        st.metric("Low", f"{series.min():,.4f}")
+
+    with col3:
+        st.metric("High", f"{series.max():,.4f}")
+
+    with col4:
+        st.metric("Data Points", f"{len(series):,}")
+
+    st.line_chart(series, y_label=f"{to_currency} per {from_currency}")
+
+    with st.expander("📋 View data"):
+        st.dataframe(
+            series.rename("Rate").to_frame(),
+            use_container_width=True,
+            column_config={"Rate": st.column_config.NumberColumn(format="%.4f")}
+        )
+
+
+if __name__ == "__main__":
+    render_trends_page()
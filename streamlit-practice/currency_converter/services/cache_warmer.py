@@ -0,0 +1,104 @@
+"""
+Cache warm-up for exchange rates.
+Fetches the anchor currency's rates, which every cross rate is derived from, when the app starts.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, Optional, Tuple
+import sys
+import os
+
+# Add parent directory to path for imports
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
+
+from config.settings import ANCHOR_CURRENCY, CACHE_WARMUP_MAX_WORKERS
+from services.exchange_rate_service import ExchangeRateService
+
+logger = logging.getLogger(__name__)
+
+
+def _warm_base(base_currency: str) -> Tuple[bool, float]:
+    """Fetch one base currency into the cache and time it."""
+    start = time.perf_counter()
+    table = ExchangeRateService.get_rate_table(base_currency)
+    return table is not None, time.perf_counter() - start
+
+
+def warm_up_cache(
+    currencies: Optional[Iterable[str]] = None,
+    max_workers: int = CACHE_WARMUP_MAX_WORKERS
+) -> Dict[str, float]:
+    """
+    Populate the rate cache for one or more base currencies concurrently.
+
+    The pages derive every cross rate from the ANCHOR_CURRENCY rates, so
+    that is the only base warmed by default. Failed bases are logged and
+    skipped; they are fetched on demand later.
+
+    Args:
+        currencies (Optional[Iterable[str]]): Base currency codes, defaults to (ANCHOR_CURRENCY,)
+        max_workers (int): Maximum number of concurrent fetches
+
+    Returns:
+        Dict[str, float]: Fetch time in seconds for each base that was warmed
+    """
+    bases = list(currencies if currencies is not None else (ANCHOR_CURRENCY,))
+    timings = {}
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rate-warmup") as executor:
+        futures = {executor.submit(_warm_base, base): base for base in bases}
+
+        for future in as_completed(futures):
+            base = futures[future]
+            try:
+                warmed, elapsed = future.result()
+            except Exception:
+                logger.exception("Cache warm-up for %s raised an error; skipping", base)
+                continue
+
+            if warmed:
+                timings[base] = elapsed
+                logger.info("Warmed %s rates in %.0f ms", base, elapsed * 1000)
+            else:
+                logger.warning("Cache warm-up for %s failed after %.0f ms; skipping", base, elapsed * 1000)
+
+    # Prebuild the cross-rate matrix used by the pages
+    ExchangeRateService.get_rate_matrix()
+
+    logger.info(
+        "Cache warm-up finished: %d/%d bases in %.0f ms",
+        len(timings), len(bases), (time.perf_counter() - start) * 1000,
+    )
+    return timings
+
+
+def start_background_warmup(currencies: Optional[Iterable[str]] = None) -> threading.Thread:
+    """
+    Run the cache warm-up in a daemon thread so startup never blocks on it.
+
+    Args:
+        currencies (Optional[Iterable[str]]): Base currency codes, defaults to (ANCHOR_CURRENCY,)
+
+    Returns:
+        threading.Thread: The started warm-up thread
+    """
+    thread = threading.Thread(
+        target=warm_up_cache,
+        args=(currencies,),
+        name="rate-cache-warmup",
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+if __name__ == "__main__":
+    # Pre-deploy warm-up: fills the on-disk snapshot store before the server starts
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    warm_up_cache()
@@ -0,0 +1,137 @@
+"""
+Catalog of the currencies the current rates cover.
+Names, region groups and a code/name search index for type-ahead lookup, built once per fetched rate payload.
+"""
+
+import bisect
+import re
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+import sys
+import os
+
+# Add parent directory to path for imports
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
+
+from config.currencies import CURRENCY_NAMES, CURRENCY_REGIONS
+from config.settings import SUPPORTED_CURRENCIES
+
+# Splits names into searchable words ("Hong Kong Dollar" -> hong, kong, dollar)
+_WORD_PATTERN = re.compile(r"[^\W_]+")
+
+FEATURED_GROUP = "Major"
+ALL_GROUP = "All"
+
+
+def currency_name(code: str) -> str:
+    """Name of a currency, or the code itself when it has none on record."""
+    return SUPPORTED_CURRENCIES.get(code) or CURRENCY_NAMES.get(code, code)
+
+
+class CurrencyCatalog:
+    """Immutable, ordered set of currencies: the featured ones first, then the rest by code."""
+
+    def __init__(self, codes: Iterable[str]):
+        """
+        Build the catalog and its search index.
+
+        Args:
+            codes (Iterable[str]): Currency codes to offer, e.g. those a rate matrix quotes
+        """
+        available = set(codes)
+        featured = [code for code in SUPPORTED_CURRENCIES if code in available]
+        self.codes: Tuple[str, ...] = (*featured, *sorted(available.difference(featured)))
+        self.featured: Tuple[str, ...] = tuple(featured)
+        self.names = {code: currency_name(code) for code in self.codes}
+        self.labels = {code: f"{code} - {name}" for code, name in self.names.items()}
+        self._order = {code: i for i, code in enumerate(self.codes)}
+
+        # Sorted (word, code) pairs; a prefix query is one bisect plus a short scan
+        entries = set()
+        for code, name in self.names.items():
+            entries.add((code.lower(), code))
+            entries.update((word, code) for word in _WORD_PATTERN.findall(name.lower()))
+        self._index: List[Tuple[str, str]] = sorted(entries)
+        self._words = [word for word, _ in self._index]
+
+    def __contains__(self, code: str) -> bool:
+        return code in self._order
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.codes)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def label(self, code: str) -> str:
+        """
+        Display label for a currency, e.g. for a selectbox's format_func.
+
+        Args:
+            code (str): Currency code
+
+        Returns:
+            str: "CODE - Name"
+        """
+        return self.labels.get(code, code)
+
+    def groups(self) -> Dict[str, Tuple[str, ...]]:
+        """
+        Named groups of currencies for bulk selection.
+
+        Returns:
+            Dict[str, Tuple[str, ...]]: "All", the featured "Major" currencies and
+            every region with at least one available currency, in catalog order
+        """
+        groups = {ALL_GROUP: self.codes, FEATURED_GROUP: self.featured}
+        for region, region_codes in CURRENCY_REGIONS.items():
+            available = sorted((code for code in region_codes if code in self._order), key=self._order.__getitem__)
+            if available:
+                groups[region] = tuple(available)
+        return groups
+
+    def _prefix_matches(self, prefix: str) -> Set[str]:
+        matches = set()
+        for i in range(bisect.bisect_left(self._words, prefix), len(self._words)):
+            word, code = self._index[i]
+            if not word.startswith(prefix):
+                break
+            matches.add(code)
+        return matches
+
+    def search(self, query: str, limit: int = 10) -> List[str]:
+        """
+        Find currencies for type-ahead lookup.
+
+        Ranks an exact code first, then codes starting with the query, then
+        currencies whose name has a word starting with each query word
+        ("rup" finds every rupee and the rupiah, "hong k" the Hong Kong
+        dollar), then any other label containing the query.
+
+        Args:
+            query (str): Partial code or name, case-insensitive
+            limit (int): Maximum number of results
+
+        Returns:
+            List[str]: Matching currency codes, best first
+        """
+        query = query.strip().lower()
+        if not query:
+            return list(self.codes[:limit])
+
+        words = _WORD_PATTERN.findall(query)
+        name_matches = set.intersection(*(self._prefix_matches(word) for word in words)) if words else set()
+
+        code = query.upper()
+        ranked = sorted(
+            name_matches,
+            key=lambda match: (match != code, not match.startswith(code), self._order[match]),
+        )
+        if len(ranked) < limit:
+            seen = set(ranked)
+            ranked.extend(
+                match for match in self.codes
+                if match not in seen and query in self.labels[match].lower()
+            )
+        return ranked[:limit]
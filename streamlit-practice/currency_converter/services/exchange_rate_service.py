@@ -4,70 +4,393 @@ Implements error handling and caching for better performance.
 """
 
 import requests
-import streamlit as st
+import numpy as np
+import copy
+import logging
+import threading
 from datetime import datetime
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
 import sys
 import os
 
 # Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
 
-from config.settings import API_BASE_URL, API_TIMEOUT, CACHE_DURATION
+from config.settings import (
+    CACHE_DURATION,
+    ANCHOR_CURRENCY,
+    SUPPORTED_CURRENCIES,
+    SNAPSHOT_STORE_ENABLED,
+    SNAPSHOT_STORE_PATH,
+    SNAPSHOT_MAX_AGE,
+    RATE_REFRESH_MODE,
+    RATE_REFRESH_AHEAD,
+    RATE_RETRY_INTERVAL,
+    CONVERSION_ENGINE,
+    RATE_HISTORY_ENABLED,
+    RATE_HISTORY_DIR,
+    RATE_HISTORY_COMPRESSION,
+)
+from services.currency_catalog import CurrencyCatalog
+from services.fixed_point import from_minor, get_fixed_point_rates, to_minor
+from services.metrics import ERRORS, FETCH_SECONDS, REGISTRY, instrument_conversion
+from services.profiler import span, traced
+from services.providers.factory import get_provider
+from services.providers.failover import FailoverProvider
+from services.rate_cache import RateCache
+from services.rate_matrix import RateMatrix
+from services.rate_table import RateTable
+from services.snapshot_store import SnapshotStore
+
+if TYPE_CHECKING:
+    # pandas (and pyarrow behind rate history) cost more to import than the rest
+    # of the app; they load on first use so the converter page starts without them
+    import pandas as pd
+    from services.rate_history import RateHistoryStore
+
+logger = logging.getLogger(__name__)
+
+_snapshot_store = SnapshotStore(SNAPSHOT_STORE_PATH) if SNAPSHOT_STORE_ENABLED else None
+_rate_history: Optional["RateHistoryStore"] = None
+_rate_history_lock = threading.Lock()
+_rate_cache = RateCache(
+    ttl=CACHE_DURATION,
+    refresh_ahead=RATE_REFRESH_AHEAD,
+    stale_while_revalidate=(RATE_REFRESH_MODE == "stale-while-revalidate"),
+    retry_interval=RATE_RETRY_INTERVAL,
+)
+_rate_matrix_cache: Dict[Tuple[str, str], RateMatrix] = {}
+# Keyed by the matrix's currency codes, which rarely change between fetches
+_catalog_cache: Dict[Tuple[str, ...], CurrencyCatalog] = {}
+
+# Cache counters are read from the cache itself at scrape time, so lookups need no hooks
+REGISTRY.register_collector(
+    "currency_rate_cache_events_total",
+    "Rate cache lookups (hits, stale_hits, misses, coalesced) and loads (fetches, fetch_errors)",
+    "counter",
+    lambda: [({"event": event}, count) for event, count in _rate_cache.stats().items()],
+)
+
+
+def _get_rate_history() -> Optional["RateHistoryStore"]:
+    """Get the rate history store, importing it on first use; None if disabled."""
+    global _rate_history
+
+    if not RATE_HISTORY_ENABLED:
+        return None
+    if _rate_history is None:
+        with _rate_history_lock:
+            if _rate_history is None:
+                from services.rate_history import RateHistoryStore
+                _rate_history = RateHistoryStore(RATE_HISTORY_DIR, compression=RATE_HISTORY_COMPRESSION)
+    return _rate_history
+
+
+def _record_rate_history(base_currency: str, table: RateTable) -> None:
+    """Append a fetched snapshot to the rate history store."""
+    rate_history = _get_rate_history()
+    if rate_history:
+        rate_history.append(base_currency, table.to_payload())
+
+
+def _load_snapshot(base_currency: str) -> Optional[Tuple[RateTable, float]]:
+    """Load and parse the last saved snapshot; None if there is none or it is unusable."""
+    snapshot = _snapshot_store.load(base_currency) if _snapshot_store else None
+    if snapshot is None:
+        return None
+    payload, age = snapshot
+    try:
+        return RateTable.from_payload(payload, SUPPORTED_CURRENCIES), age
+    except ValueError:
+        logger.warning("Ignoring unusable %s rate snapshot", base_currency)
+        return None
 
 
 class ExchangeRateService:
     """Service class for handling exchange rate operations."""
     
     @staticmethod
-    @st.cache_data(ttl=CACHE_DURATION)
-    def get_exchange_rates(base_currency: str) -> Optional[Dict]:
+    @traced("get_rate_table")
+    def get_rate_table(base_currency: str) -> Optional[RateTable]:
         """
         Fetch exchange rates for a given base currency.
         
+        Rates are cached for CACHE_DURATION. In stale-while-revalidate mode an
+        expired entry is returned immediately (with "stale" set) while it is
+        refreshed in the background. On a cold cache, a recent on-disk snapshot
+        is served instead of blocking on the network.
+        
         Args:
             base_currency (str): The base currency code (e.g., 'USD', 'PKR')
             
         Returns:
-            Optional[Dict]: Dictionary containing exchange rates or None if request fails
+            Optional[RateTable]: Rates parsed at fetch time, or None if the request fails
         """
+        if _snapshot_store and base_currency not in _rate_cache:
+            snapshot = _load_snapshot(base_currency)
+            if snapshot and snapshot[1] < SNAPSHOT_MAX_AGE:
+                _rate_cache.set(base_currency, *snapshot)
+        
         try:
-            url = f"{API_BASE_URL}/{base_currency}"
-            response = requests.get(url, timeout=API_TIMEOUT)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if response.status_code == 200 and "rates" in data:
-                return {
-                    "base": data.get("base"),
-                    "rates": data.get("rates"),
-                    "timestamp": datetime.now().isoformat()
-                }
+            table, stale = _rate_cache.get(base_currency, ExchangeRateService._load_exchange_rates)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            ExchangeRateService._report_error(ExchangeRateService._describe_error(e))
             return None
+        
+        if stale:
+            # Shares the read-only buffer; only the freshness flag differs
+            table = copy.copy(table)
+            table.stale = True
+        return table
+    
+    @staticmethod
+    def get_exchange_rates(base_currency: str) -> Optional[Dict]:
+        """
+        Fetch exchange rates for a given base currency as a plain payload.
+        
+        Builds a new dictionary on every call; conversions should use
+        get_rate_matrix or get_rate_table instead.
+        
+        Args:
+            base_currency (str): The base currency code (e.g., 'USD', 'PKR')
             
-        except requests.exceptions.Timeout:
-            st.error(f"⏱️ Request timeout. Please try again.")
-            return None
-        except requests.exceptions.ConnectionError:
-            st.error(f"🌐 Connection error. Please check your internet connection.")
-            return None
-        except requests.exceptions.HTTPError as e:
-            st.error(f"❌ API Error: {e.response.status_code} - {e.response.reason}")
+        Returns:
+            Optional[Dict]: "base", "rates", "timestamp" and "stale", or None if the request fails
+        """
+        table = ExchangeRateService.get_rate_table(base_currency)
+        if table is None:
             return None
-        except requests.exceptions.RequestException as e:
-            st.error(f"❌ Error fetching exchange rates: {str(e)}")
+        return dict(table.to_payload(), stale=table.stale)
+    
+    @staticmethod
+    def get_cache_stats() -> Dict[str, int]:
+        """
+        Get exchange rate cache counters for monitoring.
+        
+        Returns:
+            Dict[str, int]: Cache hit, stale hit, miss, coalesced, fetch and
+            fetch error counts for this process
+        """
+        return _rate_cache.stats()
+    
+    @staticmethod
+    def get_provider_health() -> Optional[List[Dict]]:
+        """
+        Get the state of each provider when RATE_PROVIDER lists several.
+        
+        Returns:
+            Optional[List[Dict]]: One row per provider in priority order (see
+            FailoverProvider.health), or None for a single provider
+        """
+        provider = get_provider()
+        if isinstance(provider, FailoverProvider):
+            return provider.health()
+        return None
+    
+    @staticmethod
+    @traced("get_rate_history")
+    def get_rate_history(
+        from_currency: str,
+        to_currency: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        freq: Optional[str] = None
+    ) -> Optional["pd.Series"]:
+        """
+        Get the recorded cross rate between two currencies over time.
+        
+        Every snapshot fetched by get_exchange_rates is recorded; the series is
+        derived from the ANCHOR_CURRENCY snapshots without any network call.
+        
+        Args:
+            from_currency (str): Source currency code
+            to_currency (str): Target currency code
+            start (Optional[datetime]): First timestamp included
+            end (Optional[datetime]): Last timestamp included
+            freq (Optional[str]): Pandas resample rule such as "D" or "W"
+            
+        Returns:
+            Optional[pd.Series]: Rates by timestamp, or None if rate history is disabled
+        """
+        rate_history = _get_rate_history()
+        if rate_history is None:
             return None
-        except ValueError:
-            st.error("❌ Invalid response from API. Please try again.")
+        return rate_history.pair_series(ANCHOR_CURRENCY, from_currency, to_currency, start, end, freq)
+    
+    @staticmethod
+    def _load_exchange_rates(base_currency: str) -> Tuple[RateTable, float]:
+        """
+        Cache loader: fetch from the network, falling back to the last snapshot.
+        
+        Args:
+            base_currency (str): The base currency code
+            
+        Returns:
+            Tuple[RateTable, float]: (rates, age in seconds)
+            
+        Raises:
+            requests.exceptions.RequestException: If the request fails and no snapshot exists
+            ValueError: If the response is invalid and no snapshot exists
+        """
+        try:
+            with FETCH_SECONDS.time(base_currency), span("fetch", base=base_currency):
+                table = ExchangeRateService._fetch_exchange_rates(base_currency)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            ERRORS.inc("fetch", type(e).__name__)
+            snapshot = _load_snapshot(base_currency)
+            if snapshot is None:
+                raise
+            logger.warning("Fetching %s rates failed; serving last known snapshot", base_currency)
+            return snapshot
+        
+        if _snapshot_store:
+            _snapshot_store.save(base_currency, table.to_payload())
+        if RATE_HISTORY_ENABLED:
+            # Writing Parquet needs pandas and pyarrow; keep both off the fetch path.
+            # Not a daemon thread, so short-lived processes still finish the write.
+            threading.Thread(
+                target=_record_rate_history, args=(base_currency, table), name="rate-history-append"
+            ).start()
+        return table, 0.0
+    
+    @staticmethod
+    def _fetch_exchange_rates(base_currency: str) -> RateTable:
+        """
+        Fetch exchange rates from the configured rate provider.
+        
+        The response is validated and parsed here, once per fetch, so lookups
+        never re-check its structure.
+        
+        Args:
+            base_currency (str): The base currency code
+            
+        Returns:
+            RateTable: Parsed rates, the featured currencies first
+            
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+            ValueError: If the response is not valid JSON or has no usable rates
+        """
+        data = get_provider().fetch(base_currency)
+        return RateTable.from_payload(data, SUPPORTED_CURRENCIES, timestamp=datetime.now().isoformat())
+    
+    @staticmethod
+    def _describe_error(error: Exception) -> str:
+        """
+        Build a user-facing message for a failed fetch.
+        
+        Args:
+            error (Exception): Exception raised while fetching
+            
+        Returns:
+            str: Error message for display
+        """
+        if isinstance(error, requests.exceptions.Timeout):
+            return "⏱️ Request timeout. Please try again."
+        if isinstance(error, requests.exceptions.ConnectionError):
+            return "🌐 Connection error. Please check your internet connection."
+        if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+            return f"❌ API Error: {error.response.status_code} - {error.response.reason}"
+        if isinstance(error, requests.exceptions.RequestException):
+            return f"❌ Error fetching exchange rates: {str(error)}"
+        return "❌ Invalid response from API. Please try again."
+    
+    @staticmethod
+    def _report_error(message: str) -> None:
+        """
+        Show an error on the Streamlit page being rendered, or log it when headless.
+        
+        Streamlit is only imported if the process already loaded it, so the CLI
+        and the JSON API never pay for it.
+        
+        Args:
+            message (str): User-facing error message
+        """
+        if "streamlit" in sys.modules:
+            import streamlit as st
+            from streamlit.runtime.scriptrunner import get_script_run_ctx
+            
+            if get_script_run_ctx(suppress_warning=True) is not None:
+                st.error(message)
+                return
+        logger.error(message)
+    
+    @staticmethod
+    @traced("get_rate_matrix")
+    def get_rate_matrix() -> Optional[RateMatrix]:
+        """
+        Get cross rates for all supported currencies from a single upstream fetch.
+        
+        Rates are fetched once for ANCHOR_CURRENCY and every other pair is
+        derived from them, so picking a new source currency never refetches.
+        
+        Returns:
+            Optional[RateMatrix]: Cross-rate matrix or None if request fails
+        """
+        table = ExchangeRateService.get_rate_table(ANCHOR_CURRENCY)
+        if table is None:
             return None
+        
+        rate_matrix = ExchangeRateService._build_rate_matrix(table)
+        if rate_matrix.stale != table.stale:
+            # Shares the read-only rates; only the freshness flag differs
+            rate_matrix = copy.copy(rate_matrix)
+            rate_matrix.stale = table.stale
+        return rate_matrix
     
     @staticmethod
+    @traced("get_currency_catalog")
+    def get_currency_catalog() -> CurrencyCatalog:
+        """
+        Get the currencies that can currently be converted.
+        
+        Derived from the cached rates, so it grows and shrinks with what the
+        provider quotes. Falls back to SUPPORTED_CURRENCIES when rates are
+        unavailable, so pages can still render their inputs.
+        
+        Returns:
+            CurrencyCatalog: Currency codes, names, groups and search index
+        """
+        rate_matrix = ExchangeRateService.get_rate_matrix()
+        codes = rate_matrix.codes if rate_matrix is not None else tuple(SUPPORTED_CURRENCIES)
+        catalog = _catalog_cache.get(codes)
+        if catalog is None:
+            catalog = CurrencyCatalog(codes)
+            _catalog_cache.clear()
+            _catalog_cache[codes] = catalog
+        return catalog
+    
+    @staticmethod
+    def _build_rate_matrix(table: RateTable) -> RateMatrix:
+        """
+        Build the rate matrix once per fetched rate table.
+        
+        Args:
+            table (RateTable): Anchor-base rates
+            
+        Returns:
+            RateMatrix: Cross rates over every currency the table quotes
+        """
+        key = (table.base, table.timestamp)
+        rate_matrix = _rate_matrix_cache.get(key)
+        if rate_matrix is None:
+            rate_matrix = RateMatrix(table)
+            # Only the latest table's matrix is kept
+            _rate_matrix_cache.clear()
+            _rate_matrix_cache[key] = rate_matrix
+        return rate_matrix
+    
+    @staticmethod
+    @traced("convert_currency")
+    @instrument_conversion("single")
     def convert_currency(
         amount: float,
         from_currency: str,
         to_currency: str,
-        rates: Dict
+        rates: Union[RateMatrix, RateTable],
+        engine: Optional[str] = None
     ) -> Optional[float]:
         """
         Convert amount from one currency to another.
@@ -76,7 +399,8 @@ class ExchangeRateService:
             amount (float): Amount to convert
             from_currency (str): Source currency code
             to_currency (str): Target currency code
-            rates (Dict): Dictionary containing exchange rates
+            rates (Union[RateMatrix, RateTable]): Rate matrix, or the rate table it is derived from
+            engine (Optional[str]): "float" or "fixed", defaults to CONVERSION_ENGINE
             
         Returns:
             Optional[float]: Converted amount or None if conversion fails
@@ -85,28 +409,71 @@ class ExchangeRateService:
             if from_currency == to_currency:
                 return amount
 
-            # Ensure response structure is valid
-            if not isinstance(rates, dict) or "rates" not in rates:
+            if isinstance(rates, RateTable):
+                rates = ExchangeRateService._build_rate_matrix(rates)
+            elif not isinstance(rates, RateMatrix):
                 return None
 
-            rate_map = rates.get("rates", {})
-
-            # Check both currencies exist in the rates map
-            if to_currency not in rate_map or from_currency not in rate_map:
-                # It's possible from_currency equals the declared base
-                # so allow conversion when from_currency == base
-                if from_currency != rates.get("base"):
-                    return None
-
-            if from_currency == rates.get("base"):
-                # Direct conversion from base currency
-                converted = amount * rate_map[to_currency]
-            else:
-                # Convert to base first, then to target
-                base_amount = amount / rate_map[from_currency]
-                converted = base_amount * rate_map[to_currency]
+            if (engine or CONVERSION_ENGINE) == "fixed":
+                return get_fixed_point_rates(rates).convert_amount(amount, from_currency, to_currency)
+
+            rate = rates.rate(from_currency, to_currency)
+            if rate is None:
+                return None
+            return round(amount * rate, 2)
             
-            return round(converted, 2)
+        except (KeyError, ZeroDivisionError, TypeError) as e:
+            ERRORS.inc("conversion", type(e).__name__)
+            return None
+
+    @staticmethod
+    @traced("convert_batch")
+    @instrument_conversion("batch")
+    def convert_batch(
+        amounts: Iterable[float],
+        from_currency: str,
+        to_currencies: List[str],
+        rate_matrix: RateMatrix,
+        engine: Optional[str] = None
+    ) -> Optional["pd.DataFrame"]:
+        """
+        Convert many amounts to many currencies in one vectorized operation.
+        
+        Args:
+            amounts (Iterable[float]): Amounts to convert, all in from_currency
+            from_currency (str): Source currency code
+            to_currencies (List[str]): Target currency codes
+            rate_matrix (RateMatrix): Cross-rate matrix to convert with
+            engine (Optional[str]): "float" or "fixed", defaults to CONVERSION_ENGINE
             
-        except (KeyError, ZeroDivisionError, TypeError):
+        Returns:
+            Optional[pd.DataFrame]: Amount × currency grid (one row per amount,
+            one column per convertible target) or None if conversion fails
+        """
+        if not isinstance(rate_matrix, RateMatrix) or from_currency not in rate_matrix:
             return None
+
+        amount_array = np.asarray(amounts, dtype=np.float64).reshape(-1)
+
+        if (engine or CONVERSION_ENGINE) == "fixed":
+            targets, minor_grid = get_fixed_point_rates(rate_matrix).convert_outer(
+                to_minor(amount_array, from_currency), from_currency, to_currencies
+            )
+            if not targets:
+                return None
+            grid = np.column_stack([
+                from_minor(minor_grid[:, column], target) for column, target in enumerate(targets)
+            ])
+        else:
+            targets, rates = rate_matrix.cross_rates(from_currency, to_currencies)
+            if not targets:
+                return None
+            grid = np.round(np.multiply.outer(amount_array, rates), 2)
+
+        import pandas as pd
+
+        return pd.DataFrame(
+            grid,
+            index=pd.Index(amount_array, name=from_currency),
+            columns=targets,
+        )
@@ -0,0 +1,332 @@
+"""
+Service module for converting large transaction files.
+Processes uploads in fixed-size chunks so memory stays bounded.
+"""
+
+import tempfile
+import time
+import weakref
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Optional
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path for imports
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
+
+from config.settings import (
+    FILE_CHUNK_SIZE, FILE_OUTPUT_DIR, FILE_OUTPUT_MAX_AGE, FILE_OUTPUT_MAX_BYTES, CONVERSION_ENGINE
+)
+from services.fixed_point import get_fixed_point_rates
+from services.rate_matrix import RateMatrix
+
+EXCEL_EXTENSIONS = (".xlsx", ".xlsm")
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class ConvertedFile:
+    """
+    A converted file in FILE_OUTPUT_DIR.
+
+    The file is deleted by delete(), or once this object is garbage collected
+    (e.g. with the session state holding it) or the process exits. Files
+    older than FILE_OUTPUT_MAX_AGE are swept whenever a new one is created,
+    so the directory stays bounded even after a crash.
+    """
+
+    def __init__(self, file_name: str, directory: str = FILE_OUTPUT_DIR):
+        """
+        Create an empty output file.
+
+        Args:
+            file_name (str): Name offered for download
+            directory (str): Directory the file is written to
+        """
+        os.makedirs(directory, exist_ok=True)
+        ConvertedFile.sweep(directory)
+        handle, self.path = tempfile.mkstemp(prefix="converted_", suffix=".csv", dir=directory)
+        os.close(handle)
+        self.file_name = file_name
+        self._finalizer = weakref.finalize(self, _remove_file, self.path)
+
+    @staticmethod
+    def sweep(directory: str = FILE_OUTPUT_DIR, max_age: float = FILE_OUTPUT_MAX_AGE) -> int:
+        """
+        Delete output files older than max_age.
+
+        Args:
+            directory (str): Output directory
+            max_age (float): Age in seconds
+
+        Returns:
+            int: Number of files deleted
+        """
+        cutoff = time.time() - max_age
+        removed = 0
+        for path in Path(directory).glob("converted_*.csv"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+
+    def write(self, blocks: Iterable[bytes], max_bytes: int = FILE_OUTPUT_MAX_BYTES) -> int:
+        """
+        Write encoded blocks to the file as they are produced.
+
+        The download is served from memory, so writing stops at max_bytes
+        rather than producing a file too large to hand to the browser.
+
+        Args:
+            blocks (Iterable[bytes]): Encoded output, e.g. from stream_converted_csv
+            max_bytes (int): Largest file accepted
+
+        Returns:
+            int: Number of bytes written
+
+        Raises:
+            ValueError: If the output would exceed max_bytes
+        """
+        written = 0
+        with open(self.path, "wb") as output_file:
+            for data in blocks:
+                written += len(data)
+                if written > max_bytes:
+                    raise ValueError(
+                        f"the converted file exceeds the {max_bytes / 1024 / 1024:,.0f} MB download limit; "
+                        "split the upload into smaller files"
+                    )
+                output_file.write(data)
+        return written
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def read_bytes(self) -> bytes:
+        """Read the whole file, closing it again."""
+        return Path(self.path).read_bytes()
+
+    def delete(self) -> None:
+        self._finalizer()
+
+
+class FileConversionService:
+    """Service class for chunked conversion of CSV/Excel transaction files."""
+
+    @staticmethod
+    def is_excel(file_name: str) -> bool:
+        """
+        Check whether a file name refers to an Excel workbook.
+
+        Args:
+            file_name (str): Uploaded file name
+
+        Returns:
+            bool: True for Excel files, False for CSV
+        """
+        return file_name.lower().endswith(EXCEL_EXTENSIONS)
+
+    @staticmethod
+    def read_columns(file: BinaryIO, file_name: str) -> List[str]:
+        """
+        Read only the header row of a file.
+
+        Args:
+            file (BinaryIO): Uploaded file object
+            file_name (str): Uploaded file name
+
+        Returns:
+            List[str]: Column names
+        """
+        file.seek(0)
+        if FileConversionService.is_excel(file_name):
+            columns = list(pd.read_excel(file, nrows=0).columns)
+        else:
+            columns = list(pd.read_csv(file, nrows=0).columns)
+        file.seek(0)
+        return [str(column) for column in columns]
+
+    @staticmethod
+    def iter_chunks(file: BinaryIO, file_name: str, chunk_size: int = FILE_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """
+        Read a file as a sequence of fixed-size DataFrames.
+
+        Args:
+            file (BinaryIO): Uploaded file object
+            file_name (str): Uploaded file name
+            chunk_size (int): Rows per chunk
+
+        Yields:
+            pd.DataFrame: Next chunk of rows
+        """
+        file.seek(0)
+        if FileConversionService.is_excel(file_name):
+            yield from FileConversionService._iter_excel_chunks(file, chunk_size)
+        else:
+            yield from pd.read_csv(file, chunksize=chunk_size)
+
+    @staticmethod
+    def _iter_excel_chunks(file: BinaryIO, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """Stream rows of the first worksheet without loading the whole workbook."""
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = [str(column) for column in next(rows, ())]
+            buffer = []
+            for row in rows:
+                buffer.append(row)
+                if len(buffer) >= chunk_size:
+                    yield pd.DataFrame(buffer, columns=header)
+                    buffer = []
+            if buffer:
+                yield pd.DataFrame(buffer, columns=header)
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def convert_chunk(
+        chunk: pd.DataFrame,
+        amount_column: str,
+        currency_column: str,
+        to_currency: str,
+        rate_matrix: RateMatrix
+    ) -> pd.DataFrame:
+        """
+        Convert every row of a chunk to the target currency.
+
+        Rows with an unknown currency or a non-numeric amount get empty results.
+
+        Args:
+            chunk (pd.DataFrame): Rows to convert
+            amount_column (str): Column holding the amounts
+            currency_column (str): Column holding the source currency codes
+            to_currency (str): Target currency code
+            rate_matrix (RateMatrix): Cross-rate matrix to convert with
+
+        Returns:
+            pd.DataFrame: Chunk with rate and converted amount columns appended
+        """
+        rates_to_target = np.append(rate_matrix.rates_to(to_currency), np.nan)
+
+        codes = chunk[currency_column].astype(str).str.strip().str.upper()
+        # Unknown codes point at the trailing NaN slot
+        rows = codes.map(rate_matrix.index).fillna(len(rate_matrix.codes)).to_numpy(dtype=np.intp)
+        rates = rates_to_target[rows]
+        amounts = pd.to_numeric(chunk[amount_column], errors="coerce").to_numpy(dtype=np.float64)
+
+        result = chunk.copy()
+        result[f"Rate ({to_currency})"] = rates
+        if CONVERSION_ENGINE == "fixed":
+            converted = get_fixed_point_rates(rate_matrix).convert_rows(amounts, rows, to_currency)
+        else:
+            converted = np.round(amounts * rates, 2)
+        result[f"Converted ({to_currency})"] = converted
+        return result
+
+    @staticmethod
+    def iter_converted_chunks(
+        chunks: Iterator[pd.DataFrame],
+        amount_column: str,
+        currency_column: str,
+        to_currency: str,
+        rate_matrix: RateMatrix,
+        max_workers: int = 0
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Convert chunks in order, optionally spread over a process pool.
+
+        At most two chunks per worker are in flight, so memory stays bounded
+        no matter how large the input is.
+
+        Args:
+            chunks (Iterator[pd.DataFrame]): Input chunks
+            amount_column (str): Column holding the amounts
+            currency_column (str): Column holding the source currency codes
+            to_currency (str): Target currency code
+            rate_matrix (RateMatrix): Cross-rate matrix to convert with
+            max_workers (int): Worker processes; 0 converts in-process
+
+        Yields:
+            pd.DataFrame: Converted chunks in input order
+        """
+        args = (amount_column, currency_column, to_currency, rate_matrix)
+
+        if max_workers <= 0:
+            for chunk in chunks:
+                yield FileConversionService.convert_chunk(chunk, *args)
+            return
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(FileConversionService.convert_chunk, chunk, *args))
+                if len(pending) >= max_workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    @staticmethod
+    def stream_converted_csv(
+        file: BinaryIO,
+        file_name: str,
+        amount_column: str,
+        currency_column: str,
+        to_currency: str,
+        rate_matrix: RateMatrix,
+        chunk_size: int = FILE_CHUNK_SIZE,
+        max_workers: int = 0,
+        progress_callback: Optional[Callable[[int, float], None]] = None
+    ) -> Iterator[bytes]:
+        """
+        Convert a file and stream the result as CSV bytes, one chunk at a time.
+
+        Args:
+            file (BinaryIO): Uploaded file object
+            file_name (str): Uploaded file name
+            amount_column (str): Column holding the amounts
+            currency_column (str): Column holding the source currency codes
+            to_currency (str): Target currency code
+            rate_matrix (RateMatrix): Cross-rate matrix to convert with
+            chunk_size (int): Rows per chunk
+            max_workers (int): Worker processes; 0 converts in-process
+            progress_callback (Optional[Callable[[int, float], None]]): Called after
+                each chunk with rows processed so far and the fraction of input read
+
+        Yields:
+            bytes: Encoded CSV text, header included in the first chunk
+        """
+        total_size = getattr(file, "size", None) or 0
+        chunks = FileConversionService.iter_chunks(file, file_name, chunk_size)
+        converted = FileConversionService.iter_converted_chunks(
+            chunks, amount_column, currency_column, to_currency, rate_matrix, max_workers
+        )
+
+        rows_processed = 0
+        for i, chunk in enumerate(converted):
+            rows_processed += len(chunk)
+            yield chunk.to_csv(index=False, header=(i == 0)).encode("utf-8")
+
+            if progress_callback:
+                # Excel workbooks are read whole by openpyxl, so position is not meaningful
+                if total_size and not FileConversionService.is_excel(file_name):
+                    fraction = min(file.tell() / total_size, 1.0)
+                else:
+                    fraction = 0.0
+                progress_callback(rows_processed, fraction)
@@ -0,0 +1,283 @@
+"""
+Fixed-point money engine for exact, vectorized conversions.
+Amounts are int64 minor units and each rate is an integer significand scaled by its own power of ten.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+import sys
+import os
+
+import numpy as np
+
+# Add parent directory to path for imports
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
+
+from config.settings import CURRENCY_MINOR_UNITS, DEFAULT_MINOR_UNITS, FIXED_POINT_RATE_DIGITS
+from services.rate_matrix import RateMatrix
+
+RATE_SCALE = 10 ** FIXED_POINT_RATE_DIGITS
+
+# Rates below 1 get a finer scale so they keep this many significant digits
+# (1 IRR is 0.0000073 KWD); the scale is capped so every step stays in int64
+_RATE_SIGNIFICANT_DIGITS = 15
+_MAX_RATE_DIGITS = 2 * FIXED_POINT_RATE_DIGITS
+
+_INT64_MAX = np.iinfo(np.int64).max
+_POWERS_OF_TEN = 10 ** np.arange(_MAX_RATE_DIGITS - FIXED_POINT_RATE_DIGITS + 1, dtype=np.int64)
+
+# Float amounts are snapped to this many decimals before rounding to minor units,
+# so binary representation error (2.675 * 100 == 267.49999...) cannot flip a tie
+_PARSE_DECIMALS = 6
+
+_fixed_rates_cache: Dict[Tuple, "FixedPointRates"] = {}
+
+
+def minor_units(currency_code: str) -> int:
+    """
+    Get the number of decimal places a currency is settled in.
+
+    Args:
+        currency_code (str): Currency code
+
+    Returns:
+        int: Minor unit exponent (2 for USD, 0 for JPY, 3 for KWD)
+    """
+    return CURRENCY_MINOR_UNITS.get(currency_code, DEFAULT_MINOR_UNITS)
+
+
+def to_minor(amounts, currency_code: str) -> np.ndarray:
+    """
+    Convert major-unit amounts to int64 minor units with banker's rounding.
+
+    Args:
+        amounts (float or array-like): Amounts in major units
+        currency_code (str): Currency the amounts are in
+
+    Returns:
+        np.ndarray: int64 minor units
+    """
+    scaled = np.asarray(amounts, dtype=np.float64) * 10 ** minor_units(currency_code)
+    return np.rint(np.round(scaled, _PARSE_DECIMALS)).astype(np.int64)
+
+
+def from_minor(minor, currency_code: str) -> np.ndarray:
+    """
+    Convert int64 minor units back to float major units for display.
+
+    Args:
+        minor (int or array-like): Amounts in minor units
+        currency_code (str): Currency the amounts are in
+
+    Returns:
+        np.ndarray: float64 major units
+    """
+    return np.asarray(minor, dtype=np.float64) / 10 ** minor_units(currency_code)
+
+
+def _round_scaled(product: int, digits: int) -> int:
+    """Divide a non-negative Python int by 10**digits, rounding half to even."""
+    divisor = 10 ** digits
+    quotient, remainder = divmod(product, divisor)
+    if 2 * remainder > divisor or (2 * remainder == divisor and quotient % 2 == 1):
+        quotient += 1
+    return quotient
+
+
+def multiply_scaled(amounts: np.ndarray, rates: np.ndarray, digits=FIXED_POINT_RATE_DIGITS) -> np.ndarray:
+    """
+    Compute amounts * rates / 10**digits rounded half to even.
+
+    The product is split around RATE_SCALE so no intermediate step
+    overflows int64, which keeps the result exact. Cells whose product is
+    too large for that are computed with Python integers instead, and the
+    result is then an object array. Arguments broadcast like NumPy arrays.
+
+    Args:
+        amounts (np.ndarray): int64 minor units, may be negative
+        rates (np.ndarray): Positive int64 rate significands
+        digits (int or np.ndarray): Decimal scale of each rate, between
+            FIXED_POINT_RATE_DIGITS and twice that
+
+    Returns:
+        np.ndarray: int64 products, or Python ints (dtype object) if any overflows int64
+    """
+    amounts = np.asarray(amounts, dtype=np.int64)
+    rates = np.asarray(rates, dtype=np.int64)
+    digits = np.asarray(digits, dtype=np.int64)
+    magnitude = np.abs(amounts)
+    amount_high, amount_low = np.divmod(magnitude, RATE_SCALE)
+    # product // RATE_SCALE is below (amount_high + 1) * rates, which must fit
+    overflow = amount_high >= (_INT64_MAX - 1) // np.maximum(rates, 1)
+
+    with np.errstate(over="ignore"):
+        # magnitude * rates == whole * RATE_SCALE + remainder
+        rate_whole, rate_frac = np.divmod(rates, RATE_SCALE)
+        carry, remainder = np.divmod(amount_low * rate_frac, RATE_SCALE)
+        result = magnitude * rate_whole + amount_high * rate_frac + carry
+
+        # Then divide by the rest of the rate's scale, 10**(digits - FIXED_POINT_RATE_DIGITS)
+        extra = _POWERS_OF_TEN[digits - FIXED_POINT_RATE_DIGITS]
+        if np.any(extra > 1):
+            result, rest = np.divmod(result, extra)
+            remainder = rest * RATE_SCALE + remainder
+        divisor = extra * RATE_SCALE
+        twice = 2 * remainder
+        result = result + ((twice > divisor) | ((twice == divisor) & (result % 2 == 1)))
+
+    if overflow.any():
+        result = result.astype(object)
+        magnitude, rates, digits = np.broadcast_arrays(magnitude, rates, digits)
+        for cell in zip(*np.nonzero(overflow)):
+            result[cell] = _round_scaled(int(magnitude[cell]) * int(rates[cell]), int(digits[cell]))
+    return np.where(amounts < 0, -result, result)
+
+
+class FixedPointRates:
+    """Cross rates between minor units of each currency, as int64 significands with a decimal scale each."""
+
+    def __init__(self, rate_matrix: RateMatrix):
+        """
+        Derive fixed-point rates from a float cross-rate matrix.
+
+        Args:
+            rate_matrix (RateMatrix): Cross rates to convert
+        """
+        self.codes = rate_matrix.codes
+        self.index = rate_matrix.index
+        self.minor = np.array([minor_units(code) for code in self.codes], dtype=np.int64)
+
+        # Fold the minor unit difference into each rate so conversions map
+        # source minor units straight to target minor units
+        shift = self.minor[np.newaxis, :] - self.minor[:, np.newaxis]
+        minor_rates = rate_matrix.matrix * 10.0 ** shift
+
+        # Scale every rate by at least RATE_SCALE, and small rates by more so
+        # they keep _RATE_SIGNIFICANT_DIGITS significant digits
+        magnitude = np.floor(np.log10(minor_rates)).astype(np.int64)
+        self.digits = np.clip(
+            _RATE_SIGNIFICANT_DIGITS - 1 - magnitude, FIXED_POINT_RATE_DIGITS, _MAX_RATE_DIGITS
+        )
+        self.rates = np.rint(minor_rates * 10.0 ** self.digits).astype(np.int64)
+        self.rates.setflags(write=False)
+        self.digits.setflags(write=False)
+
+    def __contains__(self, currency_code: str) -> bool:
+        return currency_code in self.index
+
+    def convert_minor(self, amounts: np.ndarray, from_currency: str, to_currency: str) -> Optional[np.ndarray]:
+        """
+        Convert minor-unit amounts between two currencies.
+
+        Args:
+            amounts (np.ndarray): int64 amounts in from_currency minor units
+            from_currency (str): Source currency code
+            to_currency (str): Target currency code
+
+        Returns:
+            Optional[np.ndarray]: Amounts in to_currency minor units (int64, or
+            Python ints if any overflows int64), or None
+        """
+        i = self.index.get(from_currency)
+        j = self.index.get(to_currency)
+        if i is None or j is None:
+            return None
+        return multiply_scaled(amounts, self.rates[i, j], self.digits[i, j])
+
+    def convert_amount(self, amount: float, from_currency: str, to_currency: str) -> Optional[float]:
+        """
+        Convert a single major-unit amount, using Python integers.
+
+        Gives the same result as the vectorized path without NumPy's
+        per-call overhead.
+
+        Args:
+            amount (float): Amount in from_currency major units
+            from_currency (str): Source currency code
+            to_currency (str): Target currency code
+
+        Returns:
+            Optional[float]: Amount in to_currency major units, or None
+        """
+        i = self.index.get(from_currency)
+        j = self.index.get(to_currency)
+        if i is None or j is None:
+            return None
+
+        minor = round(round(amount * 10 ** int(self.minor[i]), _PARSE_DECIMALS))
+        quotient = _round_scaled(abs(minor) * int(self.rates[i, j]), int(self.digits[i, j]))
+        return (quotient if minor >= 0 else -quotient) / 10 ** int(self.minor[j])
+
+    def convert_outer(
+        self,
+        amounts: np.ndarray,
+        from_currency: str,
+        to_currencies: Iterable[str]
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        Convert minor-unit amounts to many currencies at once.
+
+        Args:
+            amounts (np.ndarray): int64 amounts in from_currency minor units
+            from_currency (str): Source currency code
+            to_currencies (Iterable[str]): Target currency codes
+
+        Returns:
+            Tuple[List[str], np.ndarray]: Known target codes and an
+            amounts × targets grid of target minor units (int64, or Python
+            ints if any result overflows int64)
+        """
+        i = self.index.get(from_currency)
+        targets = [code for code in to_currencies if code in self.index] if i is not None else []
+        columns = np.fromiter((self.index[code] for code in targets), dtype=np.intp, count=len(targets))
+        amounts = np.asarray(amounts, dtype=np.int64).reshape(-1)
+        if i is None:
+            return targets, np.empty((len(amounts), 0), dtype=np.int64)
+        return targets, multiply_scaled(
+            amounts[:, np.newaxis], self.rates[i, columns][np.newaxis, :], self.digits[i, columns][np.newaxis, :]
+        )
+
+    def convert_rows(self, amounts: np.ndarray, from_rows: np.ndarray, to_currency: str) -> np.ndarray:
+        """
+        Convert float amounts that each have their own source currency.
+
+        Args:
+            amounts (np.ndarray): float64 major-unit amounts; NaN is passed through
+            from_rows (np.ndarray): Row index of each amount's source currency,
+                len(codes) for an unknown currency
+            to_currency (str): Target currency code
+
+        Returns:
+            np.ndarray: float64 major-unit results, NaN where the amount or currency is unknown
+        """
+        j = self.index[to_currency]
+        known = (from_rows < len(self.codes)) & np.isfinite(amounts)
+        rows = from_rows[known]
+
+        scale = 10.0 ** self.minor[rows]
+        minor = np.rint(np.round(amounts[known] * scale, _PARSE_DECIMALS)).astype(np.int64)
+
+        result = np.full(len(amounts), np.nan)
+        result[known] = multiply_scaled(minor, self.rates[rows, j], self.digits[rows, j]) / 10 ** int(self.minor[j])
+        return result
+
+
+def get_fixed_point_rates(rate_matrix: RateMatrix) -> FixedPointRates:
+    """
+    Get fixed-point rates for a rate matrix, building them once per payload.
+
+    Args:
+        rate_matrix (RateMatrix): Cross rates to convert
+
+    Returns:
+        FixedPointRates: Fixed-point rates for the same currencies
+    """
+    key = (rate_matrix.base, rate_matrix.timestamp, rate_matrix.codes)
+    fixed_rates = _fixed_rates_cache.get(key)
+    if fixed_rates is None:
+        fixed_rates = FixedPointRates(rate_matrix)
+        # Only the latest payload's rates are kept
+        _fixed_rates_cache.clear()
+        _fixed_rates_cache[key] = fixed_rates
+    return fixed_rates
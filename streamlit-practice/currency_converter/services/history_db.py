@@ -0,0 +1,515 @@
+"""
+Durable conversion history backed by SQLite in WAL mode.
+Records are scoped by owner; writes are batched; reads are indexed, keyset-paginated and pre-aggregated per day.
+"""
+
+import atexit
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, Tuple
+import sys
+
+import numpy as np
+
+# Add parent directory to path for imports
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
+
+from config.settings import (
+    HISTORY_DB_PATH, HISTORY_BATCH_SIZE, HISTORY_FLUSH_INTERVAL, HISTORY_SESSION_RETENTION, HISTORY_PURGE_INTERVAL
+)
+
+if TYPE_CHECKING:
+    # Only needed to read records back; recording a conversion must not load pandas
+    import pandas as pd
+
+EPOCH = datetime(1970, 1, 1)
+
+# (timestamp, id) of a row, used as a keyset pagination cursor
+Cursor = Tuple[float, int]
+
+# Owners starting with this are anonymous browser sessions; their history expires
+SESSION_OWNER_PREFIX = "session:"
+_SESSION_OWNER_END = "session;"  # First string after every prefixed owner (";" follows ":")
+
+_database: Optional["HistoryDatabase"] = None
+_database_lock = threading.Lock()
+
+
+def _to_epoch(moment: datetime) -> float:
+    """Seconds since the epoch for a naive local datetime, kept in local time."""
+    return (moment - EPOCH).total_seconds()
+
+
+class HistoryFilter:
+    """Optional owner, currency pair and date range restricting history queries."""
+
+    def __init__(
+        self,
+        from_currency: Optional[str] = None,
+        to_currency: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        owner: Optional[str] = None
+    ):
+        """
+        Create a filter; None means unrestricted.
+
+        Args:
+            from_currency (Optional[str]): Source currency code
+            to_currency (Optional[str]): Target currency code
+            start_date (Optional[date]): First day included
+            end_date (Optional[date]): Last day included
+            owner (Optional[str]): Only records of this owner (user or session id)
+        """
+        self.from_currency = from_currency
+        self.to_currency = to_currency
+        self.start_date = start_date
+        self.end_date = end_date
+        self.owner = owner
+
+    def conversions_where(self) -> Tuple[List[str], List]:
+        """SQL conditions and parameters for the conversions table."""
+        conditions, params = self._common_conditions()
+        if self.start_date:
+            conditions.append("ts >= ?")
+            params.append(_to_epoch(datetime.combine(self.start_date, datetime.min.time())))
+        if self.end_date:
+            conditions.append("ts < ?")
+            params.append(_to_epoch(datetime.combine(self.end_date + timedelta(days=1), datetime.min.time())))
+        return conditions, params
+
+    def daily_where(self) -> Tuple[List[str], List]:
+        """SQL conditions and parameters for the daily totals table."""
+        conditions, params = self._common_conditions()
+        if self.start_date:
+            conditions.append("day >= ?")
+            params.append(self.start_date.isoformat())
+        if self.end_date:
+            conditions.append("day <= ?")
+            params.append(self.end_date.isoformat())
+        return conditions, params
+
+    def _common_conditions(self) -> Tuple[List[str], List]:
+        conditions, params = [], []
+        if self.owner is not None:
+            conditions.append("owner = ?")
+            params.append(self.owner)
+        if self.from_currency:
+            conditions.append("from_currency = ?")
+            params.append(self.from_currency)
+        if self.to_currency:
+            conditions.append("to_currency = ?")
+            params.append(self.to_currency)
+        return conditions, params
+
+
+class HistoryDatabase:
+    """Append-only conversion log with batched inserts, one owner per record."""
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = HISTORY_BATCH_SIZE,
+        flush_interval: float = HISTORY_FLUSH_INTERVAL,
+        session_retention: float = HISTORY_SESSION_RETENTION
+    ):
+        """
+        Open (or create) a history database.
+
+        Args:
+            path (str): SQLite database file path
+            batch_size (int): Buffered records that trigger a write
+            flush_interval (float): Seconds after which buffered records are written anyway
+            session_retention (float): Idle seconds after which an anonymous session's
+                records are deleted, swept every HISTORY_PURGE_INTERVAL on flush
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.session_retention = session_retention
+        self._next_purge = 0.0
+        self._buffer: List[Tuple] = []
+        self._buffer_started = 0.0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS conversions (
+                    id INTEGER PRIMARY KEY,
+                    ts REAL NOT NULL,
+                    owner TEXT NOT NULL DEFAULT '',
+                    from_currency TEXT NOT NULL,
+                    to_currency TEXT NOT NULL,
+                    amount REAL NOT NULL,
+                    converted REAL NOT NULL,
+                    rate REAL NOT NULL
+                );
+                """
+            )
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(conversions)")]
+            if "owner" not in columns:
+                # Databases from before owners: keep the old rows, but owned by no one
+                self._conn.executescript(
+                    """
+                    ALTER TABLE conversions ADD COLUMN owner TEXT NOT NULL DEFAULT '';
+                    DROP INDEX IF EXISTS idx_conversions_ts;
+                    DROP INDEX IF EXISTS idx_conversions_pair_ts;
+                    DROP TABLE IF EXISTS daily_totals;
+                    """
+                )
+            self._conn.executescript(
+                """
+                CREATE INDEX IF NOT EXISTS idx_conversions_owner_ts ON conversions (owner, ts);
+                CREATE INDEX IF NOT EXISTS idx_conversions_owner_pair_ts
+                    ON conversions (owner, from_currency, to_currency, ts);
+                CREATE TABLE IF NOT EXISTS daily_totals (
+                    owner TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    from_currency TEXT NOT NULL,
+                    to_currency TEXT NOT NULL,
+                    conversions INTEGER NOT NULL,
+                    amount REAL NOT NULL,
+                    PRIMARY KEY (owner, day, from_currency, to_currency)
+                );
+                """
+            )
+            if "owner" not in columns:
+                self._conn.execute(
+                    """
+                    INSERT INTO daily_totals (owner, day, from_currency, to_currency, conversions, amount)
+                    SELECT owner, date(ts, 'unixepoch'), from_currency, to_currency, COUNT(*), SUM(amount)
+                    FROM conversions GROUP BY 1, 2, 3, 4
+                    """
+                )
+
+    def append(
+        self,
+        from_currency: str,
+        to_currency: str,
+        amount: float,
+        converted_amount: float,
+        rate: float,
+        timestamp: Optional[datetime] = None,
+        owner: str = ""
+    ) -> None:
+        """
+        Buffer a record; the buffer is written once it is full or old enough.
+
+        Args:
+            from_currency (str): Source currency code
+            to_currency (str): Target currency code
+            amount (float): Source amount
+            converted_amount (float): Converted amount
+            rate (float): Exchange rate used
+            timestamp (Optional[datetime]): Conversion time, defaults to now
+            owner (str): User or session the record belongs to
+        """
+        self._buffer_records([
+            (_to_epoch(timestamp or datetime.now()), owner, from_currency, to_currency, amount, converted_amount, rate)
+        ])
+
+    def append_many(
+        self,
+        from_currency: str,
+        to_currencies: Sequence[str],
+        amounts: Sequence[float],
+        converted_amounts: Sequence[float],
+        rates: Sequence[float],
+        timestamp: Optional[datetime] = None,
+        owner: str = ""
+    ) -> None:
+        """
+        Buffer records from one source currency at once, e.g. a bulk conversion.
+
+        Args:
+            from_currency (str): Source currency code of every record
+            to_currencies (Sequence[str]): Target currency code per record
+            amounts (Sequence[float]): Source amount per record
+            converted_amounts (Sequence[float]): Converted amount per record
+            rates (Sequence[float]): Exchange rate per record
+            timestamp (Optional[datetime]): Conversion time of every record, defaults to now
+            owner (str): User or session the records belong to
+        """
+        ts = _to_epoch(timestamp or datetime.now())
+        columns = (
+            np.asarray(values, dtype=np.float64).reshape(-1).tolist()
+            for values in (amounts, converted_amounts, rates)
+        )
+        self._buffer_records([
+            (ts, owner, from_currency, to_currency, amount, converted, rate)
+            for to_currency, amount, converted, rate in zip(to_currencies, *columns)
+        ])
+
+    def _buffer_records(self, records: List[Tuple]) -> None:
+        """Add records to the buffer and write it once it is full or old enough."""
+        if not records:
+            return
+        with self._lock:
+            if not self._buffer:
+                self._buffer_started = time.monotonic()
+            self._buffer.extend(records)
+            due = (
+                len(self._buffer) >= self.batch_size
+                or time.monotonic() - self._buffer_started >= self.flush_interval
+            )
+        if due:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write all buffered records in one transaction.
+
+        Returns:
+            int: Number of records written
+        """
+        with self._lock:
+            records, self._buffer = self._buffer, []
+            if not records:
+                return 0
+
+            daily: Dict[Tuple[str, str, str, str], List] = {}
+            for ts, owner, from_currency, to_currency, amount, _, _ in records:
+                day = (EPOCH + timedelta(seconds=ts)).date().isoformat()
+                totals = daily.setdefault((owner, day, from_currency, to_currency), [0, 0.0])
+                totals[0] += 1
+                totals[1] += amount
+
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO conversions (ts, owner, from_currency, to_currency, amount, converted, rate) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    records,
+                )
+                self._conn.executemany(
+                    """
+                    INSERT INTO daily_totals (owner, day, from_currency, to_currency, conversions, amount)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (owner, day, from_currency, to_currency) DO UPDATE SET
+                        conversions = conversions + excluded.conversions,
+                        amount = amount + excluded.amount
+                    """,
+                    [(*key, count, amount) for key, (count, amount) in daily.items()],
+                )
+
+        if time.monotonic() >= self._next_purge:
+            self._next_purge = time.monotonic() + HISTORY_PURGE_INTERVAL
+            self.purge_sessions(self.session_retention)
+        return len(records)
+
+    def purge_sessions(self, max_idle: float) -> int:
+        """
+        Delete the history of anonymous sessions idle for longer than max_idle.
+
+        Nothing identifies a returning visitor who is not signed in, so once
+        their session is gone its records can never be shown again.
+
+        Args:
+            max_idle (float): Seconds since a session's last conversion
+
+        Returns:
+            int: Number of sessions deleted
+        """
+        cutoff = _to_epoch(datetime.now()) - max_idle
+        with self._lock:
+            active = {record[1] for record in self._buffer}
+            # A range rather than LIKE so the (owner, ts) index is used
+            rows = self._conn.execute(
+                "SELECT owner FROM conversions WHERE owner >= ? AND owner < ? GROUP BY owner HAVING MAX(ts) < ?",
+                (SESSION_OWNER_PREFIX, _SESSION_OWNER_END, cutoff),
+            ).fetchall()
+            expired = [row for row in rows if row[0] not in active]
+            with self._conn:
+                self._conn.executemany("DELETE FROM conversions WHERE owner = ?", expired)
+                self._conn.executemany("DELETE FROM daily_totals WHERE owner = ?", expired)
+        return len(expired)
+
+    def query_page(
+        self,
+        history_filter: HistoryFilter,
+        page_size: int,
+        before: Optional[Cursor] = None,
+        after: Optional[Cursor] = None
+    ) -> "pd.DataFrame":
+        """
+        Fetch one page of records, newest first, using keyset pagination.
+
+        Args:
+            history_filter (HistoryFilter): Owner, pair and date restrictions
+            page_size (int): Maximum records returned
+            before (Optional[Cursor]): Return records older than this cursor
+            after (Optional[Cursor]): Return records newer than this cursor
+
+        Returns:
+            pd.DataFrame: id, ts (cursor value), Timestamp, From, To, Amount,
+            Converted and Rate columns
+        """
+        self.flush()
+        conditions, params = history_filter.conversions_where()
+        order = "DESC"
+        if before:
+            conditions.append("(ts, id) < (?, ?)")
+            params.extend(before)
+        elif after:
+            conditions.append("(ts, id) > (?, ?)")
+            params.extend(after)
+            order = "ASC"
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        sql = (
+            "SELECT id, ts, from_currency, to_currency, amount, converted, rate FROM conversions "
+            f"{where} ORDER BY ts {order}, id {order} LIMIT ?"
+        )
+        with self._lock:
+            rows = self._conn.execute(sql, (*params, page_size)).fetchall()
+
+        if order == "ASC":
+            rows.reverse()
+
+        import pandas as pd
+
+        page = pd.DataFrame(rows, columns=["id", "ts", "From", "To", "Amount", "Converted", "Rate"])
+        page.insert(2, "Timestamp", pd.to_datetime(page["ts"], unit="s"))
+        return page
+
+    def iter_chunks(self, history_filter: HistoryFilter, chunk_size: int) -> Iterator["pd.DataFrame"]:
+        """
+        Scan all matching records in bounded DataFrames, oldest first.
+
+        Each chunk is a separate keyset query, so the lock is never held for
+        the whole scan and memory stays bounded by chunk_size.
+
+        Args:
+            history_filter (HistoryFilter): Owner, pair and date restrictions
+            chunk_size (int): Maximum records per chunk
+
+        Yields:
+            pd.DataFrame: Timestamp, From, To, Amount, Converted and Rate columns
+        """
+        import pandas as pd
+
+        self.flush()
+        base_conditions, base_params = history_filter.conversions_where()
+        cursor: Optional[Cursor] = None
+
+        while True:
+            conditions, params = list(base_conditions), list(base_params)
+            if cursor:
+                conditions.append("(ts, id) > (?, ?)")
+                params.extend(cursor)
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT id, ts, from_currency, to_currency, amount, converted, rate FROM conversions "
+                    f"{where} ORDER BY ts, id LIMIT ?",
+                    (*params, chunk_size),
+                ).fetchall()
+            if not rows:
+                return
+
+            cursor = (rows[-1][1], rows[-1][0])
+            chunk = pd.DataFrame(rows, columns=["id", "ts", "From", "To", "Amount", "Converted", "Rate"])
+            chunk.insert(2, "Timestamp", pd.to_datetime(chunk["ts"], unit="s"))
+            yield chunk.drop(columns=["id", "ts"])
+
+            if len(rows) < chunk_size:
+                return
+
+    def summarize(self, history_filter: HistoryFilter) -> Dict[str, float]:
+        """
+        Aggregate statistics from the per-day totals, independent of row count.
+
+        Args:
+            history_filter (HistoryFilter): Owner, pair and date restrictions
+
+        Returns:
+            Dict[str, float]: total_count, total_amount, unique_from and unique_to
+        """
+        self.flush()
+        conditions, params = history_filter.daily_where()
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COALESCE(SUM(conversions), 0), COALESCE(SUM(amount), 0), "
+                f"COUNT(DISTINCT from_currency), COUNT(DISTINCT to_currency) FROM daily_totals {where}",
+                params,
+            ).fetchone()
+        return {
+            "total_count": row[0],
+            "total_amount": row[1],
+            "unique_from": row[2],
+            "unique_to": row[3],
+        }
+
+    def currencies(self, owner: Optional[str] = None) -> List[str]:
+        """
+        Currencies that appear in the history, read from the per-day totals.
+
+        Args:
+            owner (Optional[str]): Only this owner's history, None for everyone's
+
+        Returns:
+            List[str]: Sorted currency codes, as source or target
+        """
+        self.flush()
+        where, params = ("WHERE owner = ?", (owner,)) if owner is not None else ("", ())
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT from_currency FROM daily_totals {where} "
+                f"UNION SELECT to_currency FROM daily_totals {where} ORDER BY 1",
+                params * 2,
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def clear(self, owner: Optional[str] = None) -> None:
+        """
+        Delete records and totals.
+
+        Args:
+            owner (Optional[str]): Only delete this owner's history, None for everyone's
+        """
+        where, params = ("WHERE owner = ?", (owner,)) if owner is not None else ("", ())
+        with self._lock:
+            self._buffer = [record for record in self._buffer if owner is not None and record[1] != owner]
+            with self._conn:
+                self._conn.execute(f"DELETE FROM conversions {where}", params)
+                self._conn.execute(f"DELETE FROM daily_totals {where}", params)
+
+    def close(self) -> None:
+        """Write pending records and close the connection."""
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+
+def get_history_database() -> HistoryDatabase:
+    """
+    Get the process-wide history database, opening it on first use.
+
+    The file holds every owner's records; pass an owner to reads and clear.
+
+    Returns:
+        HistoryDatabase: Shared database
+    """
+    global _database
+
+    if _database is None:
+        with _database_lock:
+            if _database is None:
+                _database = HistoryDatabase(HISTORY_DB_PATH)
+                atexit.register(_database.flush)
+    return _database
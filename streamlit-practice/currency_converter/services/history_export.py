@@ -0,0 +1,124 @@
+"""
+Service module for exporting conversion history.
+Writes history chunk by chunk into compressed files produced only on request.
+"""
+
+import gzip
+import tempfile
+from typing import BinaryIO, Dict, Iterable, Tuple
+
+import pandas as pd
+
+# Display label -> (file extension, MIME type)
+EXPORT_FORMATS: Dict[str, Tuple[str, str]] = {
+    "Gzip CSV": ("csv.gz", "application/gzip"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+}
+
+EXPORT_COLUMNS = ("Timestamp", "From", "To", "Amount", "Converted", "Rate")
+CSV_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class HistoryExportService:
+    """Service class for streaming history records into export files."""
+
+    @staticmethod
+    def write_csv_gz(chunks: Iterable[pd.DataFrame], output: BinaryIO) -> int:
+        """
+        Write record chunks as one gzip-compressed CSV.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): Timestamp/From/To/Amount/Converted/Rate chunks
+            output (BinaryIO): Binary file to write to
+
+        Returns:
+            int: Number of records written
+        """
+        rows = 0
+        with gzip.GzipFile(fileobj=output, mode="wb", compresslevel=6) as compressed:
+            for chunk in chunks:
+                # One encoded block per chunk; many small writes make gzip slow
+                csv = chunk.to_csv(header=rows == 0, index=False, date_format=CSV_DATE_FORMAT)
+                compressed.write(csv.encode("utf-8"))
+                rows += len(chunk)
+            if rows == 0:
+                compressed.write((",".join(EXPORT_COLUMNS) + "\n").encode("utf-8"))
+        return rows
+
+    @staticmethod
+    def write_parquet(chunks: Iterable[pd.DataFrame], output: BinaryIO) -> int:
+        """
+        Write record chunks as one Parquet file, one row group per chunk.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): Timestamp/From/To/Amount/Converted/Rate chunks
+            output (BinaryIO): Binary file to write to
+
+        Returns:
+            int: Number of records written
+        """
+        # pyarrow ships with Streamlit; imported lazily as only exports need it
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.schema([
+            ("Timestamp", pa.timestamp("us")),
+            ("From", pa.string()),
+            ("To", pa.string()),
+            ("Amount", pa.float64()),
+            ("Converted", pa.float64()),
+            ("Rate", pa.float64()),
+        ])
+
+        rows = 0
+        with pq.ParquetWriter(output, schema, compression="zstd") as writer:
+            for chunk in chunks:
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False, safe=False))
+                rows += len(chunk)
+        return rows
+
+    @staticmethod
+    def export(chunks: Iterable[pd.DataFrame], export_format: str) -> BinaryIO:
+        """
+        Export record chunks to a temporary file.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): Timestamp/From/To/Amount/Converted/Rate chunks
+            export_format (str): Key of EXPORT_FORMATS
+
+        Returns:
+            BinaryIO: Temporary file positioned at the start; deleted once closed
+        """
+        writers = {
+            "Gzip CSV": HistoryExportService.write_csv_gz,
+            "Parquet": HistoryExportService.write_parquet,
+        }
+        if export_format not in writers:
+            raise ValueError(f"Unsupported export format: {export_format}")
+
+        output = tempfile.TemporaryFile()
+        try:
+            writers[export_format](chunks, output)
+        except Exception:
+            output.close()
+            raise
+        output.seek(0)
+        return output
+
+    @staticmethod
+    def export_bytes(chunks: Iterable[pd.DataFrame], export_format: str) -> bytes:
+        """
+        Export record chunks and return the file contents.
+
+        The temporary file is closed, and so deleted, before returning; use this
+        where the caller needs the data itself, such as a download button.
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): Timestamp/From/To/Amount/Converted/Rate chunks
+            export_format (str): Key of EXPORT_FORMATS
+
+        Returns:
+            bytes: The exported file
+        """
+        with HistoryExportService.export(chunks, export_format) as output:
+            return output.read()
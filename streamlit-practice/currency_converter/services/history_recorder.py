@@ -0,0 +1,82 @@
+"""
+Recording conversions in the visitor's history.
+Kept free of pandas and the export stack so pages that only record conversions start quickly.
+"""
+
+import uuid
+from typing import Sequence
+import sys
+import os
+
+import streamlit as st
+
+# Add parent directory to path for imports
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
+
+from config.settings import HISTORY_MAX_ENTRIES, HISTORY_DB_ENABLED
+from services.history_db import SESSION_OWNER_PREFIX, get_history_database
+from services.history_store import HistoryStore
+
+
+def initialize_history():
+    """Initialize history in session state if not exists."""
+    if "conversion_history" not in st.session_state:
+        st.session_state.conversion_history = HistoryStore(HISTORY_MAX_ENTRIES)
+
+
+def history_owner():
+    """
+    Owner of the durable history records of this visitor.
+    
+    The signed-in user's email when authentication is configured, otherwise
+    an id for this browser session, so visitors never see each other's
+    conversions. Session history is deleted once the session has been idle
+    for HISTORY_SESSION_RETENTION.
+    
+    Returns:
+        str: Owner id
+    """
+    if st.user.get("is_logged_in") and st.user.get("email"):
+        return st.user.get("email")
+    if "history_owner" not in st.session_state:
+        st.session_state.history_owner = f"{SESSION_OWNER_PREFIX}{uuid.uuid4().hex}"
+    return st.session_state.history_owner
+
+
+def add_to_history(from_currency, to_currency, amount, converted_amount, rate):
+    """Add conversion to history."""
+    if HISTORY_DB_ENABLED:
+        get_history_database().append(
+            from_currency, to_currency, amount, converted_amount, rate, owner=history_owner()
+        )
+        return
+    initialize_history()
+    st.session_state.conversion_history.add(from_currency, to_currency, amount, converted_amount, rate)
+
+
+def add_many_to_history(
+    from_currency: str,
+    to_currencies: Sequence[str],
+    amounts: Sequence[float],
+    converted_amounts: Sequence[float],
+    rates: Sequence[float]
+):
+    """
+    Add many conversions from one source currency to history in one batch.
+    
+    Args:
+        from_currency (str): Source currency code of every conversion
+        to_currencies (Sequence[str]): Target currency code per conversion
+        amounts (Sequence[float]): Source amount per conversion
+        converted_amounts (Sequence[float]): Converted amount per conversion
+        rates (Sequence[float]): Exchange rate per conversion
+    """
+    if HISTORY_DB_ENABLED:
+        get_history_database().append_many(
+            from_currency, to_currencies, amounts, converted_amounts, rates, owner=history_owner()
+        )
+        return
+    initialize_history()
+    st.session_state.conversion_history.add_many(from_currency, to_currencies, amounts, converted_amounts, rates)
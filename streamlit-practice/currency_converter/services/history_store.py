@@ -0,0 +1,249 @@
+"""
+Columnar, bounded store for conversion history.
+Keeps records in preallocated typed arrays with O(1) running statistics.
+"""
+
+from collections import Counter
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+if TYPE_CHECKING:
+    # Only needed to read records back; recording a conversion must not load pandas
+    import pandas as pd
+
+
+class HistoryStore:
+    """Ring buffer of conversion records stored column by column."""
+
+    def __init__(self, capacity: int):
+        """
+        Create an empty history store.
+
+        Args:
+            capacity (int): Maximum records kept; the oldest are evicted first
+        """
+        self.capacity = max(int(capacity), 1)
+        self._timestamps = np.empty(self.capacity, dtype="datetime64[us]")
+        self._from = np.empty(self.capacity, dtype=np.int16)
+        self._to = np.empty(self.capacity, dtype=np.int16)
+        self._amounts = np.empty(self.capacity, dtype=np.float64)
+        self._converted = np.empty(self.capacity, dtype=np.float64)
+        self._rates = np.empty(self.capacity, dtype=np.float64)
+        self._codes: List[str] = []
+        self._code_index: Dict[str, int] = {}
+        self._start = 0
+        self._size = 0
+        self._from_counts = Counter()
+        self._to_counts = Counter()
+        self._total_amount = 0.0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def total_count(self) -> int:
+        """Number of records currently held."""
+        return self._size
+
+    @property
+    def unique_from_count(self) -> int:
+        """Number of distinct source currencies currently held."""
+        return len(self._from_counts)
+
+    @property
+    def unique_to_count(self) -> int:
+        """Number of distinct target currencies currently held."""
+        return len(self._to_counts)
+
+    @property
+    def total_amount(self) -> float:
+        """Sum of source amounts currently held."""
+        return self._total_amount
+
+    def _intern(self, currency_code: str) -> int:
+        """Map a currency code to a small integer id."""
+        code_id = self._code_index.get(currency_code)
+        if code_id is None:
+            code_id = len(self._codes)
+            self._codes.append(currency_code)
+            self._code_index[currency_code] = code_id
+        return code_id
+
+    def add(
+        self,
+        from_currency: str,
+        to_currency: str,
+        amount: float,
+        converted_amount: float,
+        rate: float,
+        timestamp: Optional[datetime] = None
+    ) -> None:
+        """
+        Append a record, evicting the oldest one when full.
+
+        Args:
+            from_currency (str): Source currency code
+            to_currency (str): Target currency code
+            amount (float): Source amount
+            converted_amount (float): Converted amount
+            rate (float): Exchange rate used
+            timestamp (Optional[datetime]): Conversion time, defaults to now
+        """
+        if self._size == self.capacity:
+            self._evict_oldest()
+
+        position = (self._start + self._size) % self.capacity
+        self._timestamps[position] = np.datetime64(timestamp or datetime.now(), "us")
+        self._from[position] = self._intern(from_currency)
+        self._to[position] = self._intern(to_currency)
+        self._amounts[position] = amount
+        self._converted[position] = converted_amount
+        self._rates[position] = rate
+        self._size += 1
+
+        self._from_counts[from_currency] += 1
+        self._to_counts[to_currency] += 1
+        self._total_amount += amount
+
+    def add_many(
+        self,
+        from_currency: str,
+        to_currencies: Sequence[str],
+        amounts: Sequence[float],
+        converted_amounts: Sequence[float],
+        rates: Sequence[float],
+        timestamp: Optional[datetime] = None
+    ) -> None:
+        """
+        Append records from one source currency at once, evicting the oldest as needed.
+
+        Columns are written with slice assignment rather than record by record.
+        If there are more records than capacity, only the last capacity are kept.
+
+        Args:
+            from_currency (str): Source currency code of every record
+            to_currencies (Sequence[str]): Target currency code per record
+            amounts (Sequence[float]): Source amount per record
+            converted_amounts (Sequence[float]): Converted amount per record
+            rates (Sequence[float]): Exchange rate per record
+            timestamp (Optional[datetime]): Conversion time of every record, defaults to now
+        """
+        amounts = np.asarray(amounts, dtype=np.float64).reshape(-1)
+        keep = slice(max(len(amounts) - self.capacity, 0), None)
+        to_currencies = list(to_currencies)[keep]
+        amounts = amounts[keep]
+        converted_amounts = np.asarray(converted_amounts, dtype=np.float64).reshape(-1)[keep]
+        rates = np.asarray(rates, dtype=np.float64).reshape(-1)[keep]
+        from_id = self._intern(from_currency)
+        to_ids = np.fromiter((self._intern(code) for code in to_currencies), dtype=np.int16, count=len(to_currencies))
+        count = len(amounts)
+        if not count:
+            return
+
+        overflow = self._size + count - self.capacity
+        if overflow > 0:
+            self._evict(overflow)
+
+        first = (self._start + self._size) % self.capacity
+        head = min(count, self.capacity - first)
+        columns = (
+            (self._timestamps, np.datetime64(timestamp or datetime.now(), "us")),
+            (self._from, from_id),
+            (self._to, to_ids),
+            (self._amounts, amounts),
+            (self._converted, converted_amounts),
+            (self._rates, rates),
+        )
+        for column, values in columns:
+            values = np.broadcast_to(values, count)
+            column[first:first + head] = values[:head]
+            column[:count - head] = values[head:]
+        self._size += count
+
+        self._from_counts[from_currency] += count
+        self._to_counts.update(to_currencies)
+        self._total_amount += float(amounts.sum())
+
+    def _evict(self, count: int) -> None:
+        """Drop the count oldest records and back them out of the statistics."""
+        positions = (self._start + np.arange(count)) % self.capacity
+        for counts, column in ((self._from_counts, self._from), (self._to_counts, self._to)):
+            code_ids, occurrences = np.unique(column[positions], return_counts=True)
+            for code_id, occurrence in zip(code_ids, occurrences):
+                code = self._codes[code_id]
+                counts[code] -= int(occurrence)
+                if counts[code] <= 0:
+                    del counts[code]
+        self._total_amount -= float(self._amounts[positions].sum())
+        self._start = (self._start + count) % self.capacity
+        self._size -= count
+
+    def _evict_oldest(self) -> None:
+        """Drop the oldest record and back it out of the statistics."""
+        position = self._start
+        for counts, code_id in ((self._from_counts, self._from[position]), (self._to_counts, self._to[position])):
+            code = self._codes[code_id]
+            counts[code] -= 1
+            if counts[code] == 0:
+                del counts[code]
+        self._total_amount -= self._amounts[position]
+        self._start = (self._start + 1) % self.capacity
+        self._size -= 1
+
+    def clear(self) -> None:
+        """Remove all records."""
+        self._start = 0
+        self._size = 0
+        self._from_counts.clear()
+        self._to_counts.clear()
+        self._total_amount = 0.0
+
+    def _ordered(self, column: np.ndarray) -> np.ndarray:
+        """Get a column's held values, oldest first."""
+        end = self._start + self._size
+        if end <= self.capacity:
+            return column[self._start:end]
+        return np.concatenate((column[self._start:], column[:end - self.capacity]))
+
+    def _frame(self, select) -> "pd.DataFrame":
+        """Build a records DataFrame from the columns picked out by select."""
+        import pandas as pd
+
+        codes = np.asarray(self._codes or [""], dtype=object)
+        return pd.DataFrame({
+            "Timestamp": select(self._timestamps),
+            "From": codes[select(self._from)],
+            "To": codes[select(self._to)],
+            "Amount": select(self._amounts),
+            "Converted": select(self._converted),
+            "Rate": select(self._rates),
+        })
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        """
+        Get all held records as a DataFrame, oldest first.
+
+        Returns:
+            pd.DataFrame: Timestamp, From, To, Amount, Converted and Rate columns
+        """
+        return self._frame(self._ordered)
+
+    def iter_chunks(self, chunk_size: int) -> Iterator["pd.DataFrame"]:
+        """
+        Get held records in bounded DataFrames, oldest first.
+
+        Only one chunk is materialised at a time, so exporting a full store
+        needs memory for chunk_size records rather than the whole history.
+
+        Args:
+            chunk_size (int): Maximum records per chunk
+
+        Yields:
+            pd.DataFrame: Timestamp, From, To, Amount, Converted and Rate columns
+        """
+        for offset in range(0, self._size, chunk_size):
+            stop = min(offset + chunk_size, self._size)
+            positions = (self._start + np.arange(offset, stop)) % self.capacity
+            yield self._frame(lambda column: column[positions])
@@ -0,0 +1,411 @@
+"""
+In-process metrics for rate fetches, the rate cache, conversions and page renders.
+Counters and histograms rendered in the Prometheus text format; with METRICS_ENABLED off every hook is a no-op.
+"""
+
+import bisect
+import contextvars
+import functools
+import logging
+import os
+import threading
+import time
+from contextlib import nullcontext
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import sys
+
+# Add parent directory to path for imports
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
+
+from config.settings import METRICS_ENABLED, METRICS_EXPORT_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; covers sub-millisecond conversions up to slow upstream fetches
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+# Collector output: (label dict, value) samples for one metric
+Samples = Iterable[Tuple[Dict[str, str], float]]
+
+_NULL_TIMER = nullcontext()
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    """Monotonic counter, one series per label combination."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (), enabled: bool = True):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.enabled = enabled
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        """
+        Add to the counter.
+
+        Args:
+            *labelvalues (str): One value per label name, in order
+            amount (float): Increment
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def values(self) -> Dict[LabelValues, float]:
+        """Current value of every series, by label values."""
+        with self._lock:
+            return dict(self._values)
+
+    def render(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in sorted(self.values().items())
+        ]
+
+
+class Histogram:
+    """Cumulative-bucket histogram, one series per label combination."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+        enabled: bool = True
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        self.enabled = enabled
+        # labels -> [per-bucket counts (+Inf last), sum, count]
+        self._series: Dict[LabelValues, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """
+        Record one observation.
+
+        Args:
+            value (float): Observed value, e.g. seconds
+            *labelvalues (str): One value per label name, in order
+        """
+        if not self.enabled:
+            return
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = self._series[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def time(self, *labelvalues: str):
+        """Context manager observing the seconds its block takes."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, labelvalues)
+
+    def values(self) -> Dict[LabelValues, Tuple[List[int], float, int]]:
+        """(per-bucket counts, sum, count) of every series, by label values."""
+        with self._lock:
+            return {labels: (list(counts), total, count) for labels, (counts, total, count) in self._series.items()}
+
+    def quantile(self, q: float, *labelvalues: str) -> Optional[float]:
+        """
+        Estimate a quantile from the buckets, as Prometheus' histogram_quantile does.
+
+        Args:
+            q (float): Quantile between 0 and 1
+            *labelvalues (str): Series to read
+
+        Returns:
+            Optional[float]: Estimated value, or None if the series is empty
+        """
+        series = self.values().get(labelvalues)
+        if not series or not series[2]:
+            return None
+        counts, _, total = series
+        rank = q * total
+        cumulative = 0
+        lower = 0.0
+        for index, count in enumerate(counts):
+            if cumulative + count >= rank and count:
+                if index == len(self.buckets):
+                    return self.buckets[-1]
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+            lower = self.buckets[index] if index < len(self.buckets) else lower
+        return self.buckets[-1]
+
+    def render(self) -> List[str]:
+        lines = []
+        bucket_names = (*self.labelnames, "le")
+        for labels, (counts, total, count) in sorted(self.values().items()):
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, float("inf")), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{self.name}_bucket{_format_labels(bucket_names, (*labels, le))} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {count}")
+        return lines
+
+
+class _Timer:
+    """Observes elapsed seconds into a histogram on exit."""
+
+    __slots__ = ("histogram", "labelvalues", "start")
+
+    def __init__(self, histogram: Histogram, labelvalues: LabelValues):
+        self.histogram = histogram
+        self.labelvalues = labelvalues
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.start, *self.labelvalues)
+
+
+class MetricsRegistry:
+    """Holds every metric and renders them for scraping."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._metrics: List = []
+        self._collectors: List[Tuple[str, str, str, Callable[[], Samples]]] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        metric = Counter(name, documentation, labelnames, enabled=self.enabled)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets, enabled=self.enabled)
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, name: str, documentation: str, kind: str, collect: Callable[[], Samples]) -> None:
+        """
+        Add a metric whose samples are read only when rendering.
+
+        Used for state other components already count (e.g. cache stats), so
+        their hot paths need no extra hooks.
+
+        Args:
+            name (str): Metric name
+            documentation (str): HELP text
+            kind (str): "counter" or "gauge"
+            collect (Callable[[], Samples]): Returns (labels, value) samples
+        """
+        if self.enabled:
+            self._collectors.append((name, documentation, kind, collect))
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: Exposition text, empty when metrics are disabled
+        """
+        lines = []
+        for metric in self._metrics:
+            samples = metric.render()
+            if samples:
+                lines += [f"# HELP {metric.name} {metric.documentation}", f"# TYPE {metric.name} {metric.kind}", *samples]
+
+        for name, documentation, kind, collect in self._collectors:
+            try:
+                samples = list(collect())
+            except Exception:
+                logger.warning("Metrics collector %s failed", name, exc_info=True)
+                continue
+            lines += [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+            for labels, value in samples:
+                lines.append(f"{name}{_format_labels(tuple(labels), tuple(labels.values()))} {_format_value(value)}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+REGISTRY = MetricsRegistry(enabled=METRICS_ENABLED)
+
+FETCH_SECONDS = REGISTRY.histogram(
+    "currency_rate_fetch_seconds", "Upstream exchange rate fetch latency", ("base",)
+)
+ERRORS = REGISTRY.counter(
+    "currency_errors_total", "Errors by where they happened and exception type", ("source", "type")
+)
+# Its _count series doubles as the conversion counter, so calls pay for one update
+CONVERSION_SECONDS = REGISTRY.histogram(
+    "currency_conversion_seconds", "Conversion call duration by page or client and kind", ("source", "kind")
+)
+PAGE_RENDER_SECONDS = REGISTRY.histogram(
+    "currency_page_render_seconds", "Page and fragment render duration", ("page",)
+)
+API_REQUESTS = REGISTRY.counter(
+    "currency_api_requests_total", "JSON API requests by route and status", ("route", "status")
+)
+API_REQUEST_SECONDS = REGISTRY.histogram(
+    "currency_api_request_seconds", "JSON API request handling duration", ("route",)
+)
+PROVIDER_REQUESTS = REGISTRY.counter(
+    "currency_provider_requests_total", "Requests to each rate provider by outcome (ok, error)", ("provider", "outcome")
+)
+PROVIDER_REQUEST_SECONDS = REGISTRY.histogram(
+    "currency_provider_request_seconds", "Latency of successful rate provider requests, including hedged ones that lost", ("provider",)
+)
+PROVIDER_HEDGES = REGISTRY.counter(
+    "currency_provider_hedges_total", "Hedged requests sent to a provider because the one before it was slow", ("provider",)
+)
+
+# Page or client the current conversion is made for; set by instrument_page and the API
+_source: contextvars.ContextVar = contextvars.ContextVar("metrics_source", default="other")
+
+
+def current_source() -> str:
+    """Page or client label for metrics recorded in this context."""
+    return _source.get()
+
+
+def set_source(source: str) -> contextvars.Token:
+    """Label metrics recorded in this context with a page or client name."""
+    return _source.set(source)
+
+
+def instrument_page(page: str) -> Callable:
+    """
+    Decorate a page (or fragment) render function to time it and label its conversions.
+
+    Nested instrumented renders of the same page (a fragment inside its page)
+    are only timed once. Returns the function unchanged when metrics are disabled.
+
+    Args:
+        page (str): Page label, e.g. "converter"
+    """
+    def decorator(func: Callable) -> Callable:
+        if not REGISTRY.enabled:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _source.get() == page:
+                return func(*args, **kwargs)
+            token = _source.set(page)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                PAGE_RENDER_SECONDS.observe(time.perf_counter() - start, page)
+                _source.reset(token)
+        return wrapper
+    return decorator
+
+
+def instrument_conversion(kind: str) -> Callable:
+    """
+    Decorate a conversion function to count and time its calls per source.
+
+    Returns the function unchanged when metrics are disabled.
+
+    Args:
+        kind (str): Conversion kind label, e.g. "single" or "batch"
+    """
+    def decorator(func: Callable) -> Callable:
+        if not REGISTRY.enabled:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                CONVERSION_SECONDS.observe(time.perf_counter() - start, _source.get(), kind)
+        return wrapper
+    return decorator
+
+
+class MetricsFileExporter:
+    """Periodically writes the exposition text to a file, e.g. for node_exporter's textfile collector."""
+
+    def __init__(self, path: str, interval: float = METRICS_EXPORT_INTERVAL, registry: MetricsRegistry = REGISTRY):
+        """
+        Create a file exporter (call start() to begin writing).
+
+        Args:
+            path (str): Destination file, replaced atomically on every write
+            interval (float): Seconds between writes
+            registry (MetricsRegistry): Metrics to export
+        """
+        self.path = path
+        self.interval = interval
+        self.registry = registry
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def write(self) -> None:
+        """Write the current metrics once."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(self.registry.render())
+        os.replace(temp_path, self.path)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.write()
+            except OSError:
+                logger.warning("Could not write metrics to %s", self.path, exc_info=True)
+
+    def start(self) -> "MetricsFileExporter":
+        """Write in a background thread every interval."""
+        self._thread = threading.Thread(target=self._run, name="metrics-exporter", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop writing, after one final write."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        self.write()
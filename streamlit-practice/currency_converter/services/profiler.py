@@ -0,0 +1,369 @@
+"""
+Opt-in per-rerun profiler for the Streamlit app.
+Records timing spans for each rerun as a Chrome trace; slow reruns also keep cProfile stats and sampled stacks (speedscope).
+"""
+
+import contextvars
+import cProfile
+import functools
+import itertools
+import json
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import nullcontext
+from types import CodeType
+from typing import Callable, Dict, List, Optional, Tuple
+import sys
+
+# Add parent directory to path for imports
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
+
+from config.settings import (
+    PROFILING_DIR,
+    PROFILING_MAX_FILES,
+    PROFILING_MODE,
+    PROFILING_QUERY_PARAM,
+    PROFILING_SAMPLE_INTERVAL_MS,
+    PROFILING_SLOW_RERUN_MS,
+)
+
+logger = logging.getLogger(__name__)
+
+PROFILING_MODES = ("off", "query", "always")
+if PROFILING_MODE not in PROFILING_MODES:
+    raise ValueError(f"PROFILING_MODE must be one of {', '.join(PROFILING_MODES)}, got {PROFILING_MODE!r}")
+
+ENABLED = PROFILING_MODE != "off"
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+_NULL_SPAN = nullcontext()
+
+# Rerun being profiled in this script thread, if any
+_active: contextvars.ContextVar = contextvars.ContextVar("profiler_rerun", default=None)
+
+# Keeps file names unique when several sessions finish in the same millisecond
+_sequence = itertools.count()
+
+
+class StackSampler:
+    """Samples one thread's Python stack at a fixed interval from a background thread."""
+
+    def __init__(self, thread_id: int, interval: float):
+        """
+        Create a sampler (call start() to begin sampling).
+
+        Args:
+            thread_id (int): Thread to sample, as returned by threading.get_ident()
+            interval (float): Seconds between samples
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        # (perf_counter time, code objects from the outermost frame inwards)
+        self.samples: List[Tuple[float, Tuple[CodeType, ...]]] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            if stack:
+                stack.reverse()
+                self.samples.append((time.perf_counter(), tuple(stack)))
+
+    def start(self) -> "StackSampler":
+        self._thread = threading.Thread(target=self._run, name="profiler-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+
+class _Span:
+    """Records one named span into a rerun trace on exit."""
+
+    __slots__ = ("trace", "name", "args", "start")
+
+    def __init__(self, trace: "RerunTrace", name: str, args: Dict):
+        self.trace = trace
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.trace.spans.append((self.name, self.start, time.perf_counter(), self.args))
+
+
+class RerunTrace:
+    """
+    Profile of one rerun (or fragment rerun): timing spans, plus cProfile stats
+    and sampled stacks that are kept only when the rerun turns out to be slow.
+
+    Use as a context manager; files are written when it exits.
+    """
+
+    def __init__(self, label: str, directory: str = PROFILING_DIR, slow_ms: float = PROFILING_SLOW_RERUN_MS):
+        """
+        Args:
+            label (str): What is being rerun, e.g. "app" or "converter.panel"
+            directory (str): Where trace files are written
+            slow_ms (float): Reruns at least this slow also get cProfile and speedscope files
+        """
+        self.label = label
+        self.directory = directory
+        self.slow_ms = slow_ms
+        self.args: Dict = {}
+        # (name, start, end, args) in perf_counter seconds
+        self.spans: List[Tuple[str, float, float, Dict]] = []
+        self.thread_id = threading.get_ident()
+        self.profile: Optional[cProfile.Profile] = None
+        self.sampler: Optional[StackSampler] = None
+        self.paths: List[str] = []
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end - self.start) * 1000
+
+    def __enter__(self) -> "RerunTrace":
+        self._token = _active.set(self)
+        self.sampler = StackSampler(self.thread_id, PROFILING_SAMPLE_INTERVAL_MS / 1000).start()
+        self.profile = cProfile.Profile()
+        try:
+            self.profile.enable()
+        except ValueError:
+            # Another profiler is active in this process (e.g. a concurrent session's on Python 3.12+)
+            self.profile = None
+        self.wall_start = time.time()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.end = time.perf_counter()
+        if self.profile:
+            self.profile.disable()
+        self.sampler.stop()
+        _active.reset(self._token)
+        if exc_type is not None:
+            # Includes Streamlit's rerun/stop control-flow exceptions
+            self.args["exit"] = exc_type.__name__
+        try:
+            self.write()
+        except OSError:
+            logger.warning("Could not write profile to %s", self.directory, exc_info=True)
+
+    def chrome_trace(self) -> Dict:
+        """
+        Spans in the Chrome trace event format (chrome://tracing, Perfetto, speedscope).
+
+        Returns:
+            Dict: Trace with one complete event per span, timestamps in µs from the rerun start
+        """
+        pid = os.getpid()
+        events = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": self.thread_id, "args": {"name": "script"}}]
+        root = (f"rerun:{self.label}", self.start, self.end, self.args)
+        for name, start, end, args in (root, *self.spans):
+            events.append({
+                "name": name,
+                "cat": "rerun",
+                "ph": "X",
+                "ts": round((start - self.start) * 1e6, 1),
+                "dur": round((end - start) * 1e6, 1),
+                "pid": pid,
+                "tid": self.thread_id,
+                "args": args,
+            })
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"label": self.label, "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.wall_start))},
+        }
+
+    def speedscope(self) -> Dict:
+        """
+        Sampled stacks in speedscope's file format.
+
+        Returns:
+            Dict: One sampled profile; each sample is weighted by the milliseconds since the previous one
+        """
+        frames: List[Dict] = []
+        frame_index: Dict[CodeType, int] = {}
+        samples: List[List[int]] = []
+        weights: List[float] = []
+        previous = self.start
+        for timestamp, stack in self.sampler.samples:
+            sample = []
+            for code in stack:
+                index = frame_index.get(code)
+                if index is None:
+                    index = frame_index[code] = len(frames)
+                    frames.append({"name": getattr(code, "co_qualname", code.co_name), "file": code.co_filename, "line": code.co_firstlineno})
+                sample.append(index)
+            samples.append(sample)
+            weights.append(round((timestamp - previous) * 1000, 3))
+            previous = timestamp
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": f"rerun:{self.label}",
+            "exporter": "currency_converter",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": f"rerun:{self.label}",
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": round(sum(weights), 3),
+                "samples": samples,
+                "weights": weights,
+            }],
+        }
+
+    def write(self) -> List[str]:
+        """
+        Write this rerun's files to the profile directory.
+
+        Every rerun gets a Chrome trace; slow ones also get a cProfile .prof file
+        and a speedscope file of the sampled stacks.
+
+        Returns:
+            List[str]: Paths written
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.wall_start))
+        name = "-".join(re.sub(r"[^\w.]+", "_", part) for part in (self.label, self.args.get("page")) if part)
+        prefix = os.path.join(self.directory, f"{stamp}-{next(_sequence):04d}-{name}-{self.duration_ms:.0f}ms")
+
+        with open(f"{prefix}.trace.json", "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+        self.paths.append(f"{prefix}.trace.json")
+
+        if self.duration_ms >= self.slow_ms:
+            if self.profile:
+                self.profile.dump_stats(f"{prefix}.prof")
+                self.paths.append(f"{prefix}.prof")
+            with open(f"{prefix}.speedscope.json", "w", encoding="utf-8") as f:
+                json.dump(self.speedscope(), f)
+            self.paths.append(f"{prefix}.speedscope.json")
+
+        prune_profiles(self.directory)
+        return self.paths
+
+
+def prune_profiles(directory: str = PROFILING_DIR, max_files: int = PROFILING_MAX_FILES) -> None:
+    """Delete the oldest profile files beyond max_files (names sort by time)."""
+    names = sorted(name for name in os.listdir(directory) if name.endswith((".json", ".prof")))
+    for name in names[:max(len(names) - max_files, 0)]:
+        try:
+            os.remove(os.path.join(directory, name))
+        except FileNotFoundError:
+            pass
+
+
+def profiling_requested() -> bool:
+    """Whether the current rerun should be profiled, per PROFILING_MODE and the session's query params."""
+    if PROFILING_MODE == "always":
+        return True
+    if PROFILING_MODE == "off":
+        return False
+    import streamlit as st
+    return st.query_params.get(PROFILING_QUERY_PARAM, "") not in ("", "0", "false")
+
+
+def profile_rerun(label: str):
+    """
+    Context manager profiling a rerun when profiling is requested for this session.
+
+    Args:
+        label (str): What is being rerun
+
+    Returns:
+        RerunTrace (or a no-op context yielding None when not profiling, or when
+        a rerun is already being profiled in this thread)
+    """
+    if not ENABLED or _active.get() is not None or not profiling_requested():
+        return _NULL_SPAN
+    return RerunTrace(label)
+
+
+def span(name: str, **args):
+    """
+    Context manager timing a block as a span of the rerun being profiled.
+
+    A no-op when nothing is being profiled, so it can stay in place permanently.
+
+    Args:
+        name (str): Span name
+        **args: Details shown with the span in trace viewers
+    """
+    trace = _active.get()
+    if trace is None:
+        return _NULL_SPAN
+    return _Span(trace, name, args)
+
+
+def annotate_rerun(**args) -> None:
+    """Attach details (e.g. page=...) to the rerun being profiled, if any."""
+    trace = _active.get()
+    if trace is not None:
+        trace.args.update(args)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """
+    Decorate a function to record each call as a span. Returns the function
+    unchanged when PROFILING_MODE is off.
+
+    Args:
+        name (Optional[str]): Span name, the function's qualified name by default
+    """
+    def decorator(func: Callable) -> Callable:
+        if not ENABLED:
+            return func
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            trace = _active.get()
+            if trace is None:
+                return func(*args, **kwargs)
+            with _Span(trace, span_name, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def profiled(label: str) -> Callable:
+    """
+    Decorate a fragment render function: a span when it runs inside a profiled
+    rerun, or its own profiled rerun when the fragment reruns alone. Returns the
+    function unchanged when PROFILING_MODE is off.
+
+    Args:
+        label (str): Span or rerun label, e.g. "converter.panel"
+    """
+    def decorator(func: Callable) -> Callable:
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            trace = _active.get()
+            context = _Span(trace, label, {}) if trace is not None else profile_rerun(label)
+            with context:
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,4 @@
+"""
+Rate providers module.
+Contains interchangeable sources of exchange rate data.
+"""
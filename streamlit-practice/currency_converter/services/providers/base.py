@@ -0,0 +1,37 @@
+"""
+Base interface for exchange rate providers.
+Every provider returns the same raw payload shape so the service can swap them freely.
+"""
+
+from typing import Dict
+
+import requests
+
+
+class ProviderError(requests.exceptions.RequestException):
+    """Raised when a provider cannot supply rates for a base currency."""
+
+
+class RateProvider:
+    """Interface for exchange rate sources."""
+
+    name = "provider"
+
+    def fetch(self, base_currency: str) -> Dict:
+        """
+        Fetch the latest rates for a base currency.
+
+        Args:
+            base_currency (str): The base currency code (e.g., 'USD', 'PKR')
+
+        Returns:
+            Dict: Raw payload with at least "base" and "rates" keys
+
+        Raises:
+            requests.exceptions.RequestException: If the rates cannot be fetched
+            ValueError: If the response is malformed
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release any resources held by the provider."""
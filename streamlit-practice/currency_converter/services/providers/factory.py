@@ -0,0 +1,123 @@
+"""
+Provider selection.
+Builds the configured rate provider and shares it across the process.
+"""
+
+import threading
+import sys
+import os
+from typing import Optional
+
+# Add parent directory to path for imports
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
+
+from config.settings import (
+    API_BASE_URL,
+    OPEN_ER_API_URL,
+    RATE_PROVIDER,
+    RATE_CAPTURE_DIR,
+    REPLAY_LATENCY,
+    STUB_LATENCY,
+    STUB_JITTER,
+    STUB_ERROR_RATE,
+)
+from services.providers.base import RateProvider
+from services.providers.failover import FailoverProvider
+from services.providers.http_provider import HttpRateProvider
+from services.providers.recording import RecordingProvider, ReplayProvider
+from services.providers.stub_server import StubRateServer
+
+PROVIDER_NAMES = ("exchangerate-api", "open-er-api", "stub", "record", "replay")
+
+_provider: Optional[RateProvider] = None
+_provider_lock = threading.Lock()
+
+
+class StubProvider(HttpRateProvider):
+    """HTTP provider backed by an in-process stub server."""
+
+    name = "stub"
+
+    def __init__(self, server: StubRateServer):
+        super().__init__(server.url)
+        self.server = server
+
+    def close(self) -> None:
+        self.server.stop()
+
+
+def create_provider(name: str = RATE_PROVIDER) -> RateProvider:
+    """
+    Build a rate provider by name.
+
+    Args:
+        name (str): One of PROVIDER_NAMES, an http(s) URL of an ExchangeRate-API
+            compatible endpoint, or a comma-separated list of these to fail over in order
+
+    Returns:
+        RateProvider: New provider instance
+
+    Raises:
+        ValueError: If a name is unknown
+    """
+    if "," in name:
+        providers = [create_provider(part.strip()) for part in name.split(",") if part.strip()]
+        return FailoverProvider(providers)
+    if name == "exchangerate-api":
+        provider = HttpRateProvider(API_BASE_URL)
+        provider.name = name
+        return provider
+    if name == "open-er-api":
+        provider = HttpRateProvider(OPEN_ER_API_URL)
+        provider.name = name
+        return provider
+    if name.startswith(("http://", "https://")):
+        provider = HttpRateProvider(name)
+        provider.name = name
+        return provider
+    if name == "stub":
+        server = StubRateServer(latency=STUB_LATENCY, jitter=STUB_JITTER, error_rate=STUB_ERROR_RATE)
+        return StubProvider(server.start())
+    if name == "record":
+        return RecordingProvider(HttpRateProvider(API_BASE_URL), RATE_CAPTURE_DIR)
+    if name == "replay":
+        return ReplayProvider(RATE_CAPTURE_DIR, replay_latency=REPLAY_LATENCY)
+    raise ValueError(
+        f"Unknown rate provider '{name}'. Expected one of: {', '.join(PROVIDER_NAMES)}, "
+        "an http(s) URL, or a comma-separated list of these"
+    )
+
+
+def get_provider() -> RateProvider:
+    """
+    Get the process-wide provider, creating it from settings on first use.
+
+    Returns:
+        RateProvider: Shared provider
+    """
+    global _provider
+
+    if _provider is None:
+        with _provider_lock:
+            if _provider is None:
+                _provider = create_provider()
+    return _provider
+
+
+def set_provider(provider: RateProvider) -> Optional[RateProvider]:
+    """
+    Replace the process-wide provider, e.g. to point benchmarks at a stub.
+
+    Args:
+        provider (RateProvider): Provider to use from now on
+
+    Returns:
+        Optional[RateProvider]: The previous provider, if any
+    """
+    global _provider
+
+    with _provider_lock:
+        previous, _provider = _provider, provider
+    return previous
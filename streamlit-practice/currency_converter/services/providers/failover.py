@@ -0,0 +1,226 @@
+"""
+Failover rate provider.
+Tries an ordered list of providers, hedging slow requests to the next one and cooling down providers that keep failing.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Deque, Dict, List, Optional, Sequence
+import sys
+import os
+
+import requests
+
+# Add parent directory to path for imports
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
+
+from config.settings import (
+    RATE_HEDGE_PERCENTILE,
+    RATE_HEDGE_MIN_DELAY,
+    RATE_HEDGE_MAX_DELAY,
+    RATE_HEDGE_MIN_SAMPLES,
+    RATE_HEDGE_WINDOW,
+    PROVIDER_FAILURE_THRESHOLD,
+    PROVIDER_COOLDOWN,
+)
+from services.metrics import PROVIDER_HEDGES, PROVIDER_REQUEST_SECONDS, PROVIDER_REQUESTS
+from services.providers.base import ProviderError, RateProvider
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderHealth:
+    """Recent latencies and failure streak of one provider."""
+
+    def __init__(self, provider: RateProvider, window: int = RATE_HEDGE_WINDOW):
+        """
+        Args:
+            provider (RateProvider): Provider being tracked
+            window (int): Number of recent successful latencies kept
+        """
+        self.provider = provider
+        self.name = provider.name
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.consecutive_failures = 0
+        self.unhealthy_until = 0.0
+        self._lock = threading.Lock()
+
+    def record_success(self, seconds: float) -> None:
+        with self._lock:
+            self.latencies.append(seconds)
+            self.consecutive_failures = 0
+            self.unhealthy_until = 0.0
+
+    def record_failure(self, threshold: int, cooldown: float) -> None:
+        """
+        Count a failure; at the threshold the provider is unhealthy for the cool-down.
+
+        The streak is only reset by a success, so after a cool-down a single
+        further failure starts the next one.
+        """
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.consecutive_failures >= threshold:
+                if not self.is_healthy():
+                    return
+                self.unhealthy_until = time.monotonic() + cooldown
+                logger.warning(
+                    "Rate provider %s failed %d times in a row; cooling down for %.0fs",
+                    self.name, self.consecutive_failures, cooldown,
+                )
+
+    def is_healthy(self) -> bool:
+        return time.monotonic() >= self.unhealthy_until
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """
+        Recent latency at a percentile.
+
+        Args:
+            percentile (float): Percentile between 0 and 100
+
+        Returns:
+            Optional[float]: Seconds, or None until RATE_HEDGE_MIN_SAMPLES latencies are known
+        """
+        with self._lock:
+            latencies = sorted(self.latencies)
+        if len(latencies) < RATE_HEDGE_MIN_SAMPLES:
+            return None
+        return latencies[min(int(len(latencies) * percentile / 100), len(latencies) - 1)]
+
+
+class FailoverProvider(RateProvider):
+    """
+    Provider over an ordered list of providers.
+
+    The first healthy provider is asked first. If it has not answered within
+    its usual latency (RATE_HEDGE_PERCENTILE of its recent requests, between
+    RATE_HEDGE_MIN_DELAY and RATE_HEDGE_MAX_DELAY), the next one is asked as
+    well and the first valid payload wins. A failure moves on to the next
+    provider at once. Providers in a cool-down are only tried after every
+    healthy one has failed.
+    """
+
+    name = "failover"
+
+    def __init__(
+        self,
+        providers: Sequence[RateProvider],
+        hedge_percentile: float = RATE_HEDGE_PERCENTILE,
+        min_delay: float = RATE_HEDGE_MIN_DELAY,
+        max_delay: float = RATE_HEDGE_MAX_DELAY,
+        failure_threshold: int = PROVIDER_FAILURE_THRESHOLD,
+        cooldown: float = PROVIDER_COOLDOWN
+    ):
+        """
+        Create a failover provider.
+
+        Args:
+            providers (Sequence[RateProvider]): Providers in priority order
+            hedge_percentile (float): Latency percentile after which a request is hedged
+            min_delay (float): Shortest hedge delay in seconds
+            max_delay (float): Longest hedge delay in seconds, also used before enough latencies are known
+            failure_threshold (int): Consecutive failures that start a cool-down
+            cooldown (float): Cool-down length in seconds
+        """
+        if not providers:
+            raise ValueError("FailoverProvider needs at least one provider")
+        self.providers = [ProviderHealth(provider) for provider in providers]
+        self.hedge_percentile = hedge_percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        # Losing requests finish in the background, so allow a few per provider
+        self._executor = ThreadPoolExecutor(max_workers=4 * len(providers), thread_name_prefix="rate-provider")
+
+    def hedge_delay(self, health: ProviderHealth) -> float:
+        """Seconds to wait on a provider before hedging to the next one."""
+        latency = health.percentile(self.hedge_percentile)
+        if latency is None:
+            return self.max_delay
+        return min(max(latency, self.min_delay), self.max_delay)
+
+    def _call(self, health: ProviderHealth, base_currency: str) -> Dict:
+        """Fetch from one provider (in a worker thread), recording its latency or failure."""
+        start = time.perf_counter()
+        try:
+            data = health.provider.fetch(base_currency)
+            if not isinstance(data, dict) or not isinstance(data.get("rates"), dict) or not data["rates"]:
+                raise ValueError("Response contains no rates")
+        except (requests.exceptions.RequestException, ValueError):
+            health.record_failure(self.failure_threshold, self.cooldown)
+            PROVIDER_REQUESTS.inc(health.name, "error")
+            raise
+        elapsed = time.perf_counter() - start
+        health.record_success(elapsed)
+        PROVIDER_REQUESTS.inc(health.name, "ok")
+        PROVIDER_REQUEST_SECONDS.observe(elapsed, health.name)
+        return data
+
+    def fetch(self, base_currency: str) -> Dict:
+        # Healthy providers in order, then those cooling down as a last resort
+        healthy = [health for health in self.providers if health.is_healthy()]
+        candidates = healthy + [health for health in self.providers if health not in healthy]
+        pending: Dict[Future, ProviderHealth] = {}
+        errors: List[str] = []
+
+        def launch() -> ProviderHealth:
+            health = candidates[len(pending) + len(errors)]
+            pending[self._executor.submit(self._call, health, base_currency)] = health
+            return health
+
+        newest = launch()
+        while pending:
+            # Slow requests are only hedged to healthy providers
+            can_hedge = len(pending) + len(errors) < len(healthy)
+            done, _ = wait(pending, timeout=self.hedge_delay(newest) if can_hedge else None, return_when=FIRST_COMPLETED)
+
+            if not done:
+                # The newest request is slower than usual: ask the next provider too
+                newest = launch()
+                PROVIDER_HEDGES.inc(newest.name)
+                continue
+
+            for future in done:
+                health = pending.pop(future)
+                try:
+                    return future.result()
+                except (requests.exceptions.RequestException, ValueError) as e:
+                    errors.append(f"{health.name}: {e}")
+
+            if not pending and len(errors) < len(candidates):
+                newest = launch()
+
+        raise ProviderError(f"All rate providers failed ({'; '.join(errors)})")
+
+    def health(self) -> List[Dict]:
+        """
+        Current state of every provider.
+
+        Returns:
+            List[Dict]: name, healthy, consecutive_failures, cooldown_remaining,
+            hedge_delay (seconds) and samples, in priority order
+        """
+        now = time.monotonic()
+        return [
+            {
+                "name": health.name,
+                "healthy": health.is_healthy(),
+                "consecutive_failures": health.consecutive_failures,
+                "cooldown_remaining": max(health.unhealthy_until - now, 0.0),
+                "hedge_delay": self.hedge_delay(health),
+                "samples": len(health.latencies),
+            }
+            for health in self.providers
+        ]
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+        for health in self.providers:
+            health.provider.close()
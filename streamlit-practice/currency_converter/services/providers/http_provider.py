@@ -0,0 +1,57 @@
+"""
+HTTP exchange rate provider.
+Fetches rates from an ExchangeRate-API compatible endpoint over the shared session.
+"""
+
+from typing import Dict, Optional
+import sys
+import os
+
+import requests
+
+# Add parent directory to path for imports
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
+
+from config.settings import API_CONNECT_TIMEOUT, API_READ_TIMEOUT
+from services.http_client import get_session
+from services.providers.base import RateProvider
+
+
+class HttpRateProvider(RateProvider):
+    """Provider for endpoints serving GET {base_url}/{base_currency}."""
+
+    name = "http"
+
+    def __init__(
+        self,
+        base_url: str,
+        connect_timeout: float = API_CONNECT_TIMEOUT,
+        read_timeout: float = API_READ_TIMEOUT,
+        session: Optional[requests.Session] = None
+    ):
+        """
+        Create an HTTP provider.
+
+        Args:
+            base_url (str): Endpoint prefix, e.g. https://api.exchangerate-api.com/v4/latest
+            connect_timeout (float): Connect timeout in seconds
+            read_timeout (float): Read timeout in seconds
+            session (Optional[requests.Session]): Session to use, defaults to the shared pooled session
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = (connect_timeout, read_timeout)
+        self._session = session
+
+    def fetch(self, base_currency: str) -> Dict:
+        session = self._session or get_session()
+        response = session.get(f"{self.base_url}/{base_currency}", timeout=self.timeout)
+        response.raise_for_status()
+
+        data = response.json()
+
+        if not isinstance(data, dict) or "rates" not in data:
+            raise ValueError("Response contains no rates")
+
+        return {"base": data.get("base", base_currency), "rates": data["rates"]}
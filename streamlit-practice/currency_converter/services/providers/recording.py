@@ -0,0 +1,123 @@
+"""
+Record and replay providers.
+Capture real provider responses to disk and serve them back deterministically offline.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict
+
+from services.providers.base import ProviderError, RateProvider
+
+
+def _capture_path(capture_dir: str, base_currency: str) -> str:
+    """Get the capture file path for a base currency."""
+    return os.path.join(capture_dir, f"{base_currency.upper()}.json")
+
+
+class RecordingProvider(RateProvider):
+    """Provider that passes fetches through and saves each response to disk."""
+
+    name = "record"
+
+    def __init__(self, inner: RateProvider, capture_dir: str):
+        """
+        Create a recording provider.
+
+        Args:
+            inner (RateProvider): Provider whose responses are recorded
+            capture_dir (str): Directory the captures are written to
+        """
+        self.inner = inner
+        self.capture_dir = capture_dir
+
+    def fetch(self, base_currency: str) -> Dict:
+        start = time.perf_counter()
+        data = self.inner.fetch(base_currency)
+        latency = time.perf_counter() - start
+
+        os.makedirs(self.capture_dir, exist_ok=True)
+        path = _capture_path(self.capture_dir, base_currency)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "base": data.get("base", base_currency),
+                    "rates": data["rates"],
+                    "latency": round(latency, 6),
+                    "recorded_at": time.time(),
+                },
+                f,
+                sort_keys=True,
+            )
+        # Atomic swap so a concurrent replay never reads a partial file
+        os.replace(temp_path, path)
+
+        return data
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class ReplayProvider(RateProvider):
+    """Provider that serves previously recorded responses."""
+
+    name = "replay"
+
+    def __init__(self, capture_dir: str, replay_latency: bool = False):
+        """
+        Create a replay provider.
+
+        Args:
+            capture_dir (str): Directory holding the captures
+            replay_latency (bool): Sleep for each capture's recorded latency
+                to reproduce realistic timing
+        """
+        self.capture_dir = capture_dir
+        self.replay_latency = replay_latency
+        self._captures: Dict[str, Dict] = {}
+
+    def _load_capture(self, base_currency: str) -> Dict:
+        """Read a capture from disk once and keep it in memory."""
+        capture = self._captures.get(base_currency)
+        if capture is None:
+            path = _capture_path(self.capture_dir, base_currency)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    capture = json.load(f)
+            except FileNotFoundError:
+                capture = self._derive_capture(base_currency)
+            self._captures[base_currency] = capture
+        return capture
+
+    def _derive_capture(self, base_currency: str) -> Dict:
+        """Rebase another recorded payload when no capture exists for this base."""
+        try:
+            file_names = sorted(os.listdir(self.capture_dir))
+        except FileNotFoundError:
+            file_names = []
+
+        for file_name in file_names:
+            if not file_name.endswith(".json"):
+                continue
+            with open(os.path.join(self.capture_dir, file_name), encoding="utf-8") as f:
+                capture = json.load(f)
+            base_rate = capture.get("rates", {}).get(base_currency)
+            if base_rate:
+                return {
+                    "base": base_currency,
+                    "rates": {code: rate / base_rate for code, rate in capture["rates"].items()},
+                    "latency": capture.get("latency", 0.0),
+                }
+
+        raise ProviderError(f"No recorded response for {base_currency} in {self.capture_dir}")
+
+    def fetch(self, base_currency: str) -> Dict:
+        capture = self._load_capture(base_currency)
+
+        if self.replay_latency:
+            time.sleep(capture.get("latency", 0.0))
+
+        return {"base": capture["base"], "rates": capture["rates"]}
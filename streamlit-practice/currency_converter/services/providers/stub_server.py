@@ -0,0 +1,181 @@
+"""
+Local stub exchange rate server.
+Serves ExchangeRate-API compatible responses with configurable latency, jitter and errors.
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+# Approximate USD-based rates used when no fixture is supplied
+SAMPLE_RATES = {
+    "USD": 1.0,
+    "PKR": 278.5,
+    "EUR": 0.92,
+    "GBP": 0.79,
+    "AED": 3.6725,
+    "SAR": 3.75,
+    "INR": 83.2,
+    "CAD": 1.36,
+    "AUD": 1.52,
+    "CNY": 7.19,
+    "JPY": 149.5,
+    "BDT": 110.0,
+}
+
+
+class StubRateServer:
+    """Threaded HTTP server answering GET /{base_currency} with rate payloads."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.05,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rates: Optional[Dict[str, float]] = None,
+        seed: Optional[int] = None,
+        tail_rate: float = 0.0,
+        tail_latency: float = 0.0
+    ):
+        """
+        Create a stub server (call start() to serve).
+
+        Args:
+            host (str): Interface to bind
+            port (int): Port to bind, 0 picks a free port
+            latency (float): Base response delay in seconds
+            jitter (float): Extra random delay in seconds, uniform in [0, jitter]
+            error_rate (float): Probability of answering with HTTP 503
+            rates (Optional[Dict[str, float]]): USD-based rates, defaults to SAMPLE_RATES
+            seed (Optional[int]): Seed for reproducible latency and errors
+            tail_rate (float): Probability of a slow response, to simulate tail latency
+            tail_latency (float): Extra delay in seconds for slow responses
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.tail_rate = tail_rate
+        self.tail_latency = tail_latency
+        self.rates = dict(rates or SAMPLE_RATES)
+        self.request_count = 0
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubRateServer":
+        """Serve requests in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stub-rate-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests in the current thread until stopped."""
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubRateServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _next_delay_and_error(self):
+        """Draw this request's delay and whether it should fail."""
+        with self._random_lock:
+            self.request_count += 1
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            if self._random.random() < self.tail_rate:
+                delay += self.tail_latency
+            fail = self._random.random() < self.error_rate
+        return delay, fail
+
+    def _payload(self, base_currency: str) -> Optional[Dict]:
+        """Build a payload rebased to the requested currency."""
+        base_rate = self.rates.get(base_currency)
+        if not base_rate:
+            return None
+        return {
+            "base": base_currency,
+            "date": time.strftime("%Y-%m-%d"),
+            "rates": {code: rate / base_rate for code, rate in self.rates.items()},
+        }
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, like the real API
+
+            def do_GET(self):
+                delay, fail = stub._next_delay_and_error()
+                if delay > 0:
+                    time.sleep(delay)
+
+                base_currency = self.path.rstrip("/").rsplit("/", 1)[-1].upper()
+                payload = None if fail else stub._payload(base_currency)
+
+                if fail:
+                    status, body = 503, {"error": "injected failure"}
+                elif payload is None:
+                    status, body = 404, {"error": f"unsupported code {base_currency}"}
+                else:
+                    status, body = 200, payload
+
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a local stub exchange rate server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.05, help="Base delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Max extra random delay in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of HTTP 503")
+    parser.add_argument("--tail-rate", type=float, default=0.0, help="Probability of a slow response")
+    parser.add_argument("--tail-latency", type=float, default=0.0, help="Extra delay of slow responses in seconds")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = StubRateServer(
+        args.host,
+        args.port,
+        args.latency,
+        args.jitter,
+        args.error_rate,
+        seed=args.seed,
+        tail_rate=args.tail_rate,
+        tail_latency=args.tail_latency,
+    )
+    print(f"Stub rate server listening on {server.url} (set API_BASE_URL={server.url})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,204 @@
+"""
+In-process exchange rate cache with stale-while-revalidate refresh.
+Expired entries are served immediately while a background worker refreshes them,
+and concurrent loads of the same key are coalesced into a single upstream call.
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Loader returns (value, age in seconds); age > 0 when the value came from an older source
+Loader = Callable[[str], Tuple[Any, float]]
+
+
+class CacheEntry:
+    """Cached value with the monotonic time it was fetched."""
+
+    __slots__ = ("value", "fetched_at", "last_attempt")
+
+    def __init__(self, value: Any, fetched_at: float, last_attempt: float):
+        self.value = value
+        self.fetched_at = fetched_at
+        self.last_attempt = last_attempt
+
+
+class RateCache:
+    """Thread-safe TTL cache that can serve stale entries while refreshing."""
+
+    def __init__(
+        self,
+        ttl: float,
+        refresh_ahead: float = 0.0,
+        stale_while_revalidate: bool = True,
+        retry_interval: float = 30.0,
+        max_workers: int = 2
+    ):
+        """
+        Create a rate cache.
+
+        Args:
+            ttl (float): Seconds an entry stays fresh
+            refresh_ahead (float): Seconds before expiry at which a background
+                refresh is started (stale-while-revalidate mode only)
+            stale_while_revalidate (bool): Serve expired entries immediately and
+                refresh them in the background instead of blocking the caller
+            retry_interval (float): Minimum seconds between refresh attempts for a key
+            max_workers (int): Background refresh threads
+        """
+        self.ttl = ttl
+        self.refresh_ahead = min(refresh_ahead, ttl)
+        self.stale_while_revalidate = stale_while_revalidate
+        self.retry_interval = retry_interval
+        self._max_workers = max_workers
+        self._entries: Dict[str, CacheEntry] = {}
+        self._refreshing = set()
+        self._in_flight: Dict[str, Future] = {}
+        self._stats = Counter()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str, loader: Loader) -> Tuple[Any, bool]:
+        """
+        Get a value, loading it on a miss.
+
+        Args:
+            key (str): Cache key
+            loader (Loader): Called with the key to (re)load the value; may raise
+
+        Returns:
+            Tuple[Any, bool]: (value, is_stale)
+
+        Raises:
+            Exception: Whatever the loader raises on a miss with nothing cached
+        """
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self._count("misses")
+            return self._load(key, loader)
+
+        now = time.monotonic()
+        age = now - entry.fetched_at
+        self._count("stale_hits" if age >= self.ttl else "hits")
+
+        if age >= self.ttl and not self.stale_while_revalidate:
+            if now - entry.last_attempt < self.retry_interval:
+                return entry.value, True
+            try:
+                return self._load(key, loader)
+            except Exception:
+                logger.warning("Refresh of %s failed; serving stale entry", key, exc_info=True)
+                entry.last_attempt = now
+                return entry.value, True
+
+        if self.stale_while_revalidate and age >= self.ttl - self.refresh_ahead:
+            self._schedule_refresh(key, loader, entry, now)
+
+        return entry.value, age >= self.ttl
+
+    def set(self, key: str, value: Any, age: float = 0.0) -> None:
+        """
+        Store a value.
+
+        Args:
+            key (str): Cache key
+            value (Any): Value to cache
+            age (float): How old the value already is, in seconds
+        """
+        now = time.monotonic()
+        entry = CacheEntry(value, now - age, now)
+        with self._lock:
+            self._entries[key] = entry
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters for monitoring.
+
+        Returns:
+            Dict[str, int]: hits, stale_hits, misses, coalesced, fetches and
+            fetch_errors since the cache was created
+        """
+        with self._lock:
+            counts = dict(self._stats)
+        return {
+            name: counts.get(name, 0)
+            for name in ("hits", "stale_hits", "misses", "coalesced", "fetches", "fetch_errors")
+        }
+
+    def _count(self, name: str) -> None:
+        """Increment a stats counter."""
+        with self._lock:
+            self._stats[name] += 1
+
+    def _load(self, key: str, loader: Loader) -> Tuple[Any, bool]:
+        """
+        Load a value synchronously and store it.
+
+        Only one load per key runs at a time; concurrent callers wait for it
+        and receive its result or its exception.
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._in_flight[key] = future
+                self._stats["fetches"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            value, age = loader(key)
+            self.set(key, value, age)
+            result = (value, age >= self.ttl)
+        except BaseException as e:
+            self._count("fetch_errors")
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def _schedule_refresh(self, key: str, loader: Loader, entry: CacheEntry, now: float) -> None:
+        """Start a background refresh unless one is running or was tried recently."""
+        with self._lock:
+            if key in self._refreshing or now - entry.last_attempt < self.retry_interval:
+                return
+            self._refreshing.add(key)
+            entry.last_attempt = now
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="rate-refresh",
+                )
+        self._executor.submit(self._refresh, key, loader)
+
+    def _refresh(self, key: str, loader: Loader) -> None:
+        """Background refresh task; keeps the stale entry on failure."""
+        try:
+            self._load(key, loader)
+        except Exception:
+            logger.warning("Background refresh of %s failed; keeping stale entry", key, exc_info=True)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
@@ -0,0 +1,269 @@
+"""
+Local time-series store of every fetched exchange rate snapshot.
+Keeps one compressed columnar Parquet file per base currency and month, one column per currency.
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+TIMESTAMP_COLUMN = "timestamp"
+
+# (inode, size, mtime) of a partition file; None when it does not exist
+FileStamp = Optional[Tuple[int, int, int]]
+
+
+def _file_stamp(path: str) -> FileStamp:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    """Hold an exclusive lock on path (created if needed) across processes."""
+    with open(path, "a+b") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class RateHistoryStore:
+    """
+    Append-only store of rate snapshots partitioned by base currency and month.
+
+    Several processes (the app, the API server, the CLI) may share a
+    directory: appends hold a file lock per partition while they read,
+    merge and replace it, and cached partitions are re-read once the file
+    on disk changes.
+    """
+
+    def __init__(self, directory: str, compression: str = "zstd", cache_size: int = 64):
+        """
+        Create a rate history store.
+
+        Args:
+            directory (str): Root directory, created on first write
+            compression (str): Parquet compression codec
+            cache_size (int): Month partitions kept in memory for repeat queries
+        """
+        self.directory = directory
+        self.compression = compression
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[FileStamp, pd.DataFrame]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def _month_path(self, base_currency: str, month: str) -> str:
+        return os.path.join(self.directory, base_currency, f"{month}.parquet")
+
+    def months(self, base_currency: str) -> List[str]:
+        """
+        List the stored months for a base currency.
+
+        Args:
+            base_currency (str): The base currency code
+
+        Returns:
+            List[str]: Months as "YYYY-MM", oldest first
+        """
+        try:
+            names = os.listdir(os.path.join(self.directory, base_currency))
+        except OSError:
+            return []
+        return sorted(name[:-len(".parquet")] for name in names if name.endswith(".parquet"))
+
+    def _read_month(self, base_currency: str, month: str) -> pd.DataFrame:
+        """Load one month partition, from memory unless the file changed since."""
+        key = (base_currency, month)
+        path = self._month_path(base_currency, month)
+        stamp = _file_stamp(path)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == stamp:
+                self._cache.move_to_end(key)
+                return cached[1]
+
+        if stamp is not None:
+            frame = pd.read_parquet(path).set_index(TIMESTAMP_COLUMN)
+        else:
+            frame = pd.DataFrame(index=pd.DatetimeIndex([], name=TIMESTAMP_COLUMN))
+        self._remember(key, stamp, frame)
+        return frame
+
+    def _remember(self, key: Tuple[str, str], stamp: FileStamp, frame: pd.DataFrame) -> None:
+        """Cache a month partition, evicting the least recently used ones."""
+        with self._lock:
+            self._cache[key] = (stamp, frame)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def append(self, base_currency: str, payload: Dict) -> bool:
+        """
+        Record a rate payload as one snapshot row.
+
+        Args:
+            base_currency (str): The base currency code
+            payload (Dict): Rate payload with "rates" and an ISO "timestamp"
+
+        Returns:
+            bool: True if the snapshot was written
+        """
+        try:
+            timestamp = pd.Timestamp(payload.get("timestamp") or datetime.now())
+            rates = {code: float(rate) for code, rate in payload["rates"].items()}
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return False
+
+        frame = pd.DataFrame(rates, index=pd.DatetimeIndex([timestamp], name=TIMESTAMP_COLUMN))
+        return self.append_frame(base_currency, frame)
+
+    def append_frame(self, base_currency: str, frame: pd.DataFrame) -> bool:
+        """
+        Record many snapshots at once.
+
+        Args:
+            base_currency (str): The base currency code
+            frame (pd.DataFrame): Rates indexed by timestamp, one column per currency
+
+        Returns:
+            bool: True if every affected month was written
+        """
+        try:
+            with self._lock:
+                for month, rows in frame.groupby(frame.index.strftime("%Y-%m")):
+                    path = self._month_path(base_currency, month)
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    # Other processes append to the same partition: read, merge and replace under one lock
+                    with _file_lock(f"{path}.lock"):
+                        merged = pd.concat([self._read_month(base_currency, month), rows])
+                        merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+                        merged = merged.reindex(columns=sorted(merged.columns))
+                        self._write_month(base_currency, month, merged)
+                        self._remember((base_currency, month), _file_stamp(path), merged)
+        except (OSError, ValueError, ImportError):
+            logger.warning("Could not record %s rate history", base_currency, exc_info=True)
+            return False
+        return True
+
+    def _write_month(self, base_currency: str, month: str, frame: pd.DataFrame) -> None:
+        """Atomically replace a month partition on disk."""
+        path = self._month_path(base_currency, month)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        frame.reset_index().to_parquet(temp_path, compression=self.compression, index=False)
+        os.replace(temp_path, path)
+
+    def query(
+        self,
+        base_currency: str,
+        currencies: Optional[Iterable[str]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        freq: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Get stored rates for a time range.
+
+        Only the month partitions overlapping the range are read.
+
+        Args:
+            base_currency (str): The base currency code
+            currencies (Optional[Iterable[str]]): Columns to return, defaults to all
+            start (Optional[datetime]): First timestamp included
+            end (Optional[datetime]): Last timestamp included
+            freq (Optional[str]): Pandas resample rule such as "D" or "W";
+                each bucket keeps its last snapshot
+
+        Returns:
+            pd.DataFrame: Rates indexed by timestamp, one column per currency
+        """
+        first = pd.Timestamp(start).strftime("%Y-%m") if start is not None else None
+        last = pd.Timestamp(end).strftime("%Y-%m") if end is not None else None
+        months = [
+            month for month in self.months(base_currency)
+            if (first is None or month >= first) and (last is None or month <= last)
+        ]
+
+        wanted = list(currencies) if currencies is not None else None
+        parts = []
+        for month in months:
+            part = self._read_month(base_currency, month)
+            if wanted is not None:
+                part = part.reindex(columns=wanted)
+            parts.append(part.loc[start:end])
+
+        if not parts:
+            return pd.DataFrame(columns=wanted, index=pd.DatetimeIndex([], name=TIMESTAMP_COLUMN))
+
+        frame = pd.concat(parts) if len(parts) > 1 else parts[0]
+        if freq:
+            frame = frame.resample(freq).last().dropna(how="all")
+        return frame
+
+    def pair_series(
+        self,
+        base_currency: str,
+        from_currency: str,
+        to_currency: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        freq: Optional[str] = None
+    ) -> pd.Series:
+        """
+        Get the historical cross rate between two currencies.
+
+        Cross rates are derived from the stored base currency snapshots, so any
+        pair can be charted without fetching it separately.
+
+        Args:
+            base_currency (str): Base currency the snapshots were fetched for
+            from_currency (str): Source currency code
+            to_currency (str): Target currency code
+            start (Optional[datetime]): First timestamp included
+            end (Optional[datetime]): Last timestamp included
+            freq (Optional[str]): Pandas resample rule such as "D" or "W"
+
+        Returns:
+            pd.Series: Units of to_currency per unit of from_currency, by timestamp
+        """
+        columns = [code for code in dict.fromkeys((from_currency, to_currency)) if code != base_currency]
+        frame = self.query(base_currency, columns or [base_currency], start, end)
+
+        if from_currency == to_currency:
+            series = pd.Series(1.0, index=frame.index)
+        else:
+            from_rates = 1.0 if from_currency == base_currency else frame[from_currency]
+            to_rates = 1.0 if to_currency == base_currency else frame[to_currency]
+            series = to_rates / from_rates
+        series = series.dropna().rename(f"{from_currency}/{to_currency}")
+
+        if freq:
+            series = series.resample(freq).last().dropna()
+        return series
@@ -0,0 +1,118 @@
+"""
+Cross rates derived from a single anchor-base rate table.
+Lets every currency pair be looked up without a separate upstream request.
+"""
+
+from functools import cached_property
+from typing import Dict, Iterable, List, Optional, Tuple
+import sys
+import os
+
+import numpy as np
+
+# Add parent directory to path for imports
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
+
+from services.rate_table import RateTable
+
+
+class RateMatrix:
+    """
+    Cross rates between every pair of currencies in a rate table.
+
+    Each rate is derived on lookup from the table's buffer (codes[j] per
+    codes[i] is values[j] / values[i]), so no N×N matrix is built unless the
+    fixed-point engine asks for one.
+    """
+
+    def __init__(self, table: RateTable):
+        """
+        Create a rate matrix.
+
+        Args:
+            table (RateTable): Anchor-base rates the cross rates are derived from
+        """
+        self.table = table
+        self.codes = table.codes
+        self.index = table.index
+        self.base = table.base
+        self.timestamp = table.timestamp
+        self.stale = table.stale
+        self._values = table.values
+        self._rates = table.rates
+
+    @cached_property
+    def matrix(self) -> np.ndarray:
+        """Full read-only cross-rate matrix, where matrix[i, j] is codes[j] per unit of codes[i]."""
+        # One anchor unit buys rates[j] of currency j, so i -> j is rates[j] / rates[i]
+        matrix = self._rates[np.newaxis, :] / self._rates[:, np.newaxis]
+        matrix.setflags(write=False)
+        return matrix
+
+    def __contains__(self, currency_code: str) -> bool:
+        return currency_code in self.index
+
+    def rate(self, from_currency: str, to_currency: str) -> Optional[float]:
+        """
+        Look up the cross rate between two currencies.
+
+        Args:
+            from_currency (str): Source currency code
+            to_currency (str): Target currency code
+
+        Returns:
+            Optional[float]: Units of to_currency per unit of from_currency, or None
+        """
+        i = self.index.get(from_currency)
+        j = self.index.get(to_currency)
+        if i is None or j is None:
+            return None
+        return self._values[j] / self._values[i]
+
+    def rates_from(self, from_currency: str) -> Dict[str, float]:
+        """
+        Get all cross rates for a single source currency.
+
+        Args:
+            from_currency (str): Source currency code
+
+        Returns:
+            Dict[str, float]: Target currency code to exchange rate
+        """
+        i = self.index.get(from_currency)
+        if i is None:
+            return {}
+        return dict(zip(self.codes, (self._rates / self._rates[i]).tolist()))
+
+    def cross_rates(self, from_currency: str, to_currencies: Iterable[str]) -> Tuple[List[str], np.ndarray]:
+        """
+        Get the cross rates from one currency to many as a single array.
+
+        Args:
+            from_currency (str): Source currency code
+            to_currencies (Iterable[str]): Target currency codes
+
+        Returns:
+            Tuple[List[str], np.ndarray]: Known target codes and their rates, in order
+        """
+        i = self.index.get(from_currency)
+        if i is None:
+            return [], np.empty(0, dtype=np.float64)
+
+        targets = [code for code in to_currencies if code in self.index]
+        columns = np.fromiter((self.index[code] for code in targets), dtype=np.intp, count=len(targets))
+        return targets, self._rates[columns] / self._rates[i]
+
+    def rates_to(self, to_currency: str) -> np.ndarray:
+        """
+        Get the cross rates from every currency to one target.
+
+        Args:
+            to_currency (str): Target currency code, which must be in the matrix
+
+        Returns:
+            np.ndarray: Rate from each of codes to to_currency, in order
+        """
+        return self._rates[self.index[to_currency]] / self._rates
@@ -0,0 +1,117 @@
+"""
+Compact table of the rates in one provider response.
+Parsed and validated once at ingest: a currency-code index over a single contiguous float64 buffer.
+"""
+
+import math
+from array import array
+from typing import Dict, Iterable, Iterator, Optional
+import sys
+import os
+
+import numpy as np
+
+# Add parent directory to path for imports
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
+
+from utils.validators import validate_exchange_rate_response
+
+
+class RateTable:
+    """Immutable rates for one base currency: units of codes[i] per unit of base is values[i]."""
+
+    def __init__(self, base: str, codes: Iterable[str], values: array, timestamp: Optional[str]):
+        """
+        Create a rate table (use from_payload to parse a provider response).
+
+        Args:
+            base (str): Base currency the rates are quoted against
+            codes (Iterable[str]): Currency codes, in buffer order
+            values (array): array('d') of positive rates, one per code
+            timestamp (Optional[str]): ISO format timestamp of the fetch
+        """
+        self.base = base
+        self.codes = tuple(codes)
+        self.index = {code: i for i, code in enumerate(self.codes)}
+        self.values = values
+        # Zero-copy NumPy view of the same buffer for vectorized lookups
+        self.rates = np.frombuffer(values, dtype=np.float64)
+        self.rates.setflags(write=False)
+        self.timestamp = timestamp
+        self.stale = False
+
+    @classmethod
+    def from_payload(
+        cls,
+        payload: Dict,
+        currencies: Iterable[str] = (),
+        timestamp: Optional[str] = None
+    ) -> "RateTable":
+        """
+        Validate a rate payload and parse it into a table.
+
+        Rates that are missing, non-numeric or not positive are left out.
+
+        Args:
+            payload (Dict): Payload with "base" and "rates", as returned by a provider
+            currencies (Iterable[str]): Codes to put first, in this order, when quoted
+            timestamp (Optional[str]): Fetch time, defaults to the payload's "timestamp"
+
+        Returns:
+            RateTable: Parsed rates
+
+        Raises:
+            ValueError: If the payload is malformed or has no usable rates
+        """
+        is_valid, error_message = validate_exchange_rate_response(payload)
+        if not is_valid:
+            raise ValueError(error_message)
+
+        base = payload["base"]
+        rate_map = payload["rates"]
+
+        codes = []
+        values = array("d")
+        for code in dict.fromkeys([*currencies, base, *rate_map]):
+            rate = 1.0 if code == base else rate_map.get(code)
+            if isinstance(rate, (int, float)) and not isinstance(rate, bool) and 0 < rate < math.inf:
+                codes.append(code)
+                values.append(rate)
+
+        if len(codes) < 2:
+            raise ValueError("Response contains no usable rates")
+
+        return cls(base, codes, values, timestamp or payload.get("timestamp"))
+
+    def __contains__(self, currency_code: str) -> bool:
+        return currency_code in self.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.codes)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def rate(self, currency_code: str) -> Optional[float]:
+        """
+        Look up the rate of one currency against the base.
+
+        Args:
+            currency_code (str): Currency code
+
+        Returns:
+            Optional[float]: Units of currency_code per unit of base, or None
+        """
+        i = self.index.get(currency_code)
+        return None if i is None else self.values[i]
+
+    def to_payload(self) -> Dict:
+        """
+        Rebuild the plain payload, e.g. to store it as JSON.
+
+        Returns:
+            Dict: "base", "rates" (code to rate) and "timestamp"
+        """
+        return {"base": self.base, "rates": dict(zip(self.codes, self.values)), "timestamp": self.timestamp}
@@ -0,0 +1,101 @@
+"""
+Persistent on-disk store for exchange rate snapshots.
+Keeps the last successful fetch per base currency across restarts.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import Dict, Optional, Tuple
+
+
+class SnapshotStore:
+    """SQLite-backed store holding the latest rate payload per base currency."""
+
+    def __init__(self, path: str):
+        """
+        Create a snapshot store.
+
+        Args:
+            path (str): SQLite database file path, created on first use
+        """
+        self.path = path
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the database and table if needed."""
+        if not self._initialized:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        conn = sqlite3.connect(self.path, timeout=5)
+
+        if not self._initialized:
+            with conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS rate_snapshots (
+                        base TEXT PRIMARY KEY,
+                        payload TEXT NOT NULL,
+                        saved_at REAL NOT NULL
+                    )
+                    """
+                )
+            self._initialized = True
+
+        return conn
+
+    def load(self, base_currency: str) -> Optional[Tuple[Dict, float]]:
+        """
+        Load the latest snapshot for a base currency.
+
+        Args:
+            base_currency (str): The base currency code
+
+        Returns:
+            Optional[Tuple[Dict, float]]: (payload, age in seconds) or None if
+            no snapshot exists or the store is unreadable
+        """
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT payload, saved_at FROM rate_snapshots WHERE base = ?",
+                    (base_currency,),
+                ).fetchone()
+        except (sqlite3.Error, OSError):
+            return None
+
+        if row is None:
+            return None
+
+        try:
+            payload = json.loads(row[0])
+        except ValueError:
+            return None
+
+        return payload, max(time.time() - row[1], 0.0)
+
+    def save(self, base_currency: str, payload: Dict) -> bool:
+        """
+        Save or replace the snapshot for a base currency.
+
+        Args:
+            base_currency (str): The base currency code
+            payload (Dict): Rate payload as returned by the service
+
+        Returns:
+            bool: True if the snapshot was written
+        """
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO rate_snapshots (base, payload, saved_at) VALUES (?, ?, ?)",
+                    (base_currency, json.dumps(payload), time.time()),
+                )
+        except (sqlite3.Error, OSError, TypeError, ValueError):
+            return False
+
+        return True
@@ -0,0 +1,21 @@
+"""
+Shared pytest setup.
+Runs the app offline against the recorded benchmark rates, like benchmarks/harness.py.
+"""
+
+import os
+import sys
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(APP_DIR, "benchmarks", "fixtures")
+
+os.environ.setdefault("RATE_PROVIDER", "replay")
+os.environ.setdefault("RATE_CAPTURE_DIR", os.path.join(FIXTURES_DIR, "captures"))
+os.environ.setdefault("SNAPSHOT_STORE_ENABLED", "false")
+os.environ.setdefault("CACHE_WARMUP_ENABLED", "false")
+os.environ.setdefault("HISTORY_DB_ENABLED", "false")
+os.environ.setdefault("RATE_HISTORY_ENABLED", "false")
+
+# Add app directory to path for imports
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
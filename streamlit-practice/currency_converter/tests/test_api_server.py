@@ -0,0 +1,77 @@
+"""
+Tests for the headless JSON API.
+Checks that malformed amounts and request bodies are rejected before any conversion or read.
+"""
+
+import http.client
+import json
+from urllib.parse import urlsplit
+
+import pytest
+
+from api_server import ConversionAPIServer
+
+
+@pytest.fixture(scope="module")
+def server():
+    with ConversionAPIServer(port=0) as server:
+        yield server
+
+
+def _request(server, method, path, body=None, headers=None):
+    url = urlsplit(server.url)
+    connection = http.client.HTTPConnection(url.hostname, url.port, timeout=10)
+    try:
+        connection.request(method, path, body=body, headers=headers or {})
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+
+def test_convert_returns_a_result(server):
+    status, payload = _request(server, "GET", "/convert?from=USD&to=PKR&amount=10")
+    assert status == 200
+    assert payload["result"] > 0
+
+
+@pytest.mark.parametrize("amount", ["nan", "NaN", "inf", "-inf"])
+def test_non_finite_amount_is_rejected(server, amount):
+    status, payload = _request(server, "GET", f"/convert?from=USD&to=PKR&amount={amount}")
+    assert status == 400
+    assert "Invalid amount" in payload["error"]
+
+
+def test_non_finite_batch_amount_is_rejected(server):
+    # json.loads accepts the NaN literal, so it reaches the amount check
+    body = '{"from": "USD", "to": ["PKR"], "amounts": [1, NaN]}'
+    status, payload = _request(server, "POST", "/convert/batch", body, {"Content-Type": "application/json"})
+    assert status == 400
+    assert "Invalid amount" in payload["error"]
+
+
+@pytest.mark.parametrize("length", ["-1", "-100", "ten"])
+def test_invalid_content_length_is_rejected(server, length):
+    url = urlsplit(server.url)
+    connection = http.client.HTTPConnection(url.hostname, url.port, timeout=10)
+    try:
+        connection.putrequest("POST", "/convert/batch")
+        connection.putheader("Content-Length", length)
+        connection.endheaders()
+        response = connection.getresponse()
+        assert response.status == 400
+        assert response.getheader("Connection") == "close"
+    finally:
+        connection.close()
+
+
+def test_oversized_content_length_is_rejected_unread(server):
+    url = urlsplit(server.url)
+    connection = http.client.HTTPConnection(url.hostname, url.port, timeout=10)
+    try:
+        connection.putrequest("POST", "/convert/batch")
+        connection.putheader("Content-Length", str(10 ** 9))
+        connection.endheaders()
+        assert connection.getresponse().status == 413
+    finally:
+        connection.close()
@@ -0,0 +1,28 @@
+"""
+Tests for the command-line converter.
+Checks which amounts batch mode accepts.
+"""
+
+import pytest
+
+from cli import Converter
+from services.exchange_rate_service import ExchangeRateService
+
+
+@pytest.fixture(scope="module")
+def converter():
+    return Converter(ExchangeRateService.get_rate_matrix(), "fixed", None)
+
+
+def test_signed_amounts_are_converted(converter):
+    refund, = converter.convert("-100", "USD", ["PKR"])
+    payment, = converter.convert("100", "USD", ["PKR"])
+    assert refund == -payment
+    assert converter.convert("0", "USD", ["PKR"]) == [0.0]
+    assert converter.failed_rows == 0
+
+
+def test_amounts_over_the_cap_fail(converter):
+    failed_rows = converter.failed_rows
+    assert converter.convert("-2e12", "USD", ["PKR"]) == [None]
+    assert converter.failed_rows == failed_rows + 1
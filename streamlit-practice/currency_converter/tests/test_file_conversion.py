@@ -0,0 +1,54 @@
+"""
+Tests for converted file handling.
+Checks that converted files on disk are cleaned up and stay within the download limit.
+"""
+
+import gc
+import os
+import time
+
+import pytest
+
+from services.file_conversion_service import ConvertedFile
+
+
+def test_delete_removes_the_file(tmp_path):
+    output = ConvertedFile("report_USD.csv", directory=str(tmp_path))
+    with open(output.path, "wb") as f:
+        f.write(b"amount\n1\n")
+    assert output.read_bytes() == b"amount\n1\n"
+
+    output.delete()
+    assert not output.exists()
+
+
+def test_file_is_removed_with_its_owner(tmp_path):
+    output = ConvertedFile("report_USD.csv", directory=str(tmp_path))
+    path = output.path
+    assert os.path.exists(path)
+
+    del output
+    gc.collect()
+    assert not os.path.exists(path)
+
+
+def test_old_files_are_swept(tmp_path):
+    stale = ConvertedFile("old.csv", directory=str(tmp_path))
+    old = time.time() - 2 * 3600
+    os.utime(stale.path, (old, old))
+    fresh = ConvertedFile("new.csv", directory=str(tmp_path))
+
+    assert not stale.exists()
+    assert fresh.exists()
+
+
+def test_write_stops_at_the_download_limit(tmp_path):
+    output = ConvertedFile("report_USD.csv", directory=str(tmp_path))
+    assert output.write([b"amount\n", b"1\n"], max_bytes=9) == 9
+    assert output.read_bytes() == b"amount\n1\n"
+
+    blocks = iter([b"amount\n", b"1\n", b"2\n", b"3\n"])
+    with pytest.raises(ValueError, match="download limit"):
+        output.write(blocks, max_bytes=9)
+    # The rest of the conversion is not consumed once the limit is passed
+    assert next(blocks) == b"3\n"
@@ -0,0 +1,59 @@
+"""
+Tests for the fixed-point money engine.
+Checks precision on weak-to-strong pairs and int64 overflow at the amount cap.
+"""
+
+import numpy as np
+import pytest
+
+from services.exchange_rate_service import ExchangeRateService
+from services.fixed_point import get_fixed_point_rates, to_minor
+
+
+@pytest.fixture(scope="module")
+def rate_matrix():
+    return ExchangeRateService.get_rate_matrix()
+
+
+@pytest.fixture(scope="module")
+def fixed(rate_matrix):
+    return get_fixed_point_rates(rate_matrix)
+
+
+@pytest.mark.parametrize("amount, from_currency, to_currency", [
+    (1e9, "IRR", "KWD"),
+    (123456789, "LBP", "BHD"),
+    (1e10, "VND", "KWD"),
+])
+def test_weak_to_strong_keeps_precision(rate_matrix, fixed, amount, from_currency, to_currency):
+    expected = amount * rate_matrix.rate(from_currency, to_currency)
+    # Within one minor unit (0.001) of the float result
+    assert fixed.convert_amount(amount, from_currency, to_currency) == pytest.approx(expected, abs=1e-3)
+
+
+@pytest.mark.parametrize("amount", [1e12, -1e12])
+def test_amount_cap_does_not_overflow(rate_matrix, fixed, amount):
+    expected = amount * rate_matrix.rate("KWD", "IRR")
+    scalar = fixed.convert_amount(amount, "KWD", "IRR")
+    assert scalar == pytest.approx(expected, rel=1e-12)
+
+    grid = ExchangeRateService.convert_batch([amount], "KWD", ["IRR"], rate_matrix, engine="fixed")
+    assert grid.iloc[0, 0] == pytest.approx(scalar, rel=1e-15)
+
+    rows = fixed.convert_rows(np.array([amount]), np.array([fixed.index["KWD"]]), "IRR")
+    assert rows[0] == pytest.approx(scalar, rel=1e-15)
+
+
+def test_batch_matches_scalar(rate_matrix, fixed):
+    amounts = [0.01, 1.0, 2.675, 1234.56, 99999999.99]
+    targets = list(fixed.codes)
+    grid = ExchangeRateService.convert_batch(amounts, "USD", targets, rate_matrix, engine="fixed")
+    for amount in amounts:
+        for target in targets:
+            assert grid.loc[amount, target] == fixed.convert_amount(amount, "USD", target)
+
+
+def test_convert_minor_falls_back_to_python_ints(fixed):
+    result = fixed.convert_minor(to_minor([1e12], "KWD"), "KWD", "IRR")
+    assert result.dtype == object
+    assert result[0] > 0
@@ -0,0 +1,37 @@
+"""
+Tests for the number formatters.
+Checks that the vectorized format_numbers agrees with format_number.
+"""
+
+import numpy as np
+import pytest
+
+from utils.formatters import format_number, format_numbers
+
+
+def _random_values(seed: int, count: int = 20_000) -> np.ndarray:
+    """Mix of amounts with rounding ties at 2 decimals, arbitrary floats and edge cases."""
+    rng = np.random.default_rng(seed)
+    ties = (rng.integers(0, 10 ** 10, count) * 10 + 5) / 1000
+    magnitudes = 10.0 ** rng.uniform(-4, 18, count)
+    signs = rng.choice([-1.0, 1.0], count)
+    edges = [0.0, -0.0, 0.5, 1.5, 2.5, 2.675, 3297317.165, 244906.775, 2.0 ** 53, 1e20, np.inf, -np.inf, np.nan]
+    return np.concatenate([ties * signs, magnitudes * signs, edges])
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("decimals", [0, 2, 4])
+@pytest.mark.parametrize("grouping", ["western", "lakh", "none"])
+def test_format_numbers_matches_format_number(seed, decimals, grouping):
+    values = _random_values(seed)
+    expected = [
+        "N/A" if np.isnan(value) else format_number(value, decimals, grouping)
+        for value in values
+    ]
+    assert list(format_numbers(values, decimals, grouping)) == expected
+
+
+@pytest.mark.parametrize("value, expected", [(3297317.165, "3,297,317.17"), (244906.775, "244,906.77")])
+def test_format_numbers_rounds_like_format_number(value, expected):
+    assert format_number(value, 2, "western") == expected
+    assert format_numbers([value], 2, "western")[0] == expected
@@ -0,0 +1,146 @@
+"""
+Tests for conversion history.
+Checks that records are scoped by owner, that conversions are recorded and that exports close their files.
+"""
+
+import gzip
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from services.history_db import HistoryDatabase, HistoryFilter
+from services.history_export import HistoryExportService
+from services.history_store import HistoryStore
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = HistoryDatabase(str(tmp_path / "history.db"))
+    yield database
+    database.close()
+
+
+def test_records_are_scoped_by_owner(database):
+    database.append("USD", "PKR", 1.0, 278.0, 278.0, owner="alice")
+    database.append("EUR", "GBP", 2.0, 1.7, 0.85, owner="bob")
+
+    alice = HistoryFilter(owner="alice")
+    assert list(database.query_page(alice, 10)["From"]) == ["USD"]
+    assert database.summarize(alice)["total_count"] == 1
+    assert database.currencies("alice") == ["PKR", "USD"]
+    assert [len(chunk) for chunk in database.iter_chunks(alice, 10)] == [1]
+
+    database.clear("alice")
+    assert database.summarize(alice)["total_count"] == 0
+    assert database.summarize(HistoryFilter(owner="bob"))["total_count"] == 1
+
+
+def test_append_many_writes_one_batch(database):
+    database.append_many("USD", ["PKR", "EUR"], [1.0, 2.0], [278.0, 1.8], [278.0, 0.9], owner="alice")
+    page = database.query_page(HistoryFilter(owner="alice"), 10)
+    assert sorted(zip(page["To"], page["Amount"])) == [("EUR", 2.0), ("PKR", 1.0)]
+    assert database.currencies("alice") == ["EUR", "PKR", "USD"]
+
+
+def test_idle_sessions_are_purged(tmp_path):
+    # Purged only when asked, not on flush
+    database = HistoryDatabase(str(tmp_path / "history.db"), session_retention=float("inf"))
+    long_ago = datetime.now() - timedelta(days=3)
+    database.append("USD", "PKR", 1.0, 278.0, 278.0, timestamp=long_ago, owner="session:idle")
+    database.append("USD", "PKR", 1.0, 278.0, 278.0, timestamp=long_ago, owner="session:active")
+    database.append("USD", "EUR", 1.0, 0.9, 0.9, owner="session:active")
+    database.append("USD", "PKR", 1.0, 278.0, 278.0, timestamp=long_ago, owner="alice@example.com")
+    database.flush()
+
+    assert database.purge_sessions(24 * 3600) == 1
+    assert database.summarize(HistoryFilter(owner="session:idle"))["total_count"] == 0
+    assert database.currencies("session:idle") == []
+    assert database.summarize(HistoryFilter(owner="session:active"))["total_count"] == 2
+    assert database.summarize(HistoryFilter(owner="alice@example.com"))["total_count"] == 1
+    database.close()
+
+
+def test_add_many_matches_add():
+    one_by_one, batched = HistoryStore(5), HistoryStore(5)
+    targets = ["PKR", "EUR", "GBP", "JPY", "PKR", "AED", "EUR"]
+    amounts = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0]
+    for _ in range(2):
+        for target, amount in zip(targets, amounts):
+            one_by_one.add("USD", target, amount, amount * 2, 2.0)
+        batched.add_many("USD", targets, amounts, [amount * 2 for amount in amounts], [2.0] * len(amounts))
+
+    columns = ["From", "To", "Amount", "Converted", "Rate"]
+    assert batched.to_dataframe()[columns].equals(one_by_one.to_dataframe()[columns])
+    assert batched.total_amount == one_by_one.total_amount
+    assert batched.unique_to_count == one_by_one.unique_to_count
+
+
+def test_export_bytes_closes_its_file(monkeypatch):
+    opened = []
+    temporary_file = tempfile.TemporaryFile
+
+    def tracked_temporary_file():
+        opened.append(temporary_file())
+        return opened[-1]
+
+    monkeypatch.setattr(tempfile, "TemporaryFile", tracked_temporary_file)
+    store = HistoryStore(5)
+    store.add("USD", "PKR", 1.0, 278.0, 278.0)
+
+    data = HistoryExportService.export_bytes(store.iter_chunks(2), "Gzip CSV")
+    assert gzip.decompress(data).decode("utf-8").splitlines()[0] == "Timestamp,From,To,Amount,Converted,Rate"
+    assert [output.closed for output in opened] == [True]
+
+
+def _converter_page():
+    from pages.converter import render_conversion_panel
+    render_conversion_panel()
+
+
+def _bulk_page():
+    from pages.bulk_converter import render_bulk_conversion_panel
+    render_bulk_conversion_panel()
+
+
+def test_conversion_is_recorded():
+    at = AppTest.from_function(_converter_page, default_timeout=60).run()
+    assert not at.exception
+    assert at.session_state["conversion_history"].total_count == 1
+
+    # Reruns with the same inputs do not record it again
+    at.run()
+    assert at.session_state["conversion_history"].total_count == 1
+
+    at.number_input(key="amount_input").set_value(5.0).run()
+    assert at.session_state["conversion_history"].total_count == 2
+
+
+def test_durable_conversion_is_recorded_for_its_owner(tmp_path, monkeypatch):
+    import services.history_db
+    import services.history_recorder
+
+    database = HistoryDatabase(str(tmp_path / "history.db"))
+    monkeypatch.setattr(services.history_recorder, "HISTORY_DB_ENABLED", True)
+    monkeypatch.setattr(services.history_db, "_database", database)
+
+    at = AppTest.from_function(_converter_page, default_timeout=60).run()
+    assert not at.exception
+    owner = at.session_state["history_owner"]
+    assert owner.startswith("session:")
+    assert database.summarize(HistoryFilter(owner=owner))["total_count"] == 1
+    assert database.summarize(HistoryFilter(owner="someone else"))["total_count"] == 0
+    database.close()
+
+
+def test_bulk_conversion_is_recorded():
+    at = AppTest.from_function(_bulk_page, default_timeout=60).run()
+    at.text_area[0].set_value("10\n20").run()
+    targets = at.session_state["bulk_target_currencies"]
+    at.button[0].click().run()
+    assert not at.exception
+    # One record per target currency, totalled over both amounts
+    history = at.session_state["conversion_history"]
+    assert history.total_count == len(targets)
+    assert history.total_amount == 30.0 * len(targets)
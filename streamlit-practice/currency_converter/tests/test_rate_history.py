@@ -0,0 +1,51 @@
+"""
+Tests for the rate history store.
+Checks that stores sharing a directory, in one or several processes, keep each other's snapshots.
+"""
+
+import subprocess
+import sys
+
+import pandas as pd
+
+from conftest import APP_DIR
+from services.rate_history import RateHistoryStore
+
+
+def _payload(day: int, rate: float) -> dict:
+    return {"rates": {"PKR": rate, "EUR": 0.9}, "timestamp": f"2024-03-{day:02d}T12:00:00"}
+
+
+def test_cached_partition_is_reread_after_another_store_writes(tmp_path):
+    writer = RateHistoryStore(str(tmp_path))
+    reader = RateHistoryStore(str(tmp_path))
+
+    assert writer.append("USD", _payload(1, 278.0))
+    assert len(reader.query("USD")) == 1
+
+    assert writer.append("USD", _payload(2, 279.0))
+    assert list(reader.query("USD")["PKR"]) == [278.0, 279.0]
+
+    # The reader's own append merges with what the writer added
+    assert reader.append("USD", _payload(3, 280.0))
+    assert list(writer.query("USD")["PKR"]) == [278.0, 279.0, 280.0]
+
+
+APPEND_DAYS = (
+    "import sys; from services.rate_history import RateHistoryStore; "
+    "store = RateHistoryStore(sys.argv[1]); "
+    "[store.append('USD', {'rates': {'PKR': 270.0 + day, 'EUR': 0.9}, "
+    "'timestamp': f'2024-03-{day:02d}T12:00:00'}) for day in range(int(sys.argv[2]), 29, 4)]"
+)
+
+
+def test_concurrent_processes_keep_every_snapshot(tmp_path):
+    writers = [
+        subprocess.Popen([sys.executable, "-c", APPEND_DAYS, str(tmp_path), str(start)], cwd=APP_DIR)
+        for start in range(1, 5)
+    ]
+    for writer in writers:
+        assert writer.wait(60) == 0
+
+    frame = RateHistoryStore(str(tmp_path)).query("USD")
+    assert list(frame.index) == [pd.Timestamp(f"2024-03-{day:02d}T12:00:00") for day in range(1, 29)]
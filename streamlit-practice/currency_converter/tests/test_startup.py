@@ -0,0 +1,36 @@
+"""
+Tests for cold start.
+Checks that the Converter page's first render does not load pandas or pyarrow.
+"""
+
+import os
+import subprocess
+import sys
+
+from conftest import APP_DIR
+
+FIRST_RENDER = (
+    "import streamlit; import pages.converter; "
+    "from services.history_recorder import add_to_history; "
+    "add_to_history('USD', 'PKR', 1.0, 278.0, 278.0); "
+    "print(' '.join(sys.modules))"
+)
+
+
+def _loaded_packages(env):
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys; {FIRST_RENDER}"],
+        cwd=APP_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    return {name.split(".")[0] for name in result.stdout.split()}
+
+
+def test_converter_first_render_skips_pandas():
+    loaded = _loaded_packages(os.environ.copy())
+    assert not loaded.intersection({"pandas", "pyarrow"})
+
+
+def test_durable_history_skips_pandas(tmp_path):
+    env = dict(os.environ, HISTORY_DB_ENABLED="true", HISTORY_DB_PATH=str(tmp_path / "history.db"))
+    loaded = _loaded_packages(env)
+    assert not loaded.intersection({"pandas", "pyarrow"})
@@ -0,0 +1,24 @@
+"""
+Tests for the rate trends page.
+Checks that the page renders whichever currencies the rates quote.
+"""
+
+from streamlit.testing.v1 import AppTest
+
+from services.currency_catalog import CurrencyCatalog
+from services.exchange_rate_service import ExchangeRateService
+
+
+def _trends_page():
+    from pages.trends import render_trends_page
+    render_trends_page()
+
+
+def test_defaults_without_usd_and_pkr(monkeypatch):
+    catalog = CurrencyCatalog(["EUR", "GBP", "JPY"])
+    monkeypatch.setattr(ExchangeRateService, "get_currency_catalog", staticmethod(lambda: catalog))
+
+    at = AppTest.from_function(_trends_page, default_timeout=60).run()
+    assert not at.exception
+    assert at.selectbox(key="trends_from_currency").value == "EUR"
+    assert at.selectbox(key="trends_to_currency").value == "GBP"
@@ -0,0 +1,47 @@
+"""
+Tests for input validation.
+Checks parsing of amounts, alone or several entered at once.
+"""
+
+from utils.validators import validate_amount, validate_amounts, validate_signed_amount
+
+
+def test_grouped_number_is_one_amount():
+    assert validate_amounts("1,000") == (True, [1000.0], "")
+    assert validate_amounts("12,345.67") == (True, [12345.67], "")
+
+
+def test_amounts_split_on_new_lines_and_semicolons():
+    assert validate_amounts("1,000\n2,500.5; 30") == (True, [1000.0, 2500.5, 30.0], "")
+
+
+def test_malformed_grouping_is_rejected():
+    is_valid, amounts, error_message = validate_amounts("1,00")
+    assert not is_valid
+    assert amounts == []
+    assert error_message.startswith("'1,00'")
+
+
+def test_empty_input_is_rejected():
+    assert validate_amounts(" \n ; ") == (False, [], "Amount cannot be empty")
+
+
+def test_signed_amount_accepts_zero_and_negatives():
+    assert validate_signed_amount("-50") == (True, -50.0, "")
+    assert validate_signed_amount("0") == (True, 0.0, "")
+
+
+def test_signed_amount_accepts_grouped_thousands():
+    assert validate_signed_amount("1,000") == (True, 1000.0, "")
+    assert validate_signed_amount("-12,345.67") == (True, -12345.67, "")
+    assert validate_signed_amount("1,00") == (False, 0, "Please enter a valid number")
+
+
+def test_signed_amount_keeps_the_magnitude_cap():
+    assert validate_signed_amount("-2e12") == (False, 0, "Amount is too large")
+    assert validate_signed_amount("nan") == (False, 0, "Please enter a valid number")
+
+
+def test_non_finite_amount_is_rejected():
+    for text in ("nan", "inf", "-inf"):
+        assert validate_amount(text) == (False, 0, "Please enter a valid number")
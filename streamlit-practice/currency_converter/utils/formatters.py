@@ -3,7 +3,230 @@ Utility functions for formatting and displaying data.
 Handles currency formatting, number formatting, and display utilities.
 """
 
-from config.settings import DECIMAL_PLACES, THOUSAND_SEPARATOR
+from typing import Iterable, Optional, Set
+
+import numpy as np
+
+from config.settings import DECIMAL_PLACES, THOUSAND_SEPARATOR, DIGIT_GROUPING
+
+DIGIT_GROUPINGS = ("western", "lakh", "none")
+
+CURRENCY_SYMBOLS = {
+    "PKR": "₨",
+    "USD": "$",
+    "EUR": "€",
+    "GBP": "£",
+    "AED": "د.إ",
+    "SAR": "﷼",
+    "INR": "₹",
+    "CAD": "C$",
+    "AUD": "A$",
+    "CNY": "¥",
+    "JPY": "¥",
+    "BDT": "৳",
+}
+
+# Scaled values from here on are no longer exact float64 integers and are formatted one by one
+_VECTOR_LIMIT = 2.0 ** 53
+
+
+def _resolve_grouping(grouping: Optional[str]) -> str:
+    """Default to DIGIT_GROUPING, or no grouping when THOUSAND_SEPARATOR is off."""
+    if grouping is None:
+        grouping = DIGIT_GROUPING if THOUSAND_SEPARATOR else "none"
+    if grouping not in DIGIT_GROUPINGS:
+        raise ValueError(f"Unknown digit grouping '{grouping}'. Expected one of: {', '.join(DIGIT_GROUPINGS)}")
+    return grouping
+
+
+def _separator_positions(grouping: str, digits: int) -> Set[int]:
+    """Digit indices (0 = units) that get a separator on their left."""
+    if grouping == "western":
+        return set(range(3, digits, 3))
+    if grouping == "lakh":
+        # 12,34,56,789: thousands first, then every two digits
+        return set(range(3, digits, 2))
+    return set()
+
+
+def group_digits(digits: str, grouping: Optional[str] = None) -> str:
+    """
+    Insert separators into a string of integer digits.
+    
+    Args:
+        digits (str): Integer digits without sign, e.g. "1234567"
+        grouping (Optional[str]): "western", "lakh" or "none", defaults to DIGIT_GROUPING
+        
+    Returns:
+        str: Grouped digits, e.g. "1,234,567" or "12,34,567"
+    """
+    positions = _separator_positions(_resolve_grouping(grouping), len(digits))
+    if not positions:
+        return digits
+    
+    parts = []
+    end = len(digits)
+    for position in sorted(positions):
+        parts.append(digits[len(digits) - position:end])
+        end = len(digits) - position
+    parts.append(digits[:end])
+    return ",".join(reversed(parts))
+
+
+def format_number(amount: float, decimals: int = DECIMAL_PLACES, grouping: Optional[str] = None) -> str:
+    """
+    Format a number with digit grouping.
+    
+    Args:
+        amount (float): Number to format
+        decimals (int): Decimal places
+        grouping (Optional[str]): "western", "lakh" or "none", defaults to DIGIT_GROUPING
+        
+    Returns:
+        str: Formatted number, e.g. "1,234,567.89" or "12,34,567.89"
+    """
+    grouping = _resolve_grouping(grouping)
+    if grouping == "western":
+        return f"{amount:,.{decimals}f}"
+    
+    text = f"{amount:.{decimals}f}"
+    if grouping == "none":
+        return text
+    
+    sign = "-" if text.startswith("-") else ""
+    integer, point, fraction = text.lstrip("-").partition(".")
+    if not integer.isdigit():
+        return text  # inf / nan
+    return f"{sign}{group_digits(integer, grouping)}{point}{fraction}"
+
+
+def format_numbers(
+    values: Iterable[float],
+    decimals: int = DECIMAL_PLACES,
+    grouping: Optional[str] = None,
+    prefix: str = "",
+    na_rep: str = "N/A"
+) -> np.ndarray:
+    """
+    Format a whole column of numbers at once.
+    
+    Digits, separators and signs are laid out in a byte matrix with array
+    arithmetic instead of formatting each value in a Python loop. Values
+    whose scaled product lies too close to a rounding tie to decide it in
+    float64 (e.g. 2.675 to 2 decimals) or that are too large are formatted
+    with format_number, so the output matches it for every value.
+    
+    Args:
+        values (Iterable[float]): Numbers, e.g. a pandas Series or NumPy array
+        decimals (int): Decimal places
+        grouping (Optional[str]): "western", "lakh" or "none", defaults to DIGIT_GROUPING
+        prefix (str): Text put before every formatted number, e.g. "PKR "
+        na_rep (str): Text for missing values
+        
+    Returns:
+        np.ndarray: Object array of formatted strings, same length as values
+    """
+    grouping = _resolve_grouping(grouping)
+    values = np.asarray(values, dtype=np.float64).reshape(-1)
+    count = len(values)
+    scale = 10 ** decimals
+    
+    product = np.abs(values) * scale
+    scaled = np.rint(product)
+    # The product is within half a unit in the last place of the exact value, so a
+    # distance to the tie above that decides the rounding the same way format_number does
+    with np.errstate(invalid="ignore"):
+        clear_of_tie = np.abs(np.abs(product - scaled) - 0.5) > np.spacing(product)
+        vectorized = np.isfinite(product) & (product < _VECTOR_LIMIT) & clear_of_tie
+    integers, fractions = np.divmod(np.where(vectorized, scaled, 0).astype(np.int64), scale)
+    
+    digits = len(str(int(integers.max(initial=0))))
+    separators = _separator_positions(grouping, digits)
+    width = 1 + digits + len(separators) + (decimals + 1 if decimals else 0)
+    
+    # Right-aligned characters, space padded; filled from the last column leftwards
+    matrix = np.full((count, width), ord(" "), dtype=np.uint8)
+    column = width - 1
+    for _ in range(decimals):
+        matrix[:, column] = fractions % 10 + ord("0")
+        fractions = fractions // 10
+        column -= 1
+    if decimals:
+        matrix[:, column] = ord(".")
+        column -= 1
+    
+    leading = np.full(count, column, dtype=np.intp)
+    remaining = integers
+    for position in range(digits):
+        more = remaining > 0
+        if position in separators:
+            matrix[:, column] = np.where(more, ord(","), ord(" "))
+            column -= 1
+        if position == 0:
+            matrix[:, column] = remaining % 10 + ord("0")
+        else:
+            matrix[:, column] = np.where(more, remaining % 10 + ord("0"), ord(" "))
+            leading = np.where(more, column, leading)
+        remaining = remaining // 10
+        column -= 1
+    
+    negative = np.flatnonzero(np.signbit(values) & vectorized)
+    matrix[negative, leading[negative] - 1] = ord("-")
+    
+    formatted = np.char.lstrip(matrix.view(f"S{width}").reshape(-1)).astype(str)
+    if prefix:
+        formatted = np.char.add(prefix, formatted)
+    formatted = formatted.astype(object)
+    
+    # NaN, infinities, near ties and values too large for exact float64 digits
+    for index in np.flatnonzero(~vectorized):
+        value = values[index]
+        formatted[index] = na_rep if np.isnan(value) else prefix + format_number(value, decimals, grouping)
+    return formatted
+
+
+def format_currencies(
+    values: Iterable[float],
+    currency_code: str,
+    decimals: int = DECIMAL_PLACES,
+    grouping: Optional[str] = None,
+    symbol: bool = False
+) -> np.ndarray:
+    """
+    Format a whole column of amounts in one currency.
+    
+    Args:
+        values (Iterable[float]): Amounts, e.g. a pandas Series or NumPy array
+        currency_code (str): Currency code (e.g., 'USD', 'PKR')
+        decimals (int): Decimal places
+        grouping (Optional[str]): "western", "lakh" or "none", defaults to DIGIT_GROUPING
+        symbol (bool): Prefix the currency symbol instead of the code
+        
+    Returns:
+        np.ndarray: Object array of formatted strings, e.g. "PKR 1,234.50"
+    """
+    prefix = get_currency_symbol(currency_code) if symbol else currency_code
+    return format_numbers(values, decimals, grouping, prefix=f"{prefix} ")
+
+
+def number_column_format(decimals: int = DECIMAL_PLACES, prefix: str = "", grouping: Optional[str] = None) -> Optional[str]:
+    """
+    Build a printf-style format for numeric table columns (st.column_config.NumberColumn).
+    
+    Args:
+        decimals (int): Decimal places
+        prefix (str): Text shown before every number, e.g. "₨ "
+        grouping (Optional[str]): "western", "lakh" or "none", defaults to DIGIT_GROUPING
+        
+    Returns:
+        Optional[str]: Format string, or None if the grouping cannot be expressed
+        as printf (lakh) and values must be pre-formatted with format_numbers
+    """
+    grouping = _resolve_grouping(grouping)
+    if grouping == "lakh":
+        return None
+    separator = "," if grouping == "western" else ""
+    return f"{prefix.replace('%', '%%')}%{separator}.{decimals}f"
 
 
 def format_currency(amount: float, currency_code: str, currency_name: str = None) -> str:
@@ -21,13 +244,7 @@ def format_currency(amount: float, currency_code: str, currency_name: str = None
     if amount is None:
         return "N/A"
     
-    # Format number with thousand separator
-    if THOUSAND_SEPARATOR:
-        formatted_amount = f"{amount:,.{DECIMAL_PLACES}f}"
-    else:
-        formatted_amount = f"{amount:.{DECIMAL_PLACES}f}"
-    
-    return f"{currency_code} {formatted_amount}"
+    return f"{currency_code} {format_number(amount)}"
 
 
 def format_exchange_rate(rate: float, from_currency: str, to_currency: str) -> str:
@@ -76,18 +293,4 @@ def get_currency_symbol(currency_code: str) -> str:
     Returns:
         str: Currency symbol
     """
-    symbols = {
-        "PKR": "₨",
-        "USD": "$",
-        "EUR": "€",
-        "GBP": "£",
-        "AED": "د.إ",
-        "SAR": "﷼",
-        "INR": "₹",
-        "CAD": "C$",
-        "AUD": "A$",
-        "CNY": "¥",
-        "JPY": "¥",
-        "BDT": "৳",
-    }
-    return symbols.get(currency_code, currency_code)
+    return CURRENCY_SYMBOLS.get(currency_code, currency_code)
@@ -0,0 +1,42 @@
+"""
+Column helpers for st.dataframe tables.
+Keeps numbers numeric and formats them with column_config; only pre-formats what printf cannot express.
+"""
+
+from typing import Tuple
+
+import pandas as pd
+import streamlit as st
+
+from config.settings import DECIMAL_PLACES
+from utils.formatters import format_numbers, number_column_format
+
+
+def number_column(
+    values: pd.Series,
+    label: str,
+    decimals: int = DECIMAL_PLACES,
+    prefix: str = ""
+) -> Tuple[pd.Series, dict]:
+    """
+    Prepare a numeric column for display.
+
+    With Western or no digit grouping the values stay numeric (sortable, and
+    formatted by the browser). Lakh/crore grouping has no printf equivalent,
+    so the column is formatted server-side in one vectorized pass instead.
+
+    Args:
+        values (pd.Series): Column values
+        label (str): Column header
+        decimals (int): Decimal places
+        prefix (str): Text shown before every number, e.g. a currency symbol
+
+    Returns:
+        Tuple[pd.Series, dict]: Values to display and their column config
+    """
+    number_format = number_column_format(decimals, prefix)
+    if number_format is not None:
+        return values, st.column_config.NumberColumn(label, format=number_format)
+
+    formatted = pd.Series(format_numbers(values, decimals, prefix=prefix), index=values.index, name=values.name)
+    return formatted, st.column_config.TextColumn(label, alignment="right")
@@ -3,6 +3,30 @@ Utility functions for input validation.
 Ensures data integrity and proper error handling.
 """
 
+import math
+import re
+
+# A number with comma thousands separators, e.g. "1,000", "-12,345.67"
+_GROUPED_NUMBER = re.compile(r"^[+-]?\d{1,3}(,\d{3})+(\.\d+)?$")
+
+
+def _parse_number(text: str) -> float:
+    """
+    Parse a stripped amount, reading commas as thousands separators.
+    
+    Args:
+        text (str): Amount text such as "1,000" or "-12.5"
+        
+    Returns:
+        float: The parsed number
+        
+    Raises:
+        ValueError: If text is not a number, e.g. misplaced commas as in "1,00"
+    """
+    if _GROUPED_NUMBER.match(text):
+        text = text.replace(",", "")
+    return float(text)
+
 
 def validate_amount(amount: str) -> tuple[bool, float, str]:
     """
@@ -22,7 +46,11 @@ def validate_amount(amount: str) -> tuple[bool, float, str]:
             return False, 0, "Amount cannot be empty"
         
         # Convert to float
-        amount_float = float(amount)
+        amount_float = _parse_number(amount)
+        
+        # "nan" and "inf" parse, but cannot be converted or sent as JSON
+        if not math.isfinite(amount_float):
+            return False, 0, "Please enter a valid number"
         
         if amount_float < 0:
             return False, 0, "Amount cannot be negative"
@@ -39,6 +67,62 @@ def validate_amount(amount: str) -> tuple[bool, float, str]:
         return False, 0, "Please enter a valid number"
 
 
+def validate_signed_amount(amount: str) -> tuple[bool, float, str]:
+    """
+    Validate a ledger amount, which may be zero or negative (e.g. a refund).
+    
+    Args:
+        amount (str): Amount string to validate
+        
+    Returns:
+        tuple: (is_valid, amount_float, error_message)
+    """
+    try:
+        amount = amount.strip()
+        
+        if not amount:
+            return False, 0, "Amount cannot be empty"
+        
+        amount_float = _parse_number(amount)
+        
+        if not math.isfinite(amount_float):
+            return False, 0, "Please enter a valid number"
+        
+        if abs(amount_float) > 1e12:  # Same bound as validate_amount
+            return False, 0, "Amount is too large"
+        
+        return True, amount_float, ""
+        
+    except ValueError:
+        return False, 0, "Please enter a valid number"
+
+
+def validate_amounts(amounts: str) -> tuple[bool, list[float], str]:
+    """
+    Validate several currency amounts entered at once.
+    
+    Args:
+        amounts (str): Amounts separated by semicolons or new lines; commas
+            are read as thousands separators, e.g. "1,000"
+        
+    Returns:
+        tuple: (is_valid, amount_floats, error_message)
+    """
+    entries = [entry for entry in amounts.replace(";", "\n").splitlines() if entry.strip()]
+    
+    if not entries:
+        return False, [], "Amount cannot be empty"
+    
+    parsed = []
+    for entry in entries:
+        is_valid, amount_float, error_message = validate_amount(entry)
+        if not is_valid:
+            return False, [], f"'{entry.strip()}': {error_message}"
+        parsed.append(amount_float)
+    
+    return True, parsed, ""
+
+
 def validate_currency_code(code: str, available_currencies: list) -> tuple[bool, str]:
     """
     Validate currency code.
@@ -74,6 +158,9 @@ def validate_exchange_rate_response(response: dict) -> tuple[bool, str]:
     if not response:
         return False, "Empty response from API"
     
+    if not isinstance(response, dict):
+        return False, "Invalid API response structure"
+    
     if "base" not in response or "rates" not in response:
         return False, "Invalid API response structure"
     